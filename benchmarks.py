@@ -0,0 +1,683 @@
+"""
+Benchmarks de Performance
+Global Solution 2025 - Dynamic Programming
+
+Mede o tempo dos solvers em instâncias grandes, sem interação.
+
+Uso:
+    python benchmarks.py numpy --n 1000 --capacidade 100000
+    python benchmarks.py incremental --n 200 --capacidade 2000 --eventos 1000
+    python benchmarks.py paralelo --n 200 --capacidade 10000000 --workers 32
+    python benchmarks.py multirecurso --n 100 200 500 --recursos 2 3
+    python benchmarks.py suite --n 50 200 --saida base.json
+    python benchmarks.py comparar base.json novo.json --tolerancia 0.2
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import portfolio_optimization
+from portfolio_optimization import (
+    _linha_dp,
+    _dtype_numpy,
+    _valor_proporcional,
+    dp_bottom_up_portfolio,
+    dp_hirschberg_portfolio,
+    greedy_multidimensional_portfolio,
+    multidimensional_portfolio,
+    PortfolioIncremental,
+    SOLVERS,
+    LIMITE_PROJETOS_MEET_IN_THE_MIDDLE
+)
+from parallel_portfolio import dp_paralela_portfolio
+
+
+def gerar_projetos(n, valor_max=1000, custo_max=1000, semente=0):
+    """
+    Gera n projetos aleatórios (nome, valor, custo) de forma reprodutível.
+    """
+    gerador = random.Random(semente)
+    return [
+        (f"P{i}", gerador.randint(1, valor_max), gerador.randint(1, custo_max))
+        for i in range(n)
+    ]
+
+
+def cronometrar(funcao, repeticoes=3):
+    """
+    Executa funcao() `repeticoes` vezes e retorna (menor tempo, resultado).
+    """
+    melhor = float("inf")
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def benchmark_backend_numpy(n, capacidade, repeticoes=1, semente=0):
+    """
+    Compara o backend Python puro com o backend NumPy.
+
+    Mede a atualização de linhas (_linha_dp, o caminho quente de todas as
+    DPs) e a solução completa com reconstrução via dp_hirschberg_portfolio,
+    que mantém a memória em O(n + C) mesmo com 10^8 a 10^9 células.
+
+    Returns:
+        Dicionário com os tempos e o speedup de cada etapa
+    """
+    if portfolio_optimization.np is None:
+        raise RuntimeError("NumPy não está instalado")
+
+    projetos = gerar_projetos(n, custo_max=max(1, capacidade // 10), semente=semente)
+    dtype = _dtype_numpy(projetos, "numpy")
+
+    print(f"n={n}, C={capacidade}, células={n * (capacidade + 1):.2e}, "
+          f"dtype={dtype.__name__}")
+
+    t_linha_py, linha_py = cronometrar(lambda: _linha_dp(projetos, capacidade), repeticoes)
+    t_linha_np, linha_np = cronometrar(lambda: _linha_dp(projetos, capacidade, dtype), repeticoes)
+    assert linha_py == linha_np.tolist(), "Backends divergiram!"
+
+    t_total_py, res_py = cronometrar(
+        lambda: dp_hirschberg_portfolio(projetos, capacidade), repeticoes)
+    t_total_np, res_np = cronometrar(
+        lambda: dp_hirschberg_portfolio(projetos, capacidade, backend="numpy"), repeticoes)
+    assert res_py[0] == res_np[0], "Backends divergiram!"
+
+    resultados = {
+        "linha_python": t_linha_py,
+        "linha_numpy": t_linha_np,
+        "speedup_linha": t_linha_py / t_linha_np,
+        "total_python": t_total_py,
+        "total_numpy": t_total_np,
+        "speedup_total": t_total_py / t_total_np,
+    }
+
+    print(f"{'Etapa':<20} {'Python':>10} {'NumPy':>10} {'Speedup':>10}")
+    print("-" * 53)
+    print(f"{'Linha final':<20} {t_linha_py:>9.2f}s {t_linha_np:>9.2f}s "
+          f"{resultados['speedup_linha']:>9.1f}x")
+    print(f"{'Hirschberg':<20} {t_total_py:>9.2f}s {t_total_np:>9.2f}s "
+          f"{resultados['speedup_total']:>9.1f}x")
+
+    return resultados
+
+
+def gerar_eventos(n_inicial, eventos, custo_max, semente=0, fracao_antigos=0.5):
+    """
+    Gera uma sequência reprodutível de eventos de adição e remoção.
+
+    Metade dos eventos remove um projeto. Dessas remoções, uma fração
+    `fracao_antigos` tira o projeto ativo mais antigo (janela deslizante:
+    o caso caro para quem recalcula as linhas depois do removido) e o
+    resto tira um projeto ao acaso.
+
+    Returns:
+        Tupla (projetos_iniciais, eventos), com eventos ("+", projeto) ou
+        ("-", nome)
+    """
+    gerador = random.Random(semente)
+    iniciais = gerar_projetos(n_inicial, custo_max=custo_max, semente=semente)
+    ativos = [nome for nome, _, _ in iniciais]
+    sequencia = []
+    for k in range(eventos):
+        if ativos and gerador.random() < 0.5:
+            posicao = 0 if gerador.random() < fracao_antigos else gerador.randrange(len(ativos))
+            nome = ativos.pop(posicao)
+            sequencia.append(("-", nome))
+        else:
+            projeto = (f"N{k}", gerador.randint(1, 1000), gerador.randint(1, custo_max))
+            ativos.append(projeto[0])
+            sequencia.append(("+", projeto))
+    return iniciais, sequencia
+
+
+def benchmark_incremental(n, capacidade, eventos=1000, backend="python", semente=0,
+                          fracao_antigos=0.5):
+    """
+    Compara PortfolioIncremental com resolver do zero a cada evento.
+
+    Aplica a mesma sequência de `eventos` adições/remoções nos dois lados
+    (com remoções do mais antigo, ver gerar_eventos) e confere que o ótimo
+    coincide após cada evento.
+
+    Returns:
+        Dicionário com os tempos totais, o speedup e as linhas de DP
+        calculadas por cada lado
+    """
+    iniciais, sequencia = gerar_eventos(n, eventos, max(1, capacidade // 10), semente,
+                                        fracao_antigos)
+    print(f"n inicial={n}, C={capacidade}, eventos={eventos}, backend={backend}, "
+          f"remoções do mais antigo={fracao_antigos:.0%}")
+
+    # Do zero: uma solução completa por evento
+    inicio = time.perf_counter()
+    ativos = list(iniciais)
+    otimos_zero = []
+    linhas_zero = 0
+    for tipo, dado in sequencia:
+        if tipo == "+":
+            ativos.append(dado)
+        else:
+            ativos = [p for p in ativos if p[0] != dado]
+        valor, _ = dp_bottom_up_portfolio(ativos, capacidade, backend=backend, modo="bits")
+        otimos_zero.append(valor)
+        linhas_zero += len(ativos)
+    t_zero = time.perf_counter() - inicio
+
+    # Incremental: a construção inicial entra na conta
+    inicio = time.perf_counter()
+    carteira = PortfolioIncremental(capacidade, iniciais, backend=backend)
+    otimos_incrementais = []
+    for tipo, dado in sequencia:
+        if tipo == "+":
+            carteira.adicionar(dado)
+        else:
+            carteira.remover(dado)
+        otimos_incrementais.append(carteira.melhor_valor(capacidade))
+    t_incremental = time.perf_counter() - inicio
+
+    assert otimos_zero == otimos_incrementais, "Incremental divergiu!"
+
+    resultados = {
+        "do_zero": t_zero,
+        "incremental": t_incremental,
+        "speedup": t_zero / t_incremental,
+        "linhas_do_zero": linhas_zero,
+        "linhas_incremental": carteira.linhas_calculadas,
+    }
+    print(f"Do zero:     {t_zero:>9.2f}s {linhas_zero:>10} linhas")
+    print(f"Incremental: {t_incremental:>9.2f}s {carteira.linhas_calculadas:>10} linhas "
+          f"({resultados['speedup']:.1f}x)")
+    return resultados
+
+
+def benchmark_paralelo(n, capacidade, max_workers=None, reconstruir=False, semente=0):
+    """
+    Escalabilidade da DP paralela de 1 até max_workers processos.
+
+    Os números de workers testados dobram (1, 2, 4, ...) e sempre incluem
+    max_workers. Confere que todos os resultados coincidem.
+
+    Returns:
+        Dicionário {workers: (tempo, speedup em relação a 1 worker)}
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    projetos = gerar_projetos(n, custo_max=max(1, capacidade // 10), semente=semente)
+
+    contagens = []
+    k = 1
+    while k < max_workers:
+        contagens.append(k)
+        k *= 2
+    contagens.append(max_workers)
+
+    print(f"n={n}, C={capacidade}, células={n * (capacidade + 1):.2e}, "
+          f"NumPy={'sim' if portfolio_optimization.np is not None else 'não'}")
+    print(f"{'Workers':>8} {'Tempo':>10} {'Speedup':>9} {'Eficiência':>11}")
+    print("-" * 41)
+
+    resultados = {}
+    referencia = None
+    for workers in contagens:
+        tempo, resultado = cronometrar(
+            lambda: dp_paralela_portfolio(projetos, capacidade, workers, reconstruir), 1)
+        if referencia is None:
+            referencia = (tempo, resultado)
+        assert resultado == referencia[1], "Resultados divergiram!"
+        speedup = referencia[0] / tempo
+        resultados[workers] = (tempo, speedup)
+        print(f"{workers:>8} {tempo:>9.2f}s {speedup:>8.2f}x {speedup / workers:>10.0%}")
+
+    return resultados
+
+
+def gerar_projetos_multirecurso(n, recursos=3, correlacionadas=False, semente=0):
+    """
+    Projetos com custos (horas, orçamento, pessoas), nesta ordem, e
+    capacidades iguais a 1/4 da soma de cada recurso.
+
+    Com correlacionadas=True o valor acompanha os custos (mais um ruído
+    pequeno), o caso difícil para a poda por limitante.
+
+    Returns:
+        Tupla (projetos, capacidades), com `recursos` custos por projeto
+    """
+    gerador = random.Random(f"multirecurso:{n}:{recursos}:{correlacionadas}:{semente}")
+    projetos = []
+    for i in range(n):
+        horas = gerador.randint(10, 200)
+        orcamento = gerador.randint(1000, 100_000)
+        pessoas = gerador.randint(1, 5)
+        if correlacionadas:
+            valor = horas + orcamento // 500 + 20 * pessoas + gerador.randint(0, 30)
+        else:
+            valor = gerador.randint(10, 1000)
+        projetos.append((f"P{i}", valor, (horas, orcamento, pessoas)[:recursos]))
+    capacidades = tuple(sum(p[2][r] for p in projetos) // 4 for r in range(recursos))
+    return projetos, capacidades
+
+
+def benchmark_multirecurso(tamanhos=(100, 200, 500), recursos=(2, 3),
+                           correlacionadas=False, semente=0):
+    """
+    Tempo e estados do multidimensional_portfolio, comparado com o guloso.
+
+    Returns:
+        Dicionário {(recursos, n): (tempo, valor, valor_guloso, estados_maximo)}
+    """
+    print(f"{'Recursos':>8} {'n':>6} {'Tempo':>9} {'Ótimo':>9} {'Guloso':>9} {'Estados':>9}")
+    print("-" * 55)
+
+    resultados = {}
+    for d in recursos:
+        for n in tamanhos:
+            projetos, capacidades = gerar_projetos_multirecurso(n, d, correlacionadas, semente)
+            estatisticas = {}
+            inicio = time.perf_counter()
+            valor, _ = multidimensional_portfolio(projetos, capacidades, estatisticas)
+            tempo = time.perf_counter() - inicio
+            guloso, _, _ = greedy_multidimensional_portfolio(projetos, capacidades)
+            assert guloso <= valor, "Guloso acima do ótimo!"
+            resultados[(d, n)] = (tempo, valor, guloso, estatisticas["estados_maximo"])
+            print(f"{d:>8} {n:>6} {tempo:>8.3f}s {valor:>9} {guloso:>9} "
+                  f"{estatisticas['estados_maximo']:>9}")
+
+    return resultados
+
+
+# ==============================================================================
+# SUÍTE: FAMÍLIAS CLÁSSICAS DE INSTÂNCIAS
+# ==============================================================================
+# Famílias de Pisinger ("Where are the hard knapsack problems?", 2005). R é o
+# custo máximo; quanto maior a correlação entre valor e custo, mais difícil a
+# instância para os métodos baseados em limites (branch-and-bound, core).
+
+def _nao_correlacionadas(n, r, gerador):
+    return [(gerador.randint(1, r), gerador.randint(1, r)) for _ in range(n)]
+
+
+def _fracamente_correlacionadas(n, r, gerador):
+    pares = []
+    for _ in range(n):
+        custo = gerador.randint(1, r)
+        valor = gerador.randint(max(1, custo - r // 10), custo + r // 10)
+        pares.append((valor, custo))
+    return pares
+
+
+def _fortemente_correlacionadas(n, r, gerador):
+    pares = []
+    for _ in range(n):
+        custo = gerador.randint(1, r)
+        pares.append((custo + r // 10, custo))
+    return pares
+
+
+def _inversamente_correlacionadas(n, r, gerador):
+    pares = []
+    for _ in range(n):
+        valor = gerador.randint(1, r)
+        pares.append((valor, valor + r // 10))
+    return pares
+
+
+def _soma_de_subconjuntos(n, r, gerador):
+    pares = []
+    for _ in range(n):
+        custo = gerador.randint(1, r)
+        pares.append((custo, custo))
+    return pares
+
+
+def _spanner(n, r, gerador, v=2, m=10):
+    """
+    spanner(v, m): v itens-base fortemente correlacionados, com custos
+    reduzidos por 2/m, e cada projeto é um múltiplo (1..m) de um item-base.
+    """
+    base = []
+    for valor, custo in _fortemente_correlacionadas(v, r, gerador):
+        base.append((math.ceil(2 * valor / m), math.ceil(2 * custo / m)))
+    pares = []
+    for _ in range(n):
+        valor, custo = gerador.choice(base)
+        a = gerador.randint(1, m)
+        pares.append((a * valor, a * custo))
+    return pares
+
+
+FAMILIAS = {
+    "nao_correlacionadas": _nao_correlacionadas,
+    "fracamente_correlacionadas": _fracamente_correlacionadas,
+    "fortemente_correlacionadas": _fortemente_correlacionadas,
+    "inversamente_correlacionadas": _inversamente_correlacionadas,
+    "soma_de_subconjuntos": _soma_de_subconjuntos,
+    "spanner": _spanner,
+}
+
+# Solvers cujo custo cresce com n × C (tabela, linhas ou fronteira)
+SOLVERS_POR_CELULAS = ("dp_bottom_up", "hirschberg", "memoizado_iterativo", "pareto")
+
+
+def gerar_familia(familia, n, custo_max=1000, capacidade=None, semente=0):
+    """
+    Gera uma instância reprodutível de uma das famílias clássicas.
+
+    Args:
+        familia: Chave de FAMILIAS
+        n: Número de projetos
+        custo_max: Custo máximo R dos projetos
+        capacidade: Capacidade; None usa metade da soma dos custos
+        semente: Semente do gerador
+
+    Returns:
+        Tupla (projetos, capacidade)
+    """
+    if familia not in FAMILIAS:
+        raise ValueError(f"Família desconhecida: {familia!r}")
+    gerador = random.Random(f"{familia}:{n}:{custo_max}:{semente}")
+    pares = FAMILIAS[familia](n, custo_max, gerador)
+    projetos = [(f"P{i}", valor, custo) for i, (valor, custo) in enumerate(pares)]
+    if capacidade is None:
+        capacidade = sum(custo for _, _, custo in projetos) // 2
+    return projetos, capacidade
+
+
+def _motivo_para_pular(solver, projetos, capacidade, limite_celulas):
+    """
+    Retorna o motivo para não rodar o solver nesta instância, ou None.
+    """
+    n = len(projetos)
+    if solver == "meet_in_the_middle" and n > LIMITE_PROJETOS_MEET_IN_THE_MIDDLE:
+        return f"n > {LIMITE_PROJETOS_MEET_IN_THE_MIDDLE}"
+    if solver == "bitset" and not _valor_proporcional(projetos, capacidade):
+        return "valor não proporcional ao custo"
+    if solver in SOLVERS_POR_CELULAS and n * (capacidade + 1) > limite_celulas:
+        return f"n × C > {limite_celulas}"
+    if solver == "dp_por_valor":
+        soma_valores = sum(max(0, valor) for _, valor, _ in projetos)
+        if n * (soma_valores + 1) > limite_celulas:
+            return f"n × V > {limite_celulas}"
+    return None
+
+
+def medir_solver(funcao, aquecimento=1, repeticoes=3, memoria=True):
+    """
+    Mede tempo (perf_counter) e pico de memória (tracemalloc) de funcao().
+
+    O pico é medido numa execução separada, para que o custo do
+    tracemalloc não entre nos tempos.
+
+    Returns:
+        Dicionário com resultado, tempos, tempo_min, tempo_mediana e
+        memoria_pico_bytes (None se memoria=False)
+    """
+    for _ in range(aquecimento):
+        funcao()
+
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        try:
+            funcao()
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "resultado": resultado,
+        "tempos": tempos,
+        "tempo_min": min(tempos),
+        "tempo_mediana": statistics.median(tempos),
+        "memoria_pico_bytes": pico,
+    }
+
+
+def _metadados():
+    numpy = portfolio_optimization.np
+    return {
+        "python": platform.python_version(),
+        "numpy": numpy.__version__ if numpy is not None else None,
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def executar_suite(familias=None, tamanhos=(50, 200), capacidade=None, custo_max=1000,
+                   solvers=None, aquecimento=1, repeticoes=3, memoria=True,
+                   limite_celulas=5_000_000, limite_nos_bb=200_000, semente=0):
+    """
+    Roda cada solver em cada família e tamanho, sem interação.
+
+    Os valores de todos os solvers são conferidos contra o primeiro que
+    rodou na instância; uma divergência vira AssertionError.
+
+    Args:
+        familias: Chaves de FAMILIAS (None = todas)
+        tamanhos: Valores de n a testar
+        capacidade: Capacidade fixa; None usa metade da soma dos custos
+        custo_max: Custo máximo R dos projetos
+        solvers: Chaves de SOLVERS (None = todos)
+        aquecimento: Execuções descartadas antes da medição
+        repeticoes: Execuções cronometradas
+        memoria: Mede o pico de memória com tracemalloc
+        limite_celulas: Pula solvers O(n × C) ou O(n × V) acima deste tamanho
+        limite_nos_bb: Limite de nós do branch-and-bound; se for atingido, o
+            valor não é conferido e a linha leva "otimo_provado": False
+
+    Returns:
+        Dicionário serializável em JSON com metadados, parâmetros e resultados
+    """
+    familias = list(familias or FAMILIAS)
+    solvers = list(solvers or SOLVERS)
+    for solver in solvers:
+        if solver not in SOLVERS:
+            raise ValueError(f"Solver desconhecido: {solver!r}")
+
+    resultados = []
+    for familia in familias:
+        for n in tamanhos:
+            projetos, c = gerar_familia(familia, n, custo_max, capacidade, semente)
+            referencia = None
+            for solver in solvers:
+                linha = {"familia": familia, "n": n, "capacidade": c, "solver": solver}
+                motivo = _motivo_para_pular(solver, projetos, c, limite_celulas)
+                if motivo is not None:
+                    linha["pulado"] = motivo
+                    resultados.append(linha)
+                    print(f"{familia:<29} n={n:<6} {solver:<20} pulado ({motivo})")
+                    continue
+
+                extras = {}
+                if solver == "branch_and_bound":
+                    # Famílias correlacionadas (spanner) são exponenciais para B&B
+                    extras = {"limite_nos": limite_nos_bb, "estatisticas": {}}
+                medida = medir_solver(lambda: SOLVERS[solver](projetos, c, **extras),
+                                      aquecimento, repeticoes, memoria)
+                valor = medida.pop("resultado")[0]
+                provado = extras.get("estatisticas", {}).get("otimo_provado", True)
+                if not provado:
+                    linha["otimo_provado"] = False
+                elif referencia is None:
+                    referencia = (solver, valor)
+                assert not provado or valor == referencia[1], (
+                    f"{solver} divergiu de {referencia[0]} em {familia}, n={n}: "
+                    f"{valor} != {referencia[1]}")
+
+                linha["valor"] = valor
+                linha.update(medida)
+                resultados.append(linha)
+                pico = medida["memoria_pico_bytes"]
+                print(f"{familia:<29} n={n:<6} {solver:<20} "
+                      f"{medida['tempo_min']:>10.4f}s "
+                      f"{'' if pico is None else f'{pico / 2**20:>9.2f} MiB'}"
+                      f"{'' if provado else '  (ótimo não provado)'}")
+
+    return {
+        "metadados": _metadados(),
+        "parametros": {
+            "familias": familias,
+            "tamanhos": list(tamanhos),
+            "capacidade": capacidade,
+            "custo_max": custo_max,
+            "solvers": solvers,
+            "aquecimento": aquecimento,
+            "repeticoes": repeticoes,
+            "limite_celulas": limite_celulas,
+            "limite_nos_bb": limite_nos_bb,
+            "semente": semente,
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar_resultados(base, novo, tolerancia=0.2):
+    """
+    Compara duas execuções da suíte e aponta regressões.
+
+    Uma regressão é um valor diferente ou um tempo mínimo (ou pico de
+    memória) maior que (1 + tolerancia) vezes o da base.
+
+    Args:
+        base, novo: Dicionários retornados por executar_suite (ou lidos do JSON)
+        tolerancia: Aumento relativo aceito antes de acusar regressão
+
+    Returns:
+        Lista de strings descrevendo as regressões (vazia se não houver)
+    """
+    def indexar(dados):
+        return {
+            (r["familia"], r["n"], r["capacidade"], r["solver"]): r
+            for r in dados["resultados"] if "pulado" not in r
+        }
+
+    antigos = indexar(base)
+    regressoes = []
+    print(f"{'Família':<29} {'n':>6} {'Solver':<20} {'Base':>10} {'Novo':>10} {'Razão':>7}")
+    print("-" * 87)
+    for chave, atual in sorted(indexar(novo).items()):
+        anterior = antigos.get(chave)
+        if anterior is None:
+            continue
+        familia, n, _, solver = chave
+        razao = atual["tempo_min"] / anterior["tempo_min"] if anterior["tempo_min"] else 1.0
+        marca = ""
+        if atual["valor"] != anterior["valor"]:
+            regressoes.append(f"{familia} n={n} {solver}: valor "
+                              f"{anterior['valor']} -> {atual['valor']}")
+            marca = "  VALOR"
+        elif razao > 1 + tolerancia:
+            regressoes.append(f"{familia} n={n} {solver}: tempo {razao:.2f}x")
+            marca = "  LENTO"
+        pico_antes = anterior.get("memoria_pico_bytes")
+        pico_agora = atual.get("memoria_pico_bytes")
+        if pico_antes and pico_agora and pico_agora > (1 + tolerancia) * pico_antes:
+            regressoes.append(f"{familia} n={n} {solver}: memória "
+                              f"{pico_agora / pico_antes:.2f}x")
+            marca += "  MEMÓRIA"
+        print(f"{familia:<29} {n:>6} {solver:<20} {anterior['tempo_min']:>9.4f}s "
+              f"{atual['tempo_min']:>9.4f}s {razao:>6.2f}x{marca}")
+
+    print(f"\n{len(regressoes)} regressão(ões) com tolerância de {tolerancia:.0%}")
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do portfólio")
+    sub = parser.add_subparsers(dest="benchmark", required=True)
+
+    p_numpy = sub.add_parser("numpy", help="Python puro vs NumPy")
+    p_numpy.add_argument("--n", type=int, default=1000)
+    p_numpy.add_argument("--capacidade", type=int, default=100_000)
+    p_numpy.add_argument("--repeticoes", type=int, default=1)
+
+    p_inc = sub.add_parser("incremental", help="Incremental vs resolver do zero")
+    p_inc.add_argument("--n", type=int, default=200)
+    p_inc.add_argument("--capacidade", type=int, default=2000)
+    p_inc.add_argument("--eventos", type=int, default=1000)
+    p_inc.add_argument("--backend", choices=("python", "numpy"), default="python")
+    p_inc.add_argument("--antigos", type=float, default=0.5,
+                       help="Fração das remoções que tira o projeto mais antigo")
+
+    p_par = sub.add_parser("paralelo", help="Escalabilidade da DP paralela")
+    p_par.add_argument("--n", type=int, default=200)
+    p_par.add_argument("--capacidade", type=int, default=10_000_000)
+    p_par.add_argument("--workers", type=int, default=None)
+    p_par.add_argument("--reconstruir", action="store_true")
+
+    p_multi = sub.add_parser("multirecurso", help="Vários recursos (horas, orçamento, pessoas)")
+    p_multi.add_argument("--n", type=int, nargs="+", default=[100, 200, 500])
+    p_multi.add_argument("--recursos", type=int, nargs="+", choices=(1, 2, 3), default=[2, 3])
+    p_multi.add_argument("--correlacionadas", action="store_true",
+                         help="Valor acompanha os custos (caso difícil)")
+
+    p_suite = sub.add_parser("suite", help="Todos os solvers nas famílias clássicas")
+    p_suite.add_argument("--familias", nargs="+", choices=sorted(FAMILIAS), default=None)
+    p_suite.add_argument("--n", type=int, nargs="+", default=[50, 200])
+    p_suite.add_argument("--capacidade", type=int, default=None,
+                         help="Padrão: metade da soma dos custos")
+    p_suite.add_argument("--custo-max", type=int, default=1000)
+    p_suite.add_argument("--solvers", nargs="+", choices=sorted(SOLVERS), default=None)
+    p_suite.add_argument("--aquecimento", type=int, default=1)
+    p_suite.add_argument("--repeticoes", type=int, default=3)
+    p_suite.add_argument("--sem-memoria", action="store_true",
+                         help="Não mede o pico de memória")
+    p_suite.add_argument("--limite-celulas", type=int, default=5_000_000)
+    p_suite.add_argument("--limite-nos-bb", type=int, default=200_000)
+    p_suite.add_argument("--semente", type=int, default=0)
+    p_suite.add_argument("--saida", help="Arquivo JSON com os resultados")
+
+    p_comp = sub.add_parser("comparar", help="Compara dois JSONs da suíte")
+    p_comp.add_argument("base")
+    p_comp.add_argument("novo")
+    p_comp.add_argument("--tolerancia", type=float, default=0.2)
+
+    args = parser.parse_args(argv)
+
+    if args.benchmark == "numpy":
+        benchmark_backend_numpy(args.n, args.capacidade, args.repeticoes)
+    elif args.benchmark == "incremental":
+        benchmark_incremental(args.n, args.capacidade, args.eventos, args.backend,
+                              fracao_antigos=args.antigos)
+    elif args.benchmark == "paralelo":
+        benchmark_paralelo(args.n, args.capacidade, args.workers, args.reconstruir)
+    elif args.benchmark == "multirecurso":
+        benchmark_multirecurso(args.n, args.recursos, args.correlacionadas)
+    elif args.benchmark == "suite":
+        dados = executar_suite(args.familias, args.n, args.capacidade, args.custo_max,
+                               args.solvers, args.aquecimento, args.repeticoes,
+                               not args.sem_memoria, args.limite_celulas,
+                               args.limite_nos_bb, args.semente)
+        if args.saida:
+            with open(args.saida, "w", encoding="utf-8") as f:
+                json.dump(dados, f, indent=2, ensure_ascii=False)
+    elif args.benchmark == "comparar":
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.novo, encoding="utf-8") as f:
+            novo = json.load(f)
+        if comparar_resultados(base, novo, args.tolerancia):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""
+Cache de Soluções do Portfólio
+Global Solution 2025 - Dynamic Programming
+
+Evita resolver de novo portfólios idênticos (mesmos projetos, mesma
+capacidade, mesmo solver). A chave é um hash do conteúdo da instância,
+independente da ordem em que os projetos chegam.
+
+Dois níveis:
+1. Memória: LRU com número máximo de itens e, opcionalmente, um teto
+   aproximado em bytes (uma solução ocupa mais quanto mais projetos
+   seleciona, então só contar itens não limita a memória)
+2. Disco (opcional): banco sqlite com número máximo de itens e,
+   opcionalmente, um teto em bytes (chave + resultado em JSON), removendo
+   os acessados há mais tempo
+
+Uso:
+    cache = CachePortfolio(caminho="portfolio_cache.sqlite")
+    valor, selecionados = cache.resolver(projetos, 100, solver="auto")
+    print(cache.estatisticas())
+"""
+
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from collections import OrderedDict
+
+from portfolio_optimization import SOLVERS
+
+
+def _normalizar_numero(numero):
+    """
+    Float inteiro vira int (4.0 -> 4), para o JSON da chave não diferir.
+    """
+    if isinstance(numero, float) and numero.is_integer():
+        return int(numero)
+    return numero
+
+
+def chave_instancia(projetos, capacidade, solver="auto", opcoes=None):
+    """
+    Hash canônico (SHA-256) de uma instância.
+
+    Os projetos são normalizados para [nome, valor, custo] e ordenados,
+    então a mesma lista em qualquer ordem gera a mesma chave. Números
+    inteiros escritos como float (4.0, vindo de um CSV, contra 4 de um
+    JSONL) também geram a mesma chave, nos projetos e na capacidade.
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        solver: Nome do solver (chave de SOLVERS)
+        opcoes: Dicionário opcional de argumentos extras do solver
+
+    Returns:
+        String hexadecimal com 64 caracteres
+    """
+    normalizados = sorted(
+        json.dumps([nome, _normalizar_numero(valor), _normalizar_numero(custo)])
+        for nome, valor, custo in projetos
+    )
+    conteudo = json.dumps(
+        {
+            "projetos": normalizados,
+            "capacidade": _normalizar_numero(capacidade),
+            "solver": solver,
+            "opcoes": opcoes or {},
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
+
+
+# Bytes de uma linha do nível de disco: a chave mais o resultado em JSON
+_BYTES_LINHA = "LENGTH(CAST(chave AS BLOB)) + LENGTH(CAST(resultado AS BLOB))"
+
+
+def _tamanho_aproximado(resultado):
+    """
+    Bytes aproximados de uma solução (valor, seleção) guardada em memória.
+
+    Conta a tupla, o valor e cada nome selecionado; não desconta strings
+    compartilhadas com outras soluções, então é um teto.
+    """
+    valor, selecionados = resultado
+    return (sys.getsizeof(resultado) + sys.getsizeof(valor) + sys.getsizeof(selecionados)
+            + sum(sys.getsizeof(nome) for nome in selecionados))
+
+
+class CachePortfolio:
+    """
+    Cache em dois níveis (memória LRU + sqlite opcional) na frente dos solvers.
+
+    Como a chave ignora a ordem dos projetos, uma consulta pode devolver a
+    seleção calculada para outra ordem da mesma lista; o valor é sempre o
+    mesmo, e a seleção é uma solução ótima da instância.
+
+    As soluções ficam guardadas como (valor, tupla de nomes) e cada
+    consulta devolve uma lista nova: alterar o retorno não altera o cache.
+
+    max_itens e max_itens_disco contam SOLUÇÕES, não bytes: uma solução
+    com milhares de projetos selecionados conta como uma só. Para limitar
+    a memória de fato, use max_bytes (teto aproximado, ver
+    _tamanho_aproximado), e para limitar o banco, max_bytes_disco (bytes
+    da chave mais os do resultado em JSON). Em cada nível, os dois
+    limites valem juntos.
+    """
+
+    def __init__(self, max_itens=1024, caminho=None, max_itens_disco=100_000,
+                 max_bytes=None, max_bytes_disco=None):
+        """
+        Args:
+            max_itens: Máximo de soluções no nível de memória
+            caminho: Arquivo sqlite do nível de disco (None = sem disco)
+            max_itens_disco: Máximo de soluções no nível de disco
+            max_bytes: Teto aproximado, em bytes, do nível de memória
+                (None = só o limite de itens)
+            max_bytes_disco: Teto, em bytes, das soluções no nível de
+                disco (None = só o limite de itens)
+        """
+        self.max_itens = max_itens
+        self.max_itens_disco = max_itens_disco
+        self.max_bytes = max_bytes
+        self.max_bytes_disco = max_bytes_disco
+        self._memoria = OrderedDict()
+        self._bytes_memoria = 0
+        self._contadores = {
+            "acertos_memoria": 0,
+            "acertos_disco": 0,
+            "falhas": 0,
+            "remocoes_memoria": 0,
+            "remocoes_disco": 0,
+        }
+
+        self._banco = None
+        if caminho is not None:
+            self._banco = sqlite3.connect(caminho)
+            self._banco.execute(
+                "CREATE TABLE IF NOT EXISTS solucoes ("
+                " chave TEXT PRIMARY KEY,"
+                " resultado TEXT NOT NULL,"
+                " acesso REAL NOT NULL)"
+            )
+            self._banco.execute(
+                "CREATE INDEX IF NOT EXISTS idx_acesso ON solucoes (acesso)")
+            self._banco.commit()
+
+    def resolver(self, projetos, capacidade, solver="auto", **opcoes):
+        """
+        Retorna a solução do cache ou resolve e guarda.
+
+        Args:
+            projetos: Lista de tuplas (nome, valor, custo)
+            capacidade: Capacidade máxima de Horas-Especialista
+            solver: Nome do solver (chave de SOLVERS)
+            **opcoes: Argumentos extras repassados ao solver; entram na
+                chave, então só valem opções que mudam o resultado
+
+        Returns:
+            O mesmo retorno do solver: (valor_maximo, projetos_selecionados)
+
+        Raises:
+            ValueError: Solver desconhecido, ou `estatisticas` em opcoes (é
+                saída do solver, não entrada: num acerto do cache nunca
+                seria preenchido, e um dicionário do chamador mudaria a
+                chave)
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Solver desconhecido: {solver!r}")
+        if "estatisticas" in opcoes:
+            raise ValueError("estatisticas não passa pelo cache: use instrumentar ou "
+                             "chame o solver diretamente")
+
+        chave = chave_instancia(projetos, capacidade, solver, opcoes)
+        resultado = self.obter(chave)
+        if resultado is None:
+            self._contadores["falhas"] += 1
+            valor, selecionados = SOLVERS[solver](projetos, capacidade, **opcoes)
+            self.guardar(chave, (valor, selecionados))
+            resultado = (valor, list(selecionados))
+        return resultado
+
+    def obter(self, chave):
+        """
+        Busca a chave na memória e depois no disco; None se não existir.
+
+        Devolve (valor, lista de nomes) com uma lista nova a cada chamada.
+        """
+        guardado = self._memoria.get(chave)
+        if guardado is not None:
+            self._memoria.move_to_end(chave)
+            self._contadores["acertos_memoria"] += 1
+            valor, selecionados = guardado
+            return (valor, list(selecionados))
+
+        if self._banco is not None:
+            linha = self._banco.execute(
+                "SELECT resultado FROM solucoes WHERE chave = ?", (chave,)
+            ).fetchone()
+            if linha is not None:
+                self._banco.execute(
+                    "UPDATE solucoes SET acesso = ? WHERE chave = ?",
+                    (time.time(), chave))
+                self._banco.commit()
+                self._contadores["acertos_disco"] += 1
+                valor, selecionados = json.loads(linha[0])
+                self._guardar_memoria(chave, (valor, selecionados))
+                return (valor, selecionados)
+
+        return None
+
+    def guardar(self, chave, resultado):
+        """
+        Guarda uma solução nos dois níveis.
+        """
+        self._guardar_memoria(chave, resultado)
+
+        if self._banco is not None:
+            self._banco.execute(
+                "INSERT OR REPLACE INTO solucoes (chave, resultado, acesso) "
+                "VALUES (?, ?, ?)",
+                (chave, json.dumps(resultado), time.time()))
+            total = self._banco.execute("SELECT COUNT(*) FROM solucoes").fetchone()[0]
+            excesso = total - self.max_itens_disco
+            if excesso > 0:
+                self._banco.execute(
+                    "DELETE FROM solucoes WHERE chave IN ("
+                    " SELECT chave FROM solucoes ORDER BY acesso LIMIT ?)",
+                    (excesso,))
+                self._contadores["remocoes_disco"] += excesso
+            if self.max_bytes_disco is not None:
+                # Mantém as mais recentes enquanto a soma acumulada couber
+                removidas = self._banco.execute(
+                    "DELETE FROM solucoes WHERE chave IN ("
+                    " SELECT chave FROM ("
+                    "  SELECT chave, SUM(" + _BYTES_LINHA + ") OVER ("
+                    "   ORDER BY acesso DESC, chave) AS acumulado FROM solucoes)"
+                    " WHERE acumulado > ?)",
+                    (self.max_bytes_disco,)).rowcount
+                self._contadores["remocoes_disco"] += removidas
+            self._banco.commit()
+
+    def _guardar_memoria(self, chave, resultado):
+        valor, selecionados = resultado
+        guardado = (valor, tuple(selecionados))
+        if chave in self._memoria:
+            self._bytes_memoria -= _tamanho_aproximado(self._memoria[chave])
+        self._memoria[chave] = guardado
+        self._memoria.move_to_end(chave)
+        self._bytes_memoria += _tamanho_aproximado(guardado)
+        # Uma solução maior que max_bytes sozinha também sai
+        while self._memoria and (
+                len(self._memoria) > self.max_itens
+                or (self.max_bytes is not None and self._bytes_memoria > self.max_bytes)):
+            _, removido = self._memoria.popitem(last=False)
+            self._bytes_memoria -= _tamanho_aproximado(removido)
+            self._contadores["remocoes_memoria"] += 1
+
+    def estatisticas(self):
+        """
+        Contadores de acertos, falhas e remoções, mais a taxa de acerto.
+        """
+        dados = dict(self._contadores)
+        acertos = dados["acertos_memoria"] + dados["acertos_disco"]
+        consultas = acertos + dados["falhas"]
+        dados["taxa_acerto"] = acertos / consultas if consultas else 0.0
+        dados["itens_memoria"] = len(self._memoria)
+        dados["bytes_memoria"] = self._bytes_memoria
+        if self._banco is not None:
+            dados["itens_disco"], dados["bytes_disco"] = self._banco.execute(
+                "SELECT COUNT(*), COALESCE(SUM(" + _BYTES_LINHA + "), 0) FROM solucoes"
+            ).fetchone()
+        return dados
+
+    def limpar(self):
+        """
+        Esvazia os dois níveis (os contadores são mantidos).
+        """
+        self._memoria.clear()
+        self._bytes_memoria = 0
+        if self._banco is not None:
+            self._banco.execute("DELETE FROM solucoes")
+            self._banco.commit()
+
+    def fechar(self):
+        """
+        Fecha a conexão com o banco do nível de disco.
+        """
+        if self._banco is not None:
+            self._banco.close()
+            self._banco = None
@@ -0,0 +1,442 @@
+"""
+Programação Dinâmica Paralela (Multi-core)
+Global Solution 2025 - Dynamic Programming
+
+Cada linha da tabela do bottom-up depende apenas da linha anterior, então
+o eixo da capacidade pode ser dividido entre processos: cada um calcula a
+sua faixa de colunas da linha i, todos esperam numa barreira, e a linha i
+passa a ser a "anterior" da linha i + 1.
+
+As duas linhas de valores e a matriz de bits de decisão ficam em
+multiprocessing.shared_memory, visíveis para todos os processos sem cópia.
+
+Também oferece resolver_lote, que distribui milhares de instâncias
+independentes (uma por cliente) entre processos.
+
+Uso:
+    valor, selecionados = dp_paralela_portfolio(projetos, 10_000_000, workers=8)
+
+    for item in resolver_lote(instancias, solver="auto", preservar_ordem=True):
+        print(item.indice, item.resultado, item.erro, item.tempo)
+"""
+
+import multiprocessing
+import os
+import struct
+import time
+from collections import namedtuple
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, as_completed
+from array import array
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+
+import portfolio_optimization
+from portfolio_optimization import (
+    _BYTES_PARA_ASCII,
+    _reconstruir_bits,
+    dp_bottom_up_portfolio,
+    SOLVERS
+)
+
+# Maior valor que cabe nas linhas compartilhadas (int64)
+_MAXIMO_INT64 = 2 ** 63 - 1
+
+
+def _faixas_colunas(capacidade, workers):
+    """
+    Divide as colunas 0..capacidade em faixas contíguas, uma por worker.
+
+    O início de cada faixa é múltiplo de 8, para que cada worker escreva
+    bytes inteiros da matriz de bits (sem dois processos no mesmo byte).
+
+    Returns:
+        Lista de tuplas (inicio, fim), com fim exclusivo
+    """
+    colunas = capacidade + 1
+    largura = -(-colunas // workers)
+    largura = -(-largura // 8) * 8
+    return [(inicio, min(inicio + largura, colunas))
+            for inicio in range(0, colunas, largura)]
+
+
+def _trabalhador_linhas(nome_linhas, nome_bits, projetos, capacidade, inicio, fim, barreira):
+    """
+    Processo worker: conecta-se à memória compartilhada e calcula a sua faixa.
+    """
+    shm_linhas = shared_memory.SharedMemory(name=nome_linhas)
+    shm_bits = shared_memory.SharedMemory(name=nome_bits) if nome_bits else None
+    try:
+        _preencher_faixa(shm_linhas.buf, shm_bits.buf if shm_bits else None,
+                         projetos, capacidade, inicio, fim, barreira)
+    finally:
+        shm_linhas.close()
+        if shm_bits is not None:
+            shm_bits.close()
+
+
+def _preencher_faixa(buffer_linhas, buffer_bits, projetos, capacidade, inicio, fim, barreira):
+    """
+    Calcula as colunas [inicio, fim) de todas as linhas da tabela.
+
+    As linhas alternam entre os dois buffers: a linha i é lida do buffer
+    i % 2 e a linha i + 1 é escrita no buffer (i + 1) % 2. A barreira ao
+    fim de cada linha garante que ninguém lê uma linha incompleta.
+
+    Todas as views da memória compartilhada são locais a esta função, então
+    deixam de existir quando ela retorna (antes do close() do worker).
+    """
+    np = portfolio_optimization.np
+    tamanho_bits = (capacidade + 8) // 8
+    colunas = capacidade + 1
+
+    if np is not None:
+        linhas = np.ndarray((2, colunas), dtype=np.int64, buffer=buffer_linhas)
+        for i, (nome, valor, custo) in enumerate(projetos):
+            ant = linhas[i % 2]
+            prox = linhas[(i + 1) % 2]
+            # Colunas c >= a são as únicas onde o projeto cabe
+            a = max(inicio, custo)
+            prox[inicio:fim] = ant[inicio:fim]
+            tomar = np.zeros(fim - inicio, dtype=bool)
+            if a < fim:
+                com = ant[a - custo:fim - custo] + valor
+                np.greater(com, ant[a:fim], out=tomar[a - inicio:])
+                np.maximum(prox[a:fim], com, out=prox[a:fim])
+            if buffer_bits is not None:
+                pacote = np.packbits(tomar, bitorder="little").tobytes()
+                base = i * tamanho_bits + inicio // 8
+                buffer_bits[base:base + len(pacote)] = pacote
+            barreira.wait()
+        return
+
+    with buffer_linhas.cast("q") as linhas:
+        for i, (nome, valor, custo) in enumerate(projetos):
+            ant = (i % 2) * colunas
+            prox = ((i + 1) % 2) * colunas
+            a = min(max(inicio, custo), fim)
+            sem = linhas[ant + a:ant + fim].tolist()
+            com = linhas[ant + a - custo:ant + fim - custo].tolist() if a < fim else []
+            tomar = [cm + valor > sm for sm, cm in zip(sem, com)]
+            novos = linhas[ant + inicio:ant + a].tolist() + [
+                cm + valor if t else sm for sm, cm, t in zip(sem, com, tomar)]
+            linhas[prox + inicio:prox + fim] = array("q", novos)
+            if buffer_bits is not None:
+                tomar = [False] * (a - inicio) + tomar
+                texto = bytes(tomar).translate(_BYTES_PARA_ASCII)[::-1]
+                pacote = int(texto, 2).to_bytes(len(range(inicio, fim, 8)), "little")
+                base = i * tamanho_bits + inicio // 8
+                buffer_bits[base:base + len(pacote)] = pacote
+            barreira.wait()
+
+
+def dp_paralela_portfolio(projetos, capacidade, workers=None, reconstruir=True):
+    """
+    Bottom-up com o eixo da capacidade dividido entre vários processos.
+
+    ABORDAGEM:
+    - Duas linhas de valores (anterior e próxima) em memória compartilhada
+    - Cada worker fica com uma faixa fixa de colunas (início múltiplo de 8)
+    - Para cada projeto: cada worker calcula a sua faixa da próxima linha
+      lendo a linha anterior inteira (c - Custo_i pode estar em outra
+      faixa) e espera na barreira; a próxima linha vira a anterior
+    - Com reconstruir=True, cada worker também grava os seus bits de
+      decisão (modo "bits") numa matriz compartilhada de n × (C+1) / 8
+      bytes, e o processo principal faz o backtracking
+
+    Usa NumPy nos workers quando disponível; senão, Python puro. Valores
+    não inteiros ou que não cabem em int64 caem no dp_bottom_up_portfolio.
+
+    COMPLEXIDADE DE TEMPO: O(n × C / workers) + n barreiras
+
+    COMPLEXIDADE DE ESPAÇO: 2 × (C+1) inteiros + n × (C+1) / 8 bytes
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        workers: Número de processos (padrão: os.cpu_count())
+        reconstruir: Se False, calcula só o valor e não aloca os bits
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados); a lista fica
+        vazia quando reconstruir=False
+    """
+    projetos = list(projetos)
+    if not all(isinstance(valor, int) for _, valor, _ in projetos) or \
+            sum(abs(valor) for _, valor, _ in projetos) > _MAXIMO_INT64:
+        return dp_bottom_up_portfolio(projetos, capacidade, modo="bits")
+
+    n = len(projetos)
+    workers = workers or os.cpu_count() or 1
+    faixas = _faixas_colunas(capacidade, workers)
+    tamanho_bits = (capacidade + 8) // 8
+
+    shm_linhas = shared_memory.SharedMemory(create=True, size=2 * 8 * (capacidade + 1))
+    shm_bits = None
+    if reconstruir and n > 0:
+        shm_bits = shared_memory.SharedMemory(create=True, size=n * tamanho_bits)
+
+    try:
+        # Linha 0 (sem projetos) é toda zero
+        shm_linhas.buf[:8 * (capacidade + 1)] = bytes(8 * (capacidade + 1))
+
+        barreira = multiprocessing.Barrier(len(faixas))
+        processos = [
+            multiprocessing.Process(
+                target=_trabalhador_linhas,
+                args=(shm_linhas.name, shm_bits.name if shm_bits else None,
+                      projetos, capacidade, inicio, fim, barreira),
+            )
+            for inicio, fim in faixas
+        ]
+        for processo in processos:
+            processo.start()
+
+        # Se um worker morrer, libera os outros da barreira
+        pendentes = list(processos)
+        while pendentes:
+            wait([processo.sentinel for processo in pendentes])
+            for processo in [p for p in pendentes if p.exitcode is not None]:
+                pendentes.remove(processo)
+                if processo.exitcode != 0:
+                    barreira.abort()
+        if any(processo.exitcode != 0 for processo in processos):
+            raise RuntimeError("Um worker da DP paralela falhou")
+
+        # Última coluna da linha n, que está no buffer n % 2
+        final = (n % 2) * (capacidade + 1) + capacidade
+        valor_maximo = struct.unpack_from("q", shm_linhas.buf, 8 * final)[0]
+
+        projetos_selecionados = []
+        if shm_bits is not None:
+            decisoes = [bytes(shm_bits.buf[i * tamanho_bits:(i + 1) * tamanho_bits])
+                        for i in range(n)]
+            projetos_selecionados = _reconstruir_bits(projetos, decisoes, capacidade)
+    finally:
+        shm_linhas.close()
+        shm_linhas.unlink()
+        if shm_bits is not None:
+            shm_bits.close()
+            shm_bits.unlink()
+
+    return (valor_maximo, projetos_selecionados)
+
+
+# ==============================================================================
+# LOTES DE INSTÂNCIAS INDEPENDENTES
+# ==============================================================================
+
+# Resultado de uma instância do lote; `resultado` é None quando há `erro`
+ResultadoLote = namedtuple("ResultadoLote", ["indice", "resultado", "erro", "tempo"])
+
+# Quantos pedaços por worker: mais pedaços equilibram melhor a carga,
+# menos pedaços reduzem o custo de enviar dados entre processos
+PEDACOS_POR_WORKER = 4
+
+
+def _custo_estimado(projetos, capacidade):
+    """
+    Estimativa do trabalho de uma instância: células da tabela n × (C + 1).
+    """
+    return max(1, len(projetos) * (capacidade + 1))
+
+
+def _dividir_em_pedacos(instancias, workers):
+    """
+    Agrupa instâncias consecutivas em pedaços de custo estimado parecido.
+
+    Instâncias pequenas são agrupadas para amortizar o envio entre
+    processos; uma instância cara sozinha já forma um pedaço.
+
+    Args:
+        instancias: Lista de tuplas (indice, projetos, capacidade)
+        workers: Número de processos
+
+    Returns:
+        Lista de pedaços (listas de instâncias)
+    """
+    custos = [_custo_estimado(projetos, capacidade) for _, projetos, capacidade in instancias]
+    alvo = max(1, sum(custos) // (workers * PEDACOS_POR_WORKER))
+
+    pedacos = []
+    atual = []
+    acumulado = 0
+    for instancia, custo in zip(instancias, custos):
+        atual.append(instancia)
+        acumulado += custo
+        if acumulado >= alvo:
+            pedacos.append(atual)
+            atual = []
+            acumulado = 0
+    if atual:
+        pedacos.append(atual)
+    return pedacos
+
+
+def _resolver_pedaco(pedaco, solver, opcoes):
+    """
+    Resolve um pedaço no worker, isolando o erro de cada instância.
+    """
+    funcao = SOLVERS[solver] if isinstance(solver, str) else solver
+    resultados = []
+    for indice, projetos, capacidade in pedaco:
+        inicio = time.perf_counter()
+        try:
+            resultado = funcao(projetos, capacidade, **opcoes)
+            erro = None
+        except (Exception, SystemExit) as e:
+            # Inclui SystemExit de um solver que chama sys.exit: sem isso
+            # o erro derrubaria o pedaço inteiro, não só esta instância.
+            # KeyboardInterrupt (Ctrl-C) não é erro da instância: propaga
+            resultado = None
+            erro = f"{type(e).__name__}: {e}"
+        resultados.append(ResultadoLote(indice, resultado, erro, time.perf_counter() - inicio))
+    return resultados
+
+
+def _rodada_lote(pedacos, workers, solver, opcoes):
+    """
+    Resolve os pedaços em um pool novo, entregando cada lista de
+    resultados assim que fica pronta.
+
+    Se um worker morrer (os._exit, sinal, falta de memória), o pool inteiro
+    quebra e todos os futuros pendentes falham com BrokenProcessPool, não só
+    o do pedaço culpado. Esses pedaços não recebem erro aqui: são devolvidos
+    (valor de retorno do gerador) para o chamador reexecutar.
+    """
+    quebrados = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(pedacos))) as executor:
+        futuros = {}
+        for k, pedaco in enumerate(pedacos):
+            try:
+                futuros[executor.submit(_resolver_pedaco, pedaco, solver, opcoes)] = pedaco
+            except BrokenExecutor:
+                # O pool quebrou antes de terminar os envios
+                quebrados.extend(pedacos[k:])
+                break
+        for futuro in as_completed(futuros):
+            pedaco = futuros[futuro]
+            try:
+                resultados = futuro.result()
+            except BrokenExecutor:
+                quebrados.append(pedaco)
+                continue
+            except KeyboardInterrupt:
+                raise
+            except BaseException as e:
+                # Ex.: o resultado não pôde ser serializado de volta
+                resultados = [ResultadoLote(indice, None, f"{type(e).__name__}: {e}", 0.0)
+                              for indice, _, _ in pedaco]
+            yield resultados
+    return quebrados
+
+
+def resolver_lote(instancias, solver="auto", max_workers=None, preservar_ordem=False, **opcoes):
+    """
+    Resolve muitas instâncias independentes em um ProcessPoolExecutor.
+
+    ABORDAGEM:
+    - Estima o custo de cada instância por n × (C + 1) e agrupa as
+      instâncias em pedaços de custo parecido (PEDACOS_POR_WORKER por
+      worker), para que instâncias minúsculas não paguem uma ida e volta
+      entre processos cada uma
+    - Devolve os resultados conforme ficam prontos (gerador); com
+      preservar_ordem=True, segura os que chegam adiantados e devolve na
+      ordem de entrada
+    - Um erro numa instância vira o campo `erro` do seu resultado e não
+      interrompe o lote
+    - Se um worker morrer, o pool quebra e todos os pedaços ainda não
+      terminados falham juntos. Só esses são reenviados, agora uma
+      instância por tarefa, em um pool novo. Se o pool quebrar de novo, as
+      instâncias restantes rodam uma a uma, cada uma em um pool próprio de
+      um worker, até achar a que derruba o processo. Só ela recebe o erro
+      e as demais voltam a rodar em paralelo
+
+    COMPLEXIDADE DE TEMPO: a soma dos solvers / workers sem falhas; cada
+    worker que morre custa, no pior caso, reexecutar as instâncias não
+    terminadas e uma passada sequencial até o culpado
+
+    Args:
+        instancias: Iterável de tuplas (projetos, capacidade)
+        solver: Nome em SOLVERS ou função de nível de módulo (picklável)
+        max_workers: Número de processos (padrão: os.cpu_count())
+        preservar_ordem: Se True, devolve na ordem de entrada
+        **opcoes: Argumentos extras repassados ao solver
+
+    Returns:
+        Gerador de ResultadoLote(indice, resultado, erro, tempo), com
+        `tempo` em segundos medido no worker
+
+    Raises:
+        ValueError: Solver desconhecido ou max_workers < 1, já na chamada
+        TypeError: solver que não é nome nem função, já na chamada
+    """
+    # Função comum (não gerador): os argumentos são conferidos na chamada,
+    # não só no primeiro next()
+    if isinstance(solver, str):
+        if solver not in SOLVERS:
+            raise ValueError(f"Solver desconhecido: {solver!r}")
+    elif not callable(solver):
+        raise TypeError(f"solver deve ser um nome em SOLVERS ou uma função: {solver!r}")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers deve ser >= 1, recebido {max_workers!r}")
+
+    instancias = [(indice, list(projetos), capacidade)
+                  for indice, (projetos, capacidade) in enumerate(instancias)]
+    workers = max_workers or os.cpu_count() or 1
+    return _resolver_lote(instancias, solver, workers, preservar_ordem, opcoes)
+
+
+def _resolver_lote(instancias, solver, workers, preservar_ordem, opcoes):
+    """
+    Gerador de resolver_lote, com os argumentos já conferidos.
+    """
+    if not instancias:
+        return
+
+    proximo = 0
+    adiantados = {}
+
+    def emitir(resultados):
+        nonlocal proximo
+        if not preservar_ordem:
+            yield from resultados
+            return
+        for item in resultados:
+            adiantados[item.indice] = item
+        while proximo in adiantados:
+            yield adiantados.pop(proximo)
+            proximo += 1
+
+    def rodar(pedacos, n_workers):
+        # Repassa os resultados da rodada e devolve os pedaços quebrados
+        rodada = _rodada_lote(pedacos, n_workers, solver, opcoes)
+        while True:
+            try:
+                resultados = next(rodada)
+            except StopIteration as fim:
+                return fim.value
+            yield from emitir(resultados)
+
+    fila = _dividir_em_pedacos(instancias, workers)
+    isolar = False
+    while fila:
+        if not isolar:
+            quebrados = yield from rodar(fila, workers)
+            # Pedaços com várias instâncias: separa para não punir as inocentes.
+            # Se já eram instâncias sozinhas, roda uma a uma até achar o culpado
+            isolar = bool(quebrados) and all(len(pedaco) == 1 for pedaco in quebrados)
+            fila = [[instancia] for pedaco in quebrados for instancia in pedaco]
+            continue
+
+        restantes = []
+        for k, pedaco in enumerate(fila):
+            if (yield from rodar([pedaco], 1)):
+                (indice, _, _), = pedaco
+                culpado = ResultadoLote(indice, None,
+                                        "BrokenProcessPool: o worker morreu resolvendo esta instância",
+                                        0.0)
+                yield from emitir([culpado])
+                restantes = fila[k + 1:]
+                break
+        fila = restantes
+        isolar = False
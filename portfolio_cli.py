@@ -0,0 +1,264 @@
+"""
+Linha de Comando do Portfólio
+Global Solution 2025 - Dynamic Programming
+
+Lê projetos de um arquivo CSV ou JSONL (ou da entrada padrão), valida em
+uma única passada, resolve com o solver escolhido e escreve o resultado
+em JSON.
+
+A leitura e a validação são em fluxo (ler_projetos é um gerador e para na
+primeira linha inválida), mas resolver precisa da lista completa: os
+solvers percorrem os projetos várias vezes, então resolver_arquivo
+guarda todos os projetos em memória, uma tupla por projeto.
+
+Formatos de entrada:
+    CSV:   cabeçalho com as colunas nome,valor,custo
+    JSONL: um objeto por linha: {"nome": "A", "valor": 12, "custo": 4}
+
+Uso:
+    python portfolio_cli.py projetos.csv --capacidade 100
+    python portfolio_cli.py projetos.jsonl --capacidade 100 --solver core --reduzir
+    cat projetos.csv | python portfolio_cli.py - --formato csv --capacidade 100
+    python portfolio_cli.py projetos.csv --capacidade 100 --sensibilidade
+    python portfolio_cli.py projetos.csv --capacidade 100 --alternativas 10
+"""
+
+import argparse
+import csv
+import io
+import json
+import math
+import sys
+import time
+from collections import Counter
+
+from portfolio_optimization import (
+    SOLVERS, greedy_portfolio, k_melhores_portfolio, reduzido_portfolio,
+    sensibilidade_portfolio)
+
+FORMATOS = ("csv", "jsonl")
+MOTORES = sorted(SOLVERS) + ["greedy"]
+
+
+def _numero(texto, campo, linha):
+    """
+    Converte um campo para int (ou float, se não for inteiro).
+
+    Recusa nan e ±inf: float() e o JSON os aceitam, e um projeto com valor
+    nan some em silêncio do resultado.
+    """
+    if isinstance(texto, (int, float)) and not isinstance(texto, bool):
+        numero = texto
+    else:
+        try:
+            return int(texto)
+        except (TypeError, ValueError):
+            pass
+        try:
+            numero = float(texto)
+        except (TypeError, ValueError):
+            raise ValueError(f"linha {linha}: {campo} inválido: {texto!r}") from None
+    if not math.isfinite(numero):
+        raise ValueError(f"linha {linha}: {campo} não finito: {texto!r}")
+    return numero
+
+
+def _validar(registro, linha):
+    """
+    Valida um registro {nome, valor, custo} e devolve a tupla do projeto.
+
+    O valor pode ser fracionário; o custo precisa ser um inteiro não
+    negativo.
+    """
+    try:
+        nome = registro["nome"]
+        valor = registro["valor"]
+        custo = registro["custo"]
+    except KeyError as e:
+        raise ValueError(f"linha {linha}: campo ausente: {e.args[0]}") from None
+
+    if nome is None or str(nome).strip() == "":
+        raise ValueError(f"linha {linha}: nome vazio")
+    valor = _numero(valor, "valor", linha)
+    custo = _numero(custo, "custo", linha)
+    # Os solvers exatos indexam a tabela pelo custo: só aceitam inteiros
+    # (4.0 vira 4; 4.5 é recusado aqui, e não com um TypeError no solver)
+    if isinstance(custo, float):
+        if not custo.is_integer():
+            raise ValueError(f"linha {linha}: custo não inteiro: {custo}")
+        custo = int(custo)
+    if custo < 0:
+        raise ValueError(f"linha {linha}: custo negativo: {custo}")
+
+    return (str(nome).strip(), valor, custo)
+
+
+def ler_projetos(arquivo, formato):
+    """
+    Lê e valida projetos um a um (gerador), sem carregar o arquivo inteiro.
+
+    Só a leitura é em fluxo: quem resolve (resolver_arquivo) junta as
+    tuplas numa lista.
+
+    Args:
+        arquivo: Objeto de arquivo em modo texto
+        formato: "csv" ou "jsonl"
+
+    Yields:
+        Tuplas (nome, valor, custo)
+
+    Raises:
+        ValueError: Na primeira linha inválida, com o número da linha
+    """
+    if formato == "csv":
+        leitor = csv.DictReader(arquivo)
+        faltando = {"nome", "valor", "custo"} - set(leitor.fieldnames or ())
+        if faltando:
+            raise ValueError(f"cabeçalho CSV sem as colunas: {', '.join(sorted(faltando))}")
+        # Linha 1 é o cabeçalho
+        for linha, registro in enumerate(leitor, 2):
+            yield _validar(registro, linha)
+    elif formato == "jsonl":
+        for linha, texto in enumerate(arquivo, 1):
+            if not texto.strip():
+                continue
+            try:
+                registro = json.loads(texto)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"linha {linha}: JSON inválido: {e.msg}") from None
+            if not isinstance(registro, dict):
+                raise ValueError(f"linha {linha}: esperado um objeto JSON")
+            yield _validar(registro, linha)
+    else:
+        raise ValueError(f"Formato desconhecido: {formato!r} (use {FORMATOS})")
+
+
+def _detectar_formato(caminho, formato):
+    if formato:
+        return formato
+    if caminho.endswith(".jsonl") or caminho.endswith(".ndjson"):
+        return "jsonl"
+    if caminho.endswith(".csv"):
+        return "csv"
+    raise ValueError("não foi possível detectar o formato; use --formato")
+
+
+def resolver_arquivo(arquivo, formato, capacidade, solver="auto", reduzir=False,
+                     sensibilidade=False, alternativas=0):
+    """
+    Lê, valida e resolve; devolve o dicionário de resultado da CLI.
+
+    Guarda todos os projetos validados numa lista (os solvers precisam
+    percorrê-la mais de uma vez); a sensibilidade e as alternativas
+    reusam essa mesma lista. O solver
+    "auto" sempre reduz a instância antes; com reduzir=True os demais
+    solvers exatos também. Com sensibilidade=True, inclui a tabela de
+    sensibilidade_portfolio e a lista de projetos críticos; com
+    alternativas=k, os k melhores portfólios de k_melhores_portfolio.
+    """
+    if capacidade < 0:
+        raise ValueError(f"capacidade negativa: {capacidade}")
+    projetos = list(ler_projetos(arquivo, formato))
+
+    estatisticas = {}
+    inicio = time.perf_counter()
+    if solver == "greedy":
+        # greedy_portfolio ordena por valor / custo: os de custo zero não
+        # gastam horas e entram direto (se tiverem valor positivo)
+        gratuitos = [nome for nome, v, custo in projetos if custo == 0 and v > 0]
+        valor, selecionados, _ = greedy_portfolio(
+            [projeto for projeto in projetos if projeto[2] > 0], capacidade)
+        valor += sum(v for _, v, custo in projetos if custo == 0 and v > 0)
+        selecionados = gratuitos + selecionados
+    elif solver == "auto":
+        valor, selecionados = SOLVERS["auto"](projetos, capacidade, estatisticas=estatisticas)
+    elif reduzir:
+        valor, selecionados = reduzido_portfolio(projetos, capacidade, solver, estatisticas)
+    else:
+        valor, selecionados = SOLVERS[solver](projetos, capacidade)
+    tempo = time.perf_counter() - inicio
+
+    # Horas usadas: soma dos custos dos selecionados (nomes podem repetir)
+    restantes = Counter(selecionados)
+    horas = 0
+    for nome, _, custo in projetos:
+        if restantes[nome] > 0:
+            restantes[nome] -= 1
+            horas += custo
+
+    resultado = {
+        "solver": estatisticas.get("solver", solver),
+        "capacidade": capacidade,
+        "numero_projetos": len(projetos),
+        "valor": valor,
+        "horas_utilizadas": horas,
+        "projetos_selecionados": selecionados,
+        "tempo_segundos": tempo,
+    }
+    if "n_reduzido" in estatisticas:
+        resultado["reducao"] = {
+            chave: estatisticas[chave]
+            for chave in ("n_original", "n_reduzido", "capacidade_original",
+                          "capacidade_reduzida", "divisor")
+        }
+    if sensibilidade:
+        _, tabela, criticos = sensibilidade_portfolio(projetos, capacidade)
+        resultado["sensibilidade"] = [linha._asdict() for linha in tabela]
+        resultado["criticos"] = criticos
+    if alternativas:
+        resultado["alternativas"] = [
+            {"valor": total, "projetos_selecionados": nomes}
+            for total, nomes in k_melhores_portfolio(projetos, capacidade, alternativas)
+        ]
+    return resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Otimização de portfólio de projetos (mochila 0/1)")
+    parser.add_argument("entrada", help="Arquivo CSV/JSONL, ou - para a entrada padrão")
+    parser.add_argument("--capacidade", type=int, required=True,
+                        help="Capacidade máxima de Horas-Especialista")
+    parser.add_argument("--formato", choices=FORMATOS,
+                        help="Formato da entrada (padrão: pela extensão)")
+    parser.add_argument("--solver", choices=MOTORES, default="auto")
+    parser.add_argument("--reduzir", action="store_true",
+                        help="Reduz a instância antes do solver (o auto sempre reduz)")
+    parser.add_argument("--sensibilidade", action="store_true",
+                        help="Inclui a perda de valor sem cada projeto e forçando-o")
+    parser.add_argument("--alternativas", type=int, default=0, metavar="K",
+                        help="Inclui os K melhores portfólios distintos")
+    parser.add_argument("--saida", help="Arquivo JSON de saída (padrão: saída padrão)")
+    parser.add_argument("--indentar", type=int, default=None,
+                        help="Indentação do JSON (padrão: compacto)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.entrada == "-":
+            if not args.formato:
+                raise ValueError("com entrada padrão, informe --formato")
+            entrada = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+            resultado = resolver_arquivo(entrada, args.formato, args.capacidade, args.solver,
+                                         args.reduzir, args.sensibilidade,
+                                         args.alternativas)
+        else:
+            formato = _detectar_formato(args.entrada, args.formato)
+            with open(args.entrada, encoding="utf-8", newline="") as entrada:
+                resultado = resolver_arquivo(entrada, formato, args.capacidade, args.solver,
+                                             args.reduzir, args.sensibilidade,
+                                             args.alternativas)
+    except (OSError, ValueError) as e:
+        print(f"erro: {e}", file=sys.stderr)
+        return 1
+
+    texto = json.dumps(resultado, ensure_ascii=False, indent=args.indentar)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as saida:
+            saida.write(texto + "\n")
+    else:
+        print(texto)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
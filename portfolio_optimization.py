@@ -11,8 +11,51 @@ Este módulo implementa 4 abordagens diferentes para resolver o problema:
 2. Solução Recursiva Pura
 3. Programação Dinâmica Top-Down (Memoização)
 4. Programação Dinâmica Bottom-Up (Iterativa)
+
+E variações para instâncias grandes:
+5. Programação Dinâmica com memória O(n + C) (Hirschberg)
+6. Branch-and-Bound com limitante da relaxação linear (Dantzig)
+7. Programação Dinâmica indexada por valor (custo mínimo por valor)
+8. Esquema de aproximação (FPTAS) com qualidade garantida (1 - ε)
+9. Fronteira de Pareto esparsa (Nemhauser–Ullmann)
+10. Meet-in-the-middle para até ~45 projetos com capacidades arbitrárias
+11. Núcleo expansível em torno do item de quebra do Greedy (core)
+12. Memoização Top-Down sem recursão (pilha explícita)
+13. Bitset em um único int para valor proporcional ao custo (soma de
+    subconjuntos)
+
+reduzir_instancia remove, fixa e reescala projetos antes de qualquer solver.
+auto_portfolio escolhe automaticamente o solver mais barato para a instância.
+Instrumentacao (ou instrumentar) mede células, cache, profundidade, memória
+e tempo por fase de qualquer solver.
+PortfolioResolvido resolve uma vez e responde consultas para qualquer c <= C.
+PortfolioIncremental mantém o ótimo enquanto projetos entram e saem.
+sensibilidade_portfolio mostra quanto se perde sem cada projeto ou forçando-o.
+k_melhores_portfolio lista os k melhores portfólios distintos.
+multidimensional_portfolio resolve com vários recursos (horas, orçamento,
+pessoas) ao mesmo tempo.
+multiplicidade_portfolio aceita projetos repetíveis até k vezes (ou sem limite).
+
+O NumPy é opcional: quando instalado, as DPs podem usar backend="numpy"
+para calcular cada linha da tabela com operações vetorizadas.
 """
 
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional; sem ele tudo roda em Python puro
+    np = None
+
+import inspect
+import math
+import sys
+import time
+import tracemalloc
+from bisect import bisect_right
+from collections import Counter, namedtuple
+
+BACKENDS = ("python", "numpy")
+MODOS_RECONSTRUCAO = ("tabela", "bits")
+
 
 # ==============================================================================
 # FASE 1: ESTRATÉGIA GULOSA (GREEDY)
@@ -152,7 +195,7 @@ def recursive_portfolio(projetos, capacidade, index=0):
 # FASE 3: PROGRAMAÇÃO DINÂMICA TOP-DOWN (MEMOIZAÇÃO)
 # ==============================================================================
 
-def memoized_portfolio(projetos, capacidade):
+def memoized_portfolio(projetos, capacidade, estatisticas=None):
     """
     Solução com Programação Dinâmica Top-Down usando Memoização.
     
@@ -181,6 +224,9 @@ def memoized_portfolio(projetos, capacidade):
     Args:
         projetos: Lista de tuplas (nome, valor, custo)
         capacidade: Capacidade máxima de Horas-Especialista
+        estatisticas: Dicionário opcional (ver Instrumentacao); recebe
+            "celulas", "acertos_memo", "falhas_memo",
+            "profundidade_maxima", "bytes_tabela" e "tempos"
         
     Returns:
         Valor máximo que pode ser obtido
@@ -188,7 +234,8 @@ def memoized_portfolio(projetos, capacidade):
     # Dicionário para armazenar resultados
     # Chave: (index, capacidade_restante)
     # Valor: valor_maximo para esse estado
-    memo = {}
+    # Com estatísticas, o cache conta as consultas; sem, é um dict comum
+    memo = {} if estatisticas is None else _MemoContado()
     
     def helper(index, cap_restante):
         """
@@ -232,14 +279,28 @@ def memoized_portfolio(projetos, capacidade):
         return resultado
     
     # Chama a função auxiliar começando do índice 0
-    return helper(0, capacidade)
+    inicio_fase = _inicio_fase(estatisticas)
+    resultado = helper(0, capacidade)
+    
+    if estatisticas is not None:
+        _fim_fase(estatisticas, "preenchimento", inicio_fase)
+        estatisticas["celulas"] = len(memo)
+        estatisticas["acertos_memo"] = memo.acertos
+        estatisticas["falhas_memo"] = memo.falhas
+        # helper(i, ...) está na profundidade i + 1; o estado mais fundo
+        # guardado ainda chama helper(i + 1, ...)
+        estatisticas["profundidade_maxima"] = max((i for i, _ in memo), default=-1) + 2
+        estatisticas["bytes_tabela"] = sys.getsizeof(memo)
+    
+    return resultado
 
 
 # ==============================================================================
 # FASE 4: PROGRAMAÇÃO DINÂMICA BOTTOM-UP (ITERATIVA)
 # ==============================================================================
 
-def dp_bottom_up_portfolio(projetos, capacidade):
+def dp_bottom_up_portfolio(projetos, capacidade, backend="python", modo="tabela",
+                           estatisticas=None):
     """
     Solução com Programação Dinâmica Bottom-Up (Iterativa).
     
@@ -274,15 +335,54 @@ def dp_bottom_up_portfolio(projetos, capacidade):
     COMPLEXIDADE DE ESPAÇO: O(n × C)
     - Tabela T: (n+1) × (C+1) = O(n × C)
     - Nota: Pode ser otimizada para O(C) usando apenas duas linhas
+      (ver dp_hirschberg_portfolio)
+    
+    BACKEND NUMPY:
+    Com backend="numpy", cada linha é calculada de uma vez como
+    maximum(T[i-1], T[i-1] deslocada de Custo_i + Valor_i). Se o NumPy
+    não estiver instalado (ou os valores não couberem em int64), usa o
+    caminho em Python puro, com resultado idêntico.
+    
+    MODO BITS:
+    Com modo="bits", em vez da tabela de valores guarda apenas 1 bit
+    "incluir/não incluir" por célula, compactado em bytes, e uma única
+    linha de valores. A reconstrução é a mesma, com memória
+    n × (C+1) / 8 bytes em vez de (n+1) × (C+1) inteiros.
     
     Args:
         projetos: Lista de tuplas (nome, valor, custo)
         capacidade: Capacidade máxima de Horas-Especialista
+        backend: "python" ou "numpy"
+        modo: "tabela" (tabela completa) ou "bits" (decisões compactadas)
+        estatisticas: Dicionário opcional (ver Instrumentacao); recebe
+            "celulas", "bytes_tabela" e "tempos"
         
     Returns:
         Tupla contendo (valor_maximo, projetos_selecionados)
     """
+    if modo not in MODOS_RECONSTRUCAO:
+        raise ValueError(f"Modo desconhecido: {modo!r} (use {MODOS_RECONSTRUCAO})")
+    
+    inicio_fase = _inicio_fase(estatisticas)
+    dtype = _dtype_numpy(projetos, backend)
+    if estatisticas is not None:
+        inicio_fase = _fim_fase(estatisticas, "preprocessamento", inicio_fase)
+        estatisticas["celulas"] = len(projetos) * (capacidade + 1)
+    if modo == "bits":
+        linha, decisoes = _decisoes_bits(projetos, capacidade, dtype, estatisticas)
+        valor_maximo = int(linha[capacidade]) if dtype is not None else linha[capacidade]
+        inicio_fase = _fim_fase(estatisticas, "preenchimento", inicio_fase)
+        selecionados = _reconstruir_bits(projetos, decisoes, capacidade)
+        if estatisticas is not None:
+            _fim_fase(estatisticas, "reconstrucao", inicio_fase)
+            estatisticas["bytes_tabela"] = (sum(len(bits) for bits in decisoes)
+                                            + _bytes_linha(linha))
+        return (valor_maximo, selecionados)
+    if dtype is not None:
+        return _dp_bottom_up_numpy(projetos, capacidade, dtype, estatisticas, inicio_fase)
+    
     n = len(projetos)
+    progresso, a_cada = _progresso(estatisticas)
     
     # Cria a tabela T com (n+1) linhas e (capacidade+1) colunas
     # T[i][c] = valor máximo com primeiros i projetos e capacidade c
@@ -310,9 +410,13 @@ def dp_bottom_up_portfolio(projetos, capacidade):
             
             # Armazena o MÁXIMO das duas opções
             T[i][c] = max(valor_sem_incluir, valor_com_incluir)
+        
+        if progresso is not None and (i % a_cada == 0 or i == n):
+            progresso(i, n, estatisticas)
     
     # O resultado final está na última célula da tabela
     valor_maximo = T[n][capacidade]
+    inicio_fase = _fim_fase(estatisticas, "preenchimento", inicio_fase)
     
     # RECONSTRUÇÃO DA SOLUÇÃO (Backtracking)
     # Descobre quais projetos foram selecionados
@@ -320,7 +424,8 @@ def dp_bottom_up_portfolio(projetos, capacidade):
     i = n
     c = capacidade
     
-    while i > 0 and c > 0:
+    # Continua mesmo com c == 0: projetos de custo zero podem ter entrado
+    while i > 0:
         # Se o valor mudou em relação à linha anterior,
         # significa que incluímos este projeto
         if T[i][c] != T[i-1][c]:
@@ -335,9 +440,3033 @@ def dp_bottom_up_portfolio(projetos, capacidade):
     # Inverte a lista (ela foi construída de trás para frente)
     projetos_selecionados.reverse()
     
+    if estatisticas is not None:
+        _fim_fase(estatisticas, "reconstrucao", inicio_fase)
+        estatisticas["bytes_tabela"] = (n + 1) * sys.getsizeof(T[0])
+    
+    return (valor_maximo, projetos_selecionados)
+
+
+# ==============================================================================
+# BACKEND NUMPY (OPCIONAL)
+# ==============================================================================
+
+def _dtype_numpy(projetos, backend):
+    """
+    Escolhe o dtype do backend NumPy a partir da faixa de valores.
+
+    A soma dos valores (em módulo) limita qualquer número que apareça na
+    tabela; se couber em int32 usa int32 (metade da memória), senão int64.
+
+    Returns:
+        O dtype a usar, ou None quando o caminho em Python puro deve ser
+        usado (backend "python", NumPy ausente, valores não inteiros ou
+        grandes demais para int64)
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconhecido: {backend!r} (use {BACKENDS})")
+    if backend == "python" or np is None:
+        return None
+
+    soma = 0
+    for nome, valor, custo in projetos:
+        if not isinstance(valor, int):
+            return None
+        soma += abs(valor)
+
+    if soma <= np.iinfo(np.int32).max:
+        return np.int32
+    if soma <= np.iinfo(np.int64).max:
+        return np.int64
+    return None
+
+
+def _atualizar_linha_numpy(linha, valor, custo):
+    """
+    Aplica um projeto sobre a linha NumPy, no próprio array.
+
+    linha[c] = max(linha[c], linha[c - custo] + valor) para c >= custo.
+    O lado direito é materializado antes da escrita, então ler e escrever
+    a mesma linha é seguro.
+    """
+    if custo == 0:
+        linha += max(valor, 0)
+    elif custo < len(linha):
+        np.maximum(linha[custo:], linha[:-custo] + valor, out=linha[custo:])
+    return linha
+
+
+def _dp_bottom_up_numpy(projetos, capacidade, dtype, estatisticas=None, inicio_fase=None):
+    """
+    Mesma tabela de dp_bottom_up_portfolio, com cada linha vetorizada.
+    """
+    n = len(projetos)
+    progresso, a_cada = _progresso(estatisticas)
+    T = np.zeros((n + 1, capacidade + 1), dtype=dtype)
+
+    for i in range(1, n + 1):
+        nome, valor, custo = projetos[i - 1]
+        T[i] = T[i - 1]
+        _atualizar_linha_numpy(T[i], valor, custo)
+        if progresso is not None and (i % a_cada == 0 or i == n):
+            progresso(i, n, estatisticas)
+
+    valor_maximo = int(T[n, capacidade])
+    inicio_fase = _fim_fase(estatisticas, "preenchimento", inicio_fase)
+
+    # Mesmo backtracking da versão em Python puro
+    projetos_selecionados = []
+    c = capacidade
+    for i in range(n, 0, -1):
+        if T[i, c] != T[i - 1, c]:
+            nome, valor, custo = projetos[i - 1]
+            projetos_selecionados.append(nome)
+            c -= custo
+
+    projetos_selecionados.reverse()
+
+    if estatisticas is not None:
+        _fim_fase(estatisticas, "reconstrucao", inicio_fase)
+        estatisticas["bytes_tabela"] = T.nbytes
+
+    return (valor_maximo, projetos_selecionados)
+
+
+# ==============================================================================
+# MODO BITS: MATRIZ DE DECISÕES COMPACTADA
+# ==============================================================================
+
+# Converte bytes 0/1 nos caracteres ASCII "0"/"1" (usado para compactar bits)
+_BYTES_PARA_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _compactar_decisoes(tomar, inicio, capacidade):
+    """
+    Compacta as decisões de uma linha em bytes (bit c = célula c).
+
+    Args:
+        tomar: Sequência de bools para as células inicio..capacidade
+        inicio: Primeira célula representada em `tomar` (o custo do projeto)
+        capacidade: Última célula da linha
+
+    Returns:
+        bytes com (capacidade + 8) // 8 posições, bit menos significativo
+        primeiro (a mesma ordem de np.packbits com bitorder="little")
+    """
+    tamanho = (capacidade + 8) // 8
+    if not tomar:
+        return bytes(tamanho)
+    # int(..., 2) espera o bit mais significativo primeiro
+    texto = bytes(tomar).translate(_BYTES_PARA_ASCII)[::-1]
+    return (int(texto, 2) << inicio).to_bytes(tamanho, "little")
+
+
+def _decisoes_bits(projetos, capacidade, dtype=None, estatisticas=None):
+    """
+    Preenche a DP guardando uma linha de valores e 1 bit por célula.
+
+    O bit (i, c) vale 1 quando incluir o projeto i é estritamente melhor,
+    isto é, exatamente quando T[i][c] != T[i-1][c] na tabela completa.
+
+    COMPLEXIDADE DE TEMPO: O(n × C)
+    COMPLEXIDADE DE ESPAÇO: O(C) valores + n × (C+1) / 8 bytes
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        dtype: dtype NumPy (ver _dtype_numpy) ou None para Python puro
+        estatisticas: Instrumentacao opcional, só para o callback de progresso
+
+    Returns:
+        Tupla (linha_final, decisoes), com uma entrada bytes por projeto
+    """
+    if dtype is not None:
+        linha = np.zeros(capacidade + 1, dtype=dtype)
+    else:
+        linha = [0] * (capacidade + 1)
+
+    n = len(projetos)
+    progresso, a_cada = _progresso(estatisticas)
+    decisoes = []
+    for i, (nome, valor, custo) in enumerate(projetos, 1):
+        linha, bits = _passo_bits(linha, valor, custo)
+        decisoes.append(bits)
+        if progresso is not None and (i % a_cada == 0 or i == n):
+            progresso(i, n, estatisticas)
+
+    return linha, decisoes
+
+
+def _passo_bits(linha, valor, custo):
+    """
+    Aplica um projeto sobre uma linha, devolvendo a nova linha e seus bits.
+
+    A linha recebida não é modificada. Aceita lista (Python puro) ou
+    array NumPy, e devolve o mesmo tipo.
+
+    Returns:
+        Tupla (nova_linha, bits) com os bits compactados como em
+        _compactar_decisoes
+    """
+    capacidade = len(linha) - 1
+
+    if np is not None and isinstance(linha, np.ndarray):
+        nova = linha.copy()
+        tomar = np.zeros(capacidade + 1, dtype=bool)
+        if custo <= capacidade:
+            com = linha[:capacidade + 1 - custo] + valor
+            np.greater(com, linha[custo:], out=tomar[custo:])
+            np.maximum(nova[custo:], com, out=nova[custo:])
+        return nova, np.packbits(tomar, bitorder="little").tobytes()
+
+    if custo > capacidade:
+        return list(linha), _compactar_decisoes([], 0, capacidade)
+    tomar = [com + valor > sem for sem, com in zip(linha[custo:], linha)]
+    nova = linha[:custo] + [
+        com + valor if t else sem
+        for sem, com, t in zip(linha[custo:], linha, tomar)
+    ]
+    return nova, _compactar_decisoes(tomar, custo, capacidade)
+
+
+def _reconstruir_bits(projetos, decisoes, capacidade):
+    """
+    Backtracking sobre a matriz de decisões compactada.
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        decisoes: Bits por projeto, como retornado por _decisoes_bits
+        capacidade: Capacidade a partir da qual reconstruir
+
+    Returns:
+        Lista de nomes dos projetos selecionados, na ordem original
+    """
+    projetos_selecionados = []
+    c = capacidade
+
+    for i in range(len(projetos) - 1, -1, -1):
+        if decisoes[i][c >> 3] >> (c & 7) & 1:
+            nome, valor, custo = projetos[i]
+            projetos_selecionados.append(nome)
+            c -= custo
+
+    projetos_selecionados.reverse()
+    return projetos_selecionados
+
+
+# ==============================================================================
+# FASE 5: PROGRAMAÇÃO DINÂMICA COM MEMÓRIA O(n + C) (HIRSCHBERG)
+# ==============================================================================
+
+# Abaixo deste número de células (projetos × capacidade) o subproblema é
+# resolvido direto com a tabela completa, que tem overhead menor
+LIMITE_CELULAS_TABELA = 1 << 14
+
+
+def _linha_dp(projetos, capacidade, dtype=None):
+    """
+    Calcula apenas a ÚLTIMA linha da tabela T do bottom-up.
+
+    linha[c] = valor máximo usando os projetos dados e capacidade c.
+    Cada projeto gera a nova linha a partir da anterior, então nunca
+    existem mais de duas linhas vivas ao mesmo tempo.
+
+    COMPLEXIDADE DE TEMPO: O(n × C)
+    COMPLEXIDADE DE ESPAÇO: O(C)
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        dtype: dtype NumPy (ver _dtype_numpy) ou None para Python puro
+
+    Returns:
+        Lista (ou array NumPy) com capacidade + 1 valores
+    """
+    if dtype is not None:
+        linha = np.zeros(capacidade + 1, dtype=dtype)
+        for nome, valor, custo in projetos:
+            _atualizar_linha_numpy(linha, valor, custo)
+        return linha
+
+    linha = [0] * (capacidade + 1)
+
+    for nome, valor, custo in projetos:
+        if custo > capacidade:
+            continue
+        # Pares (T[i-1][c], T[i-1][c - custo]) para c >= custo
+        linha = linha[:custo] + [
+            sem if sem >= com + valor else com + valor
+            for sem, com in zip(linha[custo:], linha)
+        ]
+
+    return linha
+
+
+def dp_hirschberg_portfolio(projetos, capacidade, backend="python", estatisticas=None):
+    """
+    Solução ótima com reconstrução usando apenas O(n + C) de memória.
+
+    ABORDAGEM (dividir e conquistar, no estilo de Hirschberg):
+    - Divide os projetos em duas metades: esquerda e direita
+    - Calcula a última linha da DP de cada metade (apenas O(C) memória):
+      F[c] = ótimo da esquerda com capacidade c
+      B[c] = ótimo da direita com capacidade c
+    - A divisão ótima da capacidade é o c* que maximiza F[c] + B[C - c]
+    - Resolve recursivamente a esquerda com c* e a direita com C - c*
+    - Subproblemas pequenos usam a tabela completa do bottom-up
+    - Um intervalo com um único projeto é resolvido direto (caso base)
+
+    Como as capacidades dos dois filhos somam a capacidade do pai, cada
+    nível da recursão custa no máximo n × C operações; a soma dos níveis
+    é cerca de 2 × n × C, ou seja, o dobro do bottom-up.
+
+    COMPLEXIDADE DE TEMPO: O(n × C)
+
+    COMPLEXIDADE DE ESPAÇO: O(n + C)
+    - Duas linhas de DP vivas por vez: O(C)
+    - Pilha de recursão: O(log n)
+    - Lista de projetos selecionados: O(n)
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        backend: "python" ou "numpy" (ver dp_bottom_up_portfolio)
+        estatisticas: Dicionário opcional (ver Instrumentacao); recebe
+            "celulas", "profundidade_maxima", "bytes_tabela" e "tempos"
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+    """
+    inicio_fase = _inicio_fase(estatisticas)
+    dtype = _dtype_numpy(projetos, backend)
+    inicio_fase = _fim_fase(estatisticas, "preprocessamento", inicio_fase)
+    selecionados = []
+    # [células, profundidade máxima, maior par de linhas em bytes]
+    contadores = [0, 0, 0]
+
+    def resolver(inicio, fim, cap, profundidade=1):
+        """
+        Adiciona em `selecionados` os índices ótimos de projetos[inicio:fim].
+        """
+        if inicio >= fim:
+            return
+        if estatisticas is not None:
+            contadores[0] += (fim - inicio) * (cap + 1)
+            contadores[1] = max(contadores[1], profundidade)
+
+        # Um único projeto: entra se couber e tiver valor positivo. Nunca
+        # é dividido (meio == inicio repetiria o mesmo intervalo)
+        if fim - inicio == 1:
+            nome, valor, custo = projetos[inicio]
+            if custo <= cap and valor > 0:
+                selecionados.append(inicio)
+            return
+
+        # Subproblema pequeno: tabela completa é barata e mais rápida
+        if (fim - inicio) * (cap + 1) <= LIMITE_CELULAS_TABELA:
+            trecho = [(i, valor, custo)
+                      for i, (nome, valor, custo) in enumerate(projetos[inicio:fim], inicio)]
+            _, indices = dp_bottom_up_portfolio(trecho, cap)
+            selecionados.extend(indices)
+            if estatisticas is not None:
+                tabela = (fim - inicio + 1) * sys.getsizeof([0] * (cap + 1))
+                contadores[2] = max(contadores[2], tabela)
+            return
+
+        meio = (inicio + fim) // 2
+        esquerda = _linha_dp(projetos[inicio:meio], cap, dtype)
+        direita = _linha_dp(projetos[meio:fim], cap, dtype)
+
+        # Melhor forma de dividir a capacidade entre as duas metades
+        if dtype is not None:
+            melhor_c = int(np.argmax(esquerda + direita[::-1]))
+        else:
+            melhor_c = 0
+            melhor_valor = esquerda[0] + direita[cap]
+            for c in range(1, cap + 1):
+                total = esquerda[c] + direita[cap - c]
+                if total > melhor_valor:
+                    melhor_valor = total
+                    melhor_c = c
+
+        if estatisticas is not None:
+            contadores[2] = max(contadores[2], _bytes_linha(esquerda) + _bytes_linha(direita))
+
+        # Libera as linhas antes de descer na recursão
+        del esquerda, direita
+
+        resolver(inicio, meio, melhor_c, profundidade + 1)
+        resolver(meio, fim, cap - melhor_c, profundidade + 1)
+
+    resolver(0, len(projetos), capacidade)
+    inicio_fase = _fim_fase(estatisticas, "preenchimento", inicio_fase)
+
+    # Mantém a ordem original dos projetos, como o bottom-up
+    selecionados.sort()
+    valor_maximo = sum(projetos[i][1] for i in selecionados)
+    projetos_selecionados = [projetos[i][0] for i in selecionados]
+
+    if estatisticas is not None:
+        _fim_fase(estatisticas, "reconstrucao", inicio_fase)
+        estatisticas["celulas"], estatisticas["profundidade_maxima"], \
+            estatisticas["bytes_tabela"] = contadores
+
     return (valor_maximo, projetos_selecionados)
 
 
+# ==============================================================================
+# FASE 6: BRANCH-AND-BOUND (LIMITANTE DA RELAXAÇÃO LINEAR)
+# ==============================================================================
+
+def _ordenar_por_razao(projetos, capacidade):
+    """
+    Prepara os projetos para solvers baseados na ordem gulosa.
+
+    Descarta projetos que nunca entram numa solução ótima (custo maior
+    que a capacidade ou valor <= 0), separa os de custo zero (sempre
+    entram) e ordena o restante pela relação V/E decrescente, como o
+    greedy_portfolio.
+
+    Returns:
+        Tupla (gratuitos, ordenados): índices dos projetos de custo zero e
+        índices dos demais em ordem de V/E decrescente
+    """
+    gratuitos = []
+    candidatos = []
+    for i, (nome, valor, custo) in enumerate(projetos):
+        if valor <= 0 or custo > capacidade:
+            continue
+        if custo == 0:
+            gratuitos.append(i)
+        else:
+            candidatos.append(i)
+
+    candidatos.sort(key=lambda i: projetos[i][1] / projetos[i][2], reverse=True)
+    return gratuitos, candidatos
+
+
+def branch_and_bound_portfolio(projetos, capacidade, limite_nos=None, estatisticas=None):
+    """
+    Solução exata por Branch-and-Bound, independente do tamanho de C.
+
+    ABORDAGEM:
+    - Ordena os projetos UMA vez pela relação V/E (a ordem do Greedy)
+    - Solução inicial (limitante inferior): a própria solução gulosa
+    - Limitante superior de cada nó: relaxação linear de Dantzig, que
+      completa a capacidade com uma FRAÇÃO do primeiro projeto que não
+      cabe. Com somas prefixadas, cada limitante custa O(log n)
+    - Busca em profundidade (pilha explícita), testando primeiro
+      "incluir"; nós cujo limitante não supera a melhor solução são podados
+
+    Quando `limite_nos` é atingido a busca para e retorna a melhor
+    solução encontrada até ali, que pode não ser ótima
+    (estatisticas["otimo_provado"] == False).
+
+    COMPLEXIDADE DE TEMPO: O(n log n) para preparar + O(2^n) no pior caso
+    - Na prática, o limitante de Dantzig poda quase toda a árvore
+    - Não depende da capacidade C
+
+    COMPLEXIDADE DE ESPAÇO: O(n)
+    - Somas prefixadas e pilha da busca
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        limite_nos: Número máximo de nós a explorar (None = sem limite)
+        estatisticas: Dicionário opcional preenchido com "nos_explorados"
+            (também em "celulas"), "nos_podados", "limite_superior" e
+            "otimo_provado"
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+    """
+    gratuitos, ordem = _ordenar_por_razao(projetos, capacidade)
+    valores = [projetos[i][1] for i in ordem]
+    custos = [projetos[i][2] for i in ordem]
+    m = len(ordem)
+    inteiros = all(isinstance(v, int) for v in valores)
+
+    # Somas prefixadas: P[k] = valor dos k primeiros, W[k] = custo dos k primeiros
+    P = [0] * (m + 1)
+    W = [0] * (m + 1)
+    for k in range(m):
+        P[k + 1] = P[k] + valores[k]
+        W[k + 1] = W[k] + custos[k]
+
+    def limitante(i, cap, valor):
+        """
+        Relaxação linear dos projetos ordem[i:] com capacidade cap.
+        """
+        # k = último prefixo que cabe inteiro a partir de i
+        k = bisect_right(W, W[i] + cap, i) - 1
+        limite = valor + P[k] - P[i]
+        if k < m:
+            limite += (cap - (W[k] - W[i])) * valores[k] / custos[k]
+        return math.floor(limite) if inteiros else limite
+
+    # Limitante inferior inicial: solução gulosa sobre a mesma ordem
+    melhor_valor = 0
+    melhor_selecao = []
+    cap = capacidade
+    for k in range(m):
+        if custos[k] <= cap:
+            cap -= custos[k]
+            melhor_valor += valores[k]
+            melhor_selecao.append(k)
+
+    limite_raiz = limitante(0, capacidade, 0)
+    nos_explorados = 0
+    nos_podados = 0
+    otimo_provado = True
+
+    # Cada nó: (próximo índice, capacidade restante, valor, escolhidos)
+    # `escolhidos` é uma lista encadeada (índice, anterior) compartilhada
+    pilha = [(0, capacidade, 0, None)]
+    melhor_encadeada = None
+    usou_busca = False
+
+    while pilha:
+        if limite_nos is not None and nos_explorados >= limite_nos:
+            otimo_provado = False
+            break
+
+        i, cap, valor, escolhidos = pilha.pop()
+        nos_explorados += 1
+
+        if valor > melhor_valor:
+            melhor_valor = valor
+            melhor_encadeada = escolhidos
+            usou_busca = True
+
+        if i == m:
+            continue
+
+        if limitante(i, cap, valor) <= melhor_valor:
+            nos_podados += 1
+            continue
+
+        # Empilha "não incluir" antes para explorar "incluir" primeiro
+        pilha.append((i + 1, cap, valor, escolhidos))
+        if custos[i] <= cap:
+            pilha.append((i + 1, cap - custos[i], valor + valores[i], (i, escolhidos)))
+
+    if usou_busca:
+        melhor_selecao = []
+        while melhor_encadeada is not None:
+            k, melhor_encadeada = melhor_encadeada
+            melhor_selecao.append(k)
+
+    selecionados = sorted(gratuitos + [ordem[k] for k in melhor_selecao])
+    valor_maximo = sum(projetos[i][1] for i in selecionados)
+
+    if estatisticas is not None:
+        estatisticas["nos_explorados"] = nos_explorados
+        estatisticas["celulas"] = nos_explorados
+        estatisticas["nos_podados"] = nos_podados
+        estatisticas["limite_superior"] = limite_raiz + sum(projetos[i][1] for i in gratuitos)
+        estatisticas["otimo_provado"] = otimo_provado
+
+    return (valor_maximo, [projetos[i][0] for i in selecionados])
+
+
+# ==============================================================================
+# FASE 7: PROGRAMAÇÃO DINÂMICA INDEXADA POR VALOR
+# ==============================================================================
+
+def dp_por_valor_portfolio(projetos, capacidade, backend="python", estatisticas=None):
+    """
+    Solução ótima com a DP "dual": indexada pelo VALOR em vez da capacidade.
+
+    ABORDAGEM:
+    - M[v] = menor número de horas para atingir valor total EXATAMENTE v
+    - Para cada projeto: M[v] = min(M[v], M[v - Valor_i] + Custo_i)
+    - A resposta é o maior v com M[v] <= capacidade
+    - Guarda 1 bit de decisão por célula (como o modo "bits") para
+      reconstruir a seleção
+
+    Útil quando a capacidade é enorme (milhões de horas) mas os valores
+    são inteiros pequenos (ex.: escala de 1 a 100): o custo passa a
+    depender de V = soma dos valores, e não de C.
+
+    COMPLEXIDADE DE TEMPO: O(n × V)
+    - V = soma dos valores dos projetos que cabem
+
+    COMPLEXIDADE DE ESPAÇO: O(V) + n × V / 8 bytes de decisões
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo), com valores inteiros
+        capacidade: Capacidade máxima de Horas-Especialista
+        backend: "python" ou "numpy"
+        estatisticas: Dicionário opcional (ver Instrumentacao); recebe
+            "celulas", "bytes_tabela" e "tempos"
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconhecido: {backend!r} (use {BACKENDS})")
+
+    inicio_fase = _inicio_fase(estatisticas)
+    # Projetos de custo zero sempre entram; os que não cabem ou não
+    # agregam valor nunca entram
+    gratuitos = []
+    itens = []
+    for i, (nome, valor, custo) in enumerate(projetos):
+        if valor <= 0 or custo > capacidade:
+            continue
+        if not isinstance(valor, int):
+            raise ValueError(f"Valor não inteiro no projeto {nome!r}: {valor!r}")
+        if custo == 0:
+            gratuitos.append(i)
+        else:
+            itens.append(i)
+
+    # Custo "infinito": qualquer coisa acima da capacidade é inviável
+    infinito = capacidade + 1
+    usar_numpy = (backend == "numpy" and np is not None
+                  and all(isinstance(projetos[i][2], int) for i in itens)
+                  and infinito + sum(projetos[i][2] for i in itens) <= np.iinfo(np.int64).max)
+
+    inicio_fase = _fim_fase(estatisticas, "preprocessamento", inicio_fase)
+    progresso, a_cada = _progresso(estatisticas)
+
+    # As linhas crescem com a soma dos valores já processados
+    decisoes = []
+    if usar_numpy:
+        M = np.zeros(1, dtype=np.int64)
+        for k, i in enumerate(itens, 1):
+            nome, valor, custo = projetos[i]
+            M = np.concatenate([M, np.full(valor, infinito, dtype=np.int64)])
+            tomar = np.zeros(len(M), dtype=bool)
+            com = M[:-valor] + custo
+            np.less(com, M[valor:], out=tomar[valor:])
+            np.minimum(M[valor:], com, out=M[valor:])
+            decisoes.append(np.packbits(tomar, bitorder="little").tobytes())
+            if progresso is not None and (k % a_cada == 0 or k == len(itens)):
+                progresso(k, len(itens), estatisticas)
+        viaveis = np.flatnonzero(M <= capacidade)
+        melhor_v = int(viaveis[-1])
+    else:
+        M = [0]
+        for k, i in enumerate(itens, 1):
+            nome, valor, custo = projetos[i]
+            M = M + [infinito] * valor
+            tomar = [com + custo < sem for sem, com in zip(M[valor:], M)]
+            decisoes.append(_compactar_decisoes(tomar, valor, len(M) - 1))
+            M = M[:valor] + [
+                com + custo if t else sem
+                for sem, com, t in zip(M[valor:], M, tomar)
+            ]
+            if progresso is not None and (k % a_cada == 0 or k == len(itens)):
+                progresso(k, len(itens), estatisticas)
+        melhor_v = max(v for v, horas in enumerate(M) if horas <= capacidade)
+    inicio_fase = _fim_fase(estatisticas, "preenchimento", inicio_fase)
+
+    # Backtracking sobre os bits: se o bit (i, v) está ligado, o projeto i
+    # foi usado para atingir o valor v
+    selecionados = list(gratuitos)
+    v = melhor_v
+    for k in range(len(itens) - 1, -1, -1):
+        if decisoes[k][v >> 3] >> (v & 7) & 1:
+            selecionados.append(itens[k])
+            v -= projetos[itens[k]][1]
+
+    selecionados.sort()
+    valor_maximo = melhor_v + sum(projetos[i][1] for i in gratuitos)
+
+    if estatisticas is not None:
+        _fim_fase(estatisticas, "reconstrucao", inicio_fase)
+        # A linha do k-ésimo item tem (soma dos k primeiros valores) + 1 células
+        celulas = soma = 0
+        for i in itens:
+            soma += projetos[i][1]
+            celulas += soma + 1
+        estatisticas["celulas"] = celulas
+        estatisticas["bytes_tabela"] = sum(len(bits) for bits in decisoes) + _bytes_linha(M)
+
+    return (valor_maximo, [projetos[i][0] for i in selecionados])
+
+
+# ==============================================================================
+# FASE 8: ESQUEMA DE APROXIMAÇÃO TOTALMENTE POLINOMIAL (FPTAS)
+# ==============================================================================
+
+def _limite_linear(projetos, capacidade):
+    """
+    Valor da relaxação linear (Dantzig): limitante superior do ótimo.
+
+    Preenche a capacidade na ordem V/E e completa com a fração do primeiro
+    projeto que não cabe.
+    """
+    gratuitos, ordem = _ordenar_por_razao(projetos, capacidade)
+    limite = sum(projetos[i][1] for i in gratuitos)
+    cap = capacidade
+    for i in ordem:
+        nome, valor, custo = projetos[i]
+        if custo <= cap:
+            cap -= custo
+            limite += valor
+        else:
+            limite += cap * valor / custo
+            break
+    return limite
+
+
+def fptas_portfolio(projetos, capacidade, epsilon=0.1, backend="python"):
+    """
+    Aproximação com garantia: valor >= (1 - ε) × ótimo.
+
+    ABORDAGEM:
+    - Escala os valores por K = ε × Vmax / n e arredonda para baixo:
+      Valor'_i = floor(Valor_i / K)
+    - Resolve a instância escalada EXATAMENTE com a DP indexada por valor
+      (dp_por_valor_portfolio), que agora tem no máximo n² / ε valores
+    - Cada projeto perde menos de K no arredondamento, então a seleção
+      perde no máximo n × K = ε × Vmax <= ε × ótimo
+
+    É o "botão" entre o Greedy (rápido, sem garantia) e as DPs exatas:
+    ε menor = mais preciso e mais lento. Se K <= 1 com valores inteiros,
+    não há o que escalar e a resposta é exata; com valores fracionários
+    o floor sempre perde algo e o teto continua sendo o da escala.
+
+    COMPLEXIDADE DE TEMPO: O(n³ / ε)
+    - Independente da capacidade C e da magnitude dos valores
+
+    COMPLEXIDADE DE ESPAÇO: O(n² / ε) valores + n³ / (8ε) bytes de decisões
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        epsilon: Perda relativa máxima aceita, 0 < ε < 1
+        backend: "python" ou "numpy" (repassado à DP por valor)
+
+    Returns:
+        Tupla contendo (valor_total, projetos_selecionados, limite_superior),
+        onde limite_superior é um teto comprovado para o ótimo; a qualidade
+        obtida é valor_total / limite_superior >= 1 - ε
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError(f"epsilon deve estar em (0, 1), recebido {epsilon!r}")
+
+    itens = [i for i, (nome, valor, custo) in enumerate(projetos)
+             if valor > 0 and custo <= capacidade]
+    if not itens:
+        return (0, [], 0)
+
+    valor_max = max(projetos[i][1] for i in itens)
+    K = epsilon * valor_max / len(itens)
+    # Só é exato quando nenhum valor perde fração no floor: K == 1 com
+    # valores inteiros. Com valores fracionários, K == 1 ainda arredonda
+    exato = K <= 1 and all(isinstance(projetos[i][1], int) for i in itens)
+    if exato:
+        K = 1
+
+    escalados = [(i, int(projetos[i][1] // K), projetos[i][2]) for i in itens]
+    valor_escalado, indices = dp_por_valor_portfolio(escalados, capacidade, backend=backend)
+
+    indices.sort()
+    valor_total = sum(projetos[i][1] for i in indices)
+
+    # Tetos para o ótimo: relaxação linear, a própria garantia (1 - ε) e
+    # o arredondamento (o ótimo perde menos de K por projeto ao escalar)
+    limite_superior = min(
+        _limite_linear(projetos, capacidade),
+        valor_total / (1 - epsilon),
+        K * (valor_escalado + len(itens)),
+    )
+    limite_superior = max(limite_superior, valor_total)
+    if exato:
+        limite_superior = valor_total
+
+    return (valor_total, [projetos[i][0] for i in indices], limite_superior)
+
+
+# ==============================================================================
+# FASE 9: FRONTEIRA DE PARETO ESPARSA (NEMHAUSER–ULLMANN)
+# ==============================================================================
+
+def _fronteira_pareto(itens, capacidade, tamanhos=None):
+    """
+    Constrói a fronteira de pareto (custo, valor) dos itens dados.
+
+    Cada estado é (custo, valor, escolhidos), com custos crescentes e
+    valores ESTRITAMENTE crescentes: um estado com custo maior e valor
+    menor ou igual a outro é dominado e descartado. `escolhidos` é uma
+    lista encadeada (índice, anterior) que serve de ponteiro para o pai.
+
+    Args:
+        itens: Lista de tuplas (índice, valor, custo)
+        capacidade: Capacidade máxima; estados acima dela são descartados
+        tamanhos: Lista opcional que recebe o tamanho da fronteira por passo
+
+    Returns:
+        Lista de estados (custo, valor, escolhidos) não dominados
+    """
+    fronteira = [(0, 0, None)]
+
+    for indice, valor, custo in itens:
+        # Estados que ganham o item e continuam dentro da capacidade
+        limite = capacidade - custo
+        deslocados = [(c + custo, v + valor, (indice, esc))
+                      for c, v, esc in fronteira if c <= limite]
+
+        # Intercala as duas listas (ambas ordenadas por custo) mantendo só
+        # os estados cujo valor supera o melhor valor de custo menor
+        nova = []
+        melhor = None
+        a = b = 0
+        while a < len(fronteira) or b < len(deslocados):
+            if b == len(deslocados) or (a < len(fronteira) and (
+                    fronteira[a][0] < deslocados[b][0] or
+                    (fronteira[a][0] == deslocados[b][0] and
+                     fronteira[a][1] >= deslocados[b][1]))):
+                estado = fronteira[a]
+                a += 1
+            else:
+                estado = deslocados[b]
+                b += 1
+            if melhor is None or estado[1] > melhor:
+                nova.append(estado)
+                melhor = estado[1]
+
+        fronteira = nova
+        if tamanhos is not None:
+            tamanhos.append(len(fronteira))
+
+    return fronteira
+
+
+def pareto_portfolio(projetos, capacidade, estatisticas=None):
+    """
+    Solução ótima guardando apenas os pares (custo, valor) não dominados.
+
+    ABORDAGEM (Nemhauser–Ullmann):
+    - Mantém a lista de estados (horas, valor) que não são dominados:
+      nenhum outro estado tem menos (ou iguais) horas com valor maior
+      ou igual
+    - Para cada projeto, gera a cópia da lista "com o projeto", descarta
+      o que excede a capacidade e intercala as duas listas em tempo linear
+    - O último estado da lista final é o ótimo; a seleção sai dos
+      ponteiros para o estado pai
+
+    Quando os custos são grandes e irregulares (137, 4093, 18822 horas),
+    a maior parte das colunas da tabela densa é cópia da coluna anterior;
+    aqui o trabalho depende só do número de estados de pareto.
+
+    COMPLEXIDADE DE TEMPO: O(soma dos tamanhos da fronteira)
+    - Nunca pior que O(n × C), pois há no máximo C + 1 custos distintos
+
+    COMPLEXIDADE DE ESPAÇO: O(maior fronteira + nós da seleção)
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        estatisticas: Dicionário opcional; recebe "tamanhos_fronteira"
+            (tamanho após cada projeto considerado), "fronteira_maxima" e
+            "celulas" (soma dos tamanhos)
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+    """
+    gratuitos, ordem = _ordenar_por_razao(projetos, capacidade)
+    itens = [(i, projetos[i][1], projetos[i][2]) for i in sorted(ordem)]
+
+    tamanhos = [] if estatisticas is not None else None
+    fronteira = _fronteira_pareto(itens, capacidade, tamanhos)
+
+    custo, valor, escolhidos = fronteira[-1]
+    selecionados = list(gratuitos)
+    while escolhidos is not None:
+        indice, escolhidos = escolhidos
+        selecionados.append(indice)
+    selecionados.sort()
+
+    if estatisticas is not None:
+        estatisticas["tamanhos_fronteira"] = tamanhos
+        estatisticas["fronteira_maxima"] = max(tamanhos, default=1)
+        estatisticas["celulas"] = sum(tamanhos)
+
+    valor_maximo = valor + sum(projetos[i][1] for i in gratuitos)
+    return (valor_maximo, [projetos[i][0] for i in selecionados])
+
+
+# ==============================================================================
+# FASE 10: MEET-IN-THE-MIDDLE
+# ==============================================================================
+
+# Acima deste número de projetos as 2^(n/2) combinações não cabem em memória
+LIMITE_PROJETOS_MEET_IN_THE_MIDDLE = 50
+
+
+def _enumerar_subconjuntos(itens, capacidade):
+    """
+    Enumera todos os subconjuntos de `itens` que cabem na capacidade.
+
+    Args:
+        itens: Lista de tuplas (índice, valor, custo)
+        capacidade: Capacidade máxima
+
+    Returns:
+        Três listas paralelas: custos, valores e máscaras (bit j = itens[j])
+    """
+    custos = [0]
+    valores = [0]
+    mascaras = [0]
+    for j, (indice, valor, custo) in enumerate(itens):
+        bit = 1 << j
+        limite = capacidade - custo
+        for k in range(len(custos)):
+            if custos[k] <= limite:
+                custos.append(custos[k] + custo)
+                valores.append(valores[k] + valor)
+                mascaras.append(mascaras[k] | bit)
+    return custos, valores, mascaras
+
+
+def meet_in_the_middle_portfolio(projetos, capacidade, estatisticas=None):
+    """
+    Solução exata em O(2^(n/2)), sem nenhuma tabela indexada por C.
+
+    ABORDAGEM:
+    - Divide os projetos em duas metades A e B
+    - Enumera as somas (custo, valor) de todos os subconjuntos de cada uma
+    - Em B: ordena por custo e remove os pares dominados, deixando uma
+      lista em que o valor cresce junto com o custo
+    - Para cada subconjunto de A, busca binária do maior custo de B que
+      cabe na capacidade restante; pela monotonia, é o melhor complemento
+
+    Estende a faixa da solução recursiva (inviável além de ~25 projetos)
+    até ~45 projetos, com capacidades gigantes ou não inteiras.
+
+    COMPLEXIDADE DE TEMPO: O(2^(n/2) × n)
+    - Enumeração: O(2^(n/2)) por metade
+    - Ordenação e buscas binárias: O(2^(n/2) × log 2^(n/2))
+
+    COMPLEXIDADE DE ESPAÇO: O(2^(n/2))
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        estatisticas: Dicionário opcional (ver Instrumentacao); recebe
+            "celulas" (subconjuntos enumerados), "bytes_tabela" e "tempos"
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+
+    Raises:
+        ValueError: Se houver mais de LIMITE_PROJETOS_MEET_IN_THE_MIDDLE
+            projetos que cabem na capacidade
+    """
+    inicio_fase = _inicio_fase(estatisticas)
+    gratuitos, ordem = _ordenar_por_razao(projetos, capacidade)
+    if len(ordem) > LIMITE_PROJETOS_MEET_IN_THE_MIDDLE:
+        raise ValueError(
+            f"Meet-in-the-middle suporta até {LIMITE_PROJETOS_MEET_IN_THE_MIDDLE} "
+            f"projetos, recebeu {len(ordem)}"
+        )
+
+    itens = [(i, projetos[i][1], projetos[i][2]) for i in ordem]
+    meio = len(itens) // 2
+    metade_a, metade_b = itens[:meio], itens[meio:]
+    inicio_fase = _fim_fase(estatisticas, "preprocessamento", inicio_fase)
+
+    custos_a, valores_a, mascaras_a = _enumerar_subconjuntos(metade_a, capacidade)
+    custos_b, valores_b, mascaras_b = _enumerar_subconjuntos(metade_b, capacidade)
+
+    # B ordenado por custo (empate: maior valor primeiro), sem dominados
+    ordem_b = sorted(range(len(custos_b)), key=lambda k: (custos_b[k], -valores_b[k]))
+    lista_custos = []
+    lista_valores = []
+    lista_mascaras = []
+    for k in ordem_b:
+        if not lista_valores or valores_b[k] > lista_valores[-1]:
+            lista_custos.append(custos_b[k])
+            lista_valores.append(valores_b[k])
+            lista_mascaras.append(mascaras_b[k])
+
+    melhor_valor = -1
+    melhor_a = melhor_b = 0
+    for k in range(len(custos_a)):
+        # Sempre existe o conjunto vazio de B (custo 0)
+        j = bisect_right(lista_custos, capacidade - custos_a[k]) - 1
+        total = valores_a[k] + lista_valores[j]
+        if total > melhor_valor:
+            melhor_valor = total
+            melhor_a = mascaras_a[k]
+            melhor_b = lista_mascaras[j]
+    inicio_fase = _fim_fase(estatisticas, "preenchimento", inicio_fase)
+
+    selecionados = list(gratuitos)
+    selecionados += [metade_a[j][0] for j in range(len(metade_a)) if melhor_a >> j & 1]
+    selecionados += [metade_b[j][0] for j in range(len(metade_b)) if melhor_b >> j & 1]
+    selecionados.sort()
+
+    valor_maximo = sum(projetos[i][1] for i in selecionados)
+
+    if estatisticas is not None:
+        _fim_fase(estatisticas, "reconstrucao", inicio_fase)
+        estatisticas["celulas"] = len(custos_a) + len(custos_b)
+        estatisticas["bytes_tabela"] = sum(
+            sys.getsizeof(lista) for lista in (custos_a, valores_a, mascaras_a,
+                                               custos_b, valores_b, mascaras_b))
+
+    return (valor_maximo, [projetos[i][0] for i in selecionados])
+
+
+# ==============================================================================
+# FASE 11: NÚCLEO EXPANSÍVEL (CORE) EM TORNO DO ITEM DE QUEBRA
+# ==============================================================================
+
+# Meia-largura inicial da janela do núcleo em torno do item de quebra
+TAMANHO_INICIAL_CORE = 16
+
+
+def _limites_dembo_hammer(valores, custos, capacidade, inteiros):
+    """
+    Limitantes de Dembo–Hammer para "inverter" cada item da solução gulosa.
+
+    Com os itens em ordem V/E decrescente, seja b o item de quebra (o
+    primeiro que não cabe) e r = Valor_b / Custo_b. A reta que passa pela
+    solução gulosa com inclinação r limita a relaxação linear por cima,
+    então, para cada item j:
+    - j < b (guloso inclui): u_j = P_b - Valor_j + (C - W_b + Custo_j) × r
+      é um teto para qualquer solução SEM o item j
+    - j >= b (guloso exclui): u_j = P_b + Valor_j + (C - W_b - Custo_j) × r
+      é um teto para qualquer solução COM o item j
+
+    Args:
+        valores: Valores dos itens, em ordem V/E decrescente
+        custos: Custos dos itens, na mesma ordem
+        capacidade: Capacidade máxima
+        inteiros: Se True (valores inteiros), arredonda os limitantes para
+            baixo; com custos também inteiros a conta é exata, sem float
+
+    Returns:
+        Tupla (b, limites): índice do item de quebra (len(valores) se tudo
+        cabe) e a lista de limitantes u_j
+    """
+    m = len(valores)
+    b = 0
+    W = P = 0
+    while b < m and W + custos[b] <= capacidade:
+        W += custos[b]
+        P += valores[b]
+        b += 1
+    if b == m:
+        return b, [P] * m
+
+    folga = capacidade - W
+    limites = []
+    if inteiros:
+        # floor(u_j) sem passar por float: u_j × Custo_b é inteiro
+        vb, wb = valores[b], custos[b]
+        for j in range(m):
+            if j < b:
+                u = ((P - valores[j]) * wb + (folga + custos[j]) * vb) // wb
+            else:
+                u = ((P + valores[j]) * wb + (folga - custos[j]) * vb) // wb
+            limites.append(u)
+        return b, limites
+
+    r = valores[b] / custos[b]
+    for j in range(m):
+        if j < b:
+            u = P - valores[j] + (folga + custos[j]) * r
+        else:
+            u = P + valores[j] + (folga - custos[j]) * r
+        limites.append(u)
+    return b, limites
+
+
+def core_portfolio(projetos, capacidade, tamanho_inicial=TAMANHO_INICIAL_CORE,
+                   estatisticas=None):
+    """
+    Solução exata resolvendo só um "núcleo" de projetos perto do item de quebra.
+
+    ABORDAGEM (no espírito do expanding core de Pisinger):
+    - Ordena por V/E (a ordem do Greedy) e acha o item de quebra b
+    - Fixa fora do núcleo: itens antes de b ENTRAM, itens depois SAEM
+    - Resolve exatamente apenas o núcleo (fronteira de pareto) com a
+      capacidade que sobra depois dos itens fixados
+    - Prova de otimalidade: qualquer solução melhor teria de inverter
+      algum item fixado j; o limitante de Dembo–Hammer u_j limita todas
+      essas soluções. Se u_j <= melhor valor para todo j fora do núcleo,
+      a solução é ótima
+    - Senão, dobra a janela do núcleo em torno de b e repete
+
+    Em catálogos reais quase todos os itens longe de b passam no teste,
+    então o núcleo fica pequeno mesmo com n ≈ 100 mil.
+
+    COMPLEXIDADE DE TEMPO: O(n log n) + custo da DP sobre o núcleo
+    - No pior caso o núcleo cresce até n (equivale à fronteira de pareto)
+
+    COMPLEXIDADE DE ESPAÇO: O(n) + fronteira do núcleo
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        tamanho_inicial: Meia-largura inicial da janela em torno de b
+        estatisticas: Dicionário opcional; recebe "item_quebra",
+            "tamanho_core" (tamanho final do núcleo), "iteracoes" e
+            "celulas" (estados de pareto gerados em todas as iterações)
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+    """
+    gratuitos, ordem = _ordenar_por_razao(projetos, capacidade)
+    m = len(ordem)
+    valores = [projetos[i][1] for i in ordem]
+    custos = [projetos[i][2] for i in ordem]
+    inteiros = all(isinstance(v, int) for v in valores)
+
+    b, limites = _limites_dembo_hammer(valores, custos, capacidade, inteiros)
+
+    # Solução inicial: Greedy completo (continua após o item de quebra)
+    melhor_valor = 0
+    melhor_selecao = []
+    cap = capacidade
+    for k in range(m):
+        if custos[k] <= cap:
+            cap -= custos[k]
+            melhor_valor += valores[k]
+            melhor_selecao.append(k)
+
+    core = set()
+    largura = max(1, tamanho_inicial)
+    iteracoes = 0
+    tamanhos = [] if estatisticas is not None else None
+
+    while b < m:
+        iteracoes += 1
+        inicio, fim = max(0, b - largura), min(m, b + largura)
+        core.update(range(inicio, fim))
+
+        fixados = [k for k in range(b) if k not in core]
+        residual = capacidade - sum(custos[k] for k in fixados)
+        valor_fixados = sum(valores[k] for k in fixados)
+
+        itens = [(k, valores[k], custos[k]) for k in sorted(core)]
+        custo, valor, escolhidos = _fronteira_pareto(itens, residual, tamanhos)[-1]
+
+        if valor + valor_fixados > melhor_valor:
+            melhor_valor = valor + valor_fixados
+            melhor_selecao = list(fixados)
+            while escolhidos is not None:
+                k, escolhidos = escolhidos
+                melhor_selecao.append(k)
+
+        # Itens fixados cuja inversão ainda pode superar a melhor solução
+        falhas = [j for j in range(m) if j not in core and limites[j] > melhor_valor]
+        if not falhas or (inicio == 0 and fim == m):
+            break
+        largura *= 2
+
+    if estatisticas is not None:
+        estatisticas["item_quebra"] = b
+        estatisticas["tamanho_core"] = len(core)
+        estatisticas["iteracoes"] = iteracoes
+        estatisticas["celulas"] = sum(tamanhos)
+
+    selecionados = sorted(gratuitos + [ordem[k] for k in melhor_selecao])
+    valor_maximo = sum(projetos[i][1] for i in selecionados)
+    return (valor_maximo, [projetos[i][0] for i in selecionados])
+
+
+# ==============================================================================
+# FASE 12: MEMOIZAÇÃO TOP-DOWN SEM RECURSÃO
+# ==============================================================================
+
+# Marca "estado ainda não calculado" no cache: distingue a ausência de
+# qualquer valor guardado com um único get
+_AUSENTE = object()
+
+
+def memoized_iterativo_portfolio(projetos, capacidade, estatisticas=None):
+    """
+    Mesma DP Top-Down da Fase 3, sem recursão e com reconstrução da seleção.
+
+    ABORDAGEM:
+    - Continua calculando SÓ os estados (index, capacidade) alcançáveis
+      a partir de (0, C), como a memoização
+    - A pilha de chamadas vira uma pilha explícita (lista): um estado só
+      é resolvido depois que seus dois "filhos" estão no cache, então não
+      há limite de recursão, mesmo com 100 mil projetos
+    - O cache é uma lista de dicionários, um por índice: memo[i][cap].
+      Chaves int são mais baratas que tuplas (index, cap) e cada consulta
+      faz um único acesso (get com o sentinela _AUSENTE), em vez de "in"
+      seguido de "[]"
+    - Ao final, percorre os estados do cache de (0, C) em diante para
+      descobrir os projetos selecionados
+
+    COMPLEXIDADE DE TEMPO: O(estados alcançáveis) <= O(n × C)
+
+    COMPLEXIDADE DE ESPAÇO: O(estados alcançáveis) <= O(n × C)
+    - Pilha explícita: O(n) entradas
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        estatisticas: Dicionário opcional (ver Instrumentacao); recebe
+            "celulas", "acertos_memo", "falhas_memo",
+            "profundidade_maxima" (maior tamanho da pilha),
+            "bytes_tabela" e "tempos"
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+    """
+    n = len(projetos)
+    # memo[n] fica vazio: sem projetos restantes o valor é 0
+    memo = [{} for _ in range(n + 1)]
+
+    def consultar(i, cap):
+        return 0 if i == n else memo[i].get(cap, _AUSENTE)
+
+    # Com estatísticas, as consultas e a pilha são contadas; sem, o laço
+    # usa a função e a lista originais
+    inicio_fase = _inicio_fase(estatisticas)
+    if estatisticas is not None:
+        contagem = [0, 0]  # [acertos, falhas]
+        consultar_simples = consultar
+
+        def consultar(i, cap):
+            resultado = consultar_simples(i, cap)
+            contagem[resultado is _AUSENTE] += 1
+            return resultado
+
+        pilha = _PilhaContada([(0, capacidade)])
+    else:
+        pilha = [(0, capacidade)]
+    while pilha:
+        i, cap = pilha[-1]
+        if i == n:
+            pilha.pop()
+            continue
+        # O mesmo estado pode ter sido empilhado por dois pais
+        estados = memo[i]
+        if estados.get(cap, _AUSENTE) is not _AUSENTE:
+            pilha.pop()
+            continue
+
+        nome, valor, custo = projetos[i]
+        valor_sem = consultar(i + 1, cap)
+        valor_com = _AUSENTE
+        cabe = custo <= cap
+        if cabe:
+            valor_com = consultar(i + 1, cap - custo)
+
+        # Filhos ainda não resolvidos: empilha e volta a este estado depois
+        if valor_sem is _AUSENTE or (cabe and valor_com is _AUSENTE):
+            if valor_sem is _AUSENTE:
+                pilha.append((i + 1, cap))
+            if cabe and valor_com is _AUSENTE:
+                pilha.append((i + 1, cap - custo))
+            continue
+
+        if cabe and valor_com + valor > valor_sem:
+            estados[cap] = valor_com + valor
+        else:
+            estados[cap] = valor_sem
+        pilha.pop()
+
+    valor_maximo = consultar(0, capacidade)
+    if estatisticas is not None:
+        inicio_fase = _fim_fase(estatisticas, "preenchimento", inicio_fase)
+        estatisticas["acertos_memo"], estatisticas["falhas_memo"] = contagem
+        consultar = consultar_simples
+
+    # Reconstrução: segue os estados do cache a partir de (0, C)
+    projetos_selecionados = []
+    cap = capacidade
+    for i in range(n):
+        nome, valor, custo = projetos[i]
+        if custo <= cap and consultar(i + 1, cap - custo) + valor > consultar(i + 1, cap):
+            projetos_selecionados.append(nome)
+            cap -= custo
+
+    if estatisticas is not None:
+        _fim_fase(estatisticas, "reconstrucao", inicio_fase)
+        estatisticas["celulas"] = sum(len(estados) for estados in memo)
+        estatisticas["profundidade_maxima"] = pilha.maior
+        estatisticas["bytes_tabela"] = sum(sys.getsizeof(estados) for estados in memo)
+
+    return (valor_maximo, projetos_selecionados)
+
+
+# ==============================================================================
+# FASE 13: BITSET PARA SOMA DE SUBCONJUNTOS (VALOR PROPORCIONAL AO CUSTO)
+# ==============================================================================
+
+def _valor_proporcional(projetos, capacidade):
+    """
+    Verifica se todo projeto que pode entrar tem valor = k × custo, com o
+    mesmo k para todos (o caso valor == custo é k = 1).
+
+    Nesse caso maximizar o valor é maximizar as horas usadas. Projetos
+    com valor <= 0, custo zero ou custo > C não entram na verificação.
+    Só aceita valores e custos inteiros.
+    """
+    referencia = None
+    for nome, valor, custo in projetos:
+        if valor <= 0 or custo > capacidade or custo == 0:
+            continue
+        if not (isinstance(valor, int) and isinstance(custo, int)):
+            return False
+        if referencia is None:
+            referencia = (valor, custo)
+        elif valor * referencia[1] != custo * referencia[0]:
+            return False
+    return True
+
+
+def bitset_portfolio(projetos, capacidade, estatisticas=None):
+    """
+    Solução ótima para "encher a capacidade" usando um int como bitset.
+
+    ABORDAGEM:
+    - Quando valor é proporcional ao custo (ex.: valor == custo, horas
+      faturáveis), a DP vira alcançabilidade: quais totais de horas dá
+      para formar exatamente?
+    - O bit c do inteiro `alcance` diz se o total c é alcançável; cada
+      projeto faz alcance |= alcance << custo, e o Python processa 64
+      bits por operação, sem nenhuma dependência
+    - O ótimo é o maior bit ligado <= C
+    - Reconstrução: guarda o bitset a cada ~sqrt(n) projetos; de trás
+      para frente, recalcula os bitsets de um bloco a partir do ponto de
+      controle e, se o total t não era alcançável antes do projeto i,
+      então i entrou e t diminui de Custo_i
+
+    COMPLEXIDADE DE TEMPO: O(n × C / 64)
+    - Cerca do dobro disso com a reconstrução
+
+    COMPLEXIDADE DE ESPAÇO: O(sqrt(n) × C / 8) bytes
+    - Pontos de controle mais um bloco recalculado por vez
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo), com valor
+            proporcional ao custo e inteiros
+        capacidade: Capacidade máxima de Horas-Especialista
+        estatisticas: Dicionário opcional (ver Instrumentacao); recebe
+            "celulas", "bytes_tabela" e "tempos"
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+
+    Raises:
+        ValueError: Se o valor não for proporcional ao custo
+    """
+    if not _valor_proporcional(projetos, capacidade):
+        raise ValueError("bitset_portfolio exige valor proporcional ao custo "
+                         "(ex.: valor == custo), com inteiros")
+
+    inicio_fase = _inicio_fase(estatisticas)
+    gratuitos, itens = [], []
+    for i, (nome, valor, custo) in enumerate(projetos):
+        if valor <= 0 or custo > capacidade:
+            continue
+        (gratuitos if custo == 0 else itens).append(i)
+    custos = [projetos[i][2] for i in itens]
+    inicio_fase = _fim_fase(estatisticas, "preprocessamento", inicio_fase)
+
+    m = len(itens)
+    mascara = (1 << (max(capacidade, 0) + 1)) - 1
+    intervalo = max(1, math.isqrt(m))
+    progresso, a_cada = _progresso(estatisticas)
+
+    # Bitset antes do projeto k, para k múltiplo de `intervalo`
+    controles = []
+    alcance = 1
+    for k, custo in enumerate(custos):
+        if k % intervalo == 0:
+            controles.append(alcance)
+        alcance |= (alcance << custo) & mascara
+        if progresso is not None and ((k + 1) % a_cada == 0 or k + 1 == m):
+            progresso(k + 1, m, estatisticas)
+
+    total = alcance.bit_length() - 1
+    inicio_fase = _fim_fase(estatisticas, "preenchimento", inicio_fase)
+
+    selecionados = list(gratuitos)
+    for bloco in range(len(controles) - 1, -1, -1):
+        inicio = bloco * intervalo
+        fim = min(inicio + intervalo, m)
+        antes = [controles[bloco]]
+        for k in range(inicio, fim - 1):
+            antes.append(antes[-1] | (antes[-1] << custos[k]) & mascara)
+        for k in range(fim - 1, inicio - 1, -1):
+            if not antes[k - inicio] >> total & 1:
+                selecionados.append(itens[k])
+                total -= custos[k]
+
+    selecionados.sort()
+    valor_maximo = sum(projetos[i][1] for i in selecionados)
+
+    if estatisticas is not None:
+        _fim_fase(estatisticas, "reconstrucao", inicio_fase)
+        estatisticas["celulas"] = m * (max(capacidade, 0) + 1)
+        estatisticas["bytes_tabela"] = (len(controles) + intervalo) * sys.getsizeof(mascara)
+
+    return (valor_maximo, [projetos[i][0] for i in selecionados])
+
+
+# ==============================================================================
+# PRÉ-PROCESSAMENTO: REDUÇÃO DA INSTÂNCIA
+# ==============================================================================
+
+# Resultado de reduzir_instancia. Os projetos reduzidos trazem, no lugar do
+# nome, o índice do projeto original (como os trechos do Hirschberg)
+InstanciaReduzida = namedtuple(
+    "InstanciaReduzida", ["projetos", "capacidade", "fixados", "divisor", "relatorio"])
+
+
+def _custos_dominadores(valores, custos):
+    """
+    Para cada item j, soma dos custos dos itens que o dominam.
+
+    i domina j quando Custo_i <= Custo_j e Valor_i >= Valor_j, com empate
+    desfeito pela ordem (custo, -valor, índice) para que dois itens
+    iguais não se dominem mutuamente.
+
+    ABORDAGEM:
+    - Percorre os itens na ordem (custo, -valor, índice): todos os que
+      vêm antes de j têm custo <= Custo_j
+    - Uma árvore de Fenwick indexada pelo valor (decrescente) soma os
+      custos já vistos com valor >= Valor_j
+
+    COMPLEXIDADE DE TEMPO: O(n log n)
+    COMPLEXIDADE DE ESPAÇO: O(n)
+
+    Returns:
+        Lista com a soma dos custos dos dominadores de cada item
+    """
+    distintos = sorted(set(valores), reverse=True)
+    posicao = {v: k + 1 for k, v in enumerate(distintos)}
+    arvore = [0] * (len(distintos) + 1)
+    somas = [0] * len(valores)
+
+    for j in sorted(range(len(valores)), key=lambda j: (custos[j], -valores[j], j)):
+        k = posicao[valores[j]]
+        total = 0
+        while k > 0:
+            total += arvore[k]
+            k -= k & -k
+        somas[j] = total
+
+        k = posicao[valores[j]]
+        while k < len(arvore):
+            arvore[k] += custos[j]
+            k += k & -k
+
+    return somas
+
+
+def reduzir_instancia(projetos, capacidade):
+    """
+    Reduz n e C antes de qualquer solver, preservando um ótimo.
+
+    REDUÇÕES (nesta ordem):
+    1. Remove projetos com valor <= 0 ou custo > C (nunca ajudam)
+    2. Fixa os de custo zero e valor positivo (sempre entram)
+    3. Dominância: se i domina j (custo <= e valor >=), trocar j por i
+       nunca piora; quando os dominadores de j não cabem todos junto
+       com j, existe um ótimo sem j e ele é removido
+    4. Fixação por limitantes (Dembo–Hammer): se inverter a decisão
+       gulosa de j leva a um teto estritamente menor que o valor guloso,
+       todo ótimo segue a decisão gulosa de j
+    5. Limita C à soma dos custos restantes e divide custos e C pelo MDC
+       dos custos (todo subconjunto custa um múltiplo do MDC)
+
+    As reduções 3 a 5 comparam somas de custos com C e só são aplicadas
+    com valores e custos inteiros; com float, o arredondamento de uma
+    soma poderia descartar uma solução que cabe exatamente.
+
+    COMPLEXIDADE DE TEMPO: O(n log n)
+    COMPLEXIDADE DE ESPAÇO: O(n)
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+
+    Returns:
+        InstanciaReduzida com:
+        - projetos: tuplas (índice_original, valor, custo_reduzido)
+        - capacidade: capacidade reduzida
+        - fixados: índices originais que entram em qualquer caso
+        - divisor: MDC pelo qual custos e capacidade foram divididos
+        - relatorio: contagens de cada redução e tamanhos antes/depois
+    """
+    relatorio = {
+        "n_original": len(projetos),
+        "capacidade_original": capacidade,
+        "removidos_valor": 0,
+        "removidos_custo": 0,
+        "fixados_custo_zero": 0,
+        "removidos_dominancia": 0,
+        "fixados_dentro": 0,
+        "fixados_fora": 0,
+    }
+
+    # 1 e 2: filtros simples
+    fixados = []
+    candidatos = []
+    for i, (nome, valor, custo) in enumerate(projetos):
+        if valor <= 0:
+            relatorio["removidos_valor"] += 1
+        elif custo > capacidade:
+            relatorio["removidos_custo"] += 1
+        elif custo == 0:
+            fixados.append(i)
+        else:
+            candidatos.append(i)
+    relatorio["fixados_custo_zero"] = len(fixados)
+
+    inteiros = isinstance(capacidade, int) and all(
+        isinstance(projetos[i][1], int) and isinstance(projetos[i][2], int)
+        for i in candidatos)
+
+    # 3: dominância
+    livres = candidatos
+    if inteiros:
+        somas = _custos_dominadores([projetos[i][1] for i in candidatos],
+                                    [projetos[i][2] for i in candidatos])
+        livres = [i for i, soma in zip(candidatos, somas)
+                  if soma + projetos[i][2] <= capacidade]
+        relatorio["removidos_dominancia"] = len(candidatos) - len(livres)
+
+    # 4: fixação de variáveis pelos limitantes de Dembo–Hammer
+    if inteiros and livres:
+        ordem = sorted(livres, key=lambda i: projetos[i][1] / projetos[i][2], reverse=True)
+        valores = [projetos[i][1] for i in ordem]
+        custos = [projetos[i][2] for i in ordem]
+        b, limites = _limites_dembo_hammer(valores, custos, capacidade, True)
+
+        # Limitante inferior: o guloso que continua após o item de quebra
+        guloso = 0
+        cap = capacidade
+        for valor, custo in zip(valores, custos):
+            if custo <= cap:
+                cap -= custo
+                guloso += valor
+
+        livres = []
+        for k, i in enumerate(ordem):
+            if b < len(ordem) and limites[k] >= guloso:
+                livres.append(i)
+            elif k < b:
+                fixados.append(i)
+                relatorio["fixados_dentro"] += 1
+            else:
+                relatorio["fixados_fora"] += 1
+        livres.sort()
+
+    # 5: capacidade residual, limite pela soma dos custos e MDC
+    residual = capacidade - sum(projetos[i][2] for i in fixados)
+    restantes = [i for i in livres if projetos[i][2] <= residual]
+    relatorio["removidos_custo"] += len(livres) - len(restantes)
+
+    divisor = 1
+    if inteiros:
+        residual = max(0, min(residual, sum(projetos[i][2] for i in restantes)))
+        if restantes:
+            divisor = 0
+            for i in restantes:
+                divisor = math.gcd(divisor, projetos[i][2])
+            residual //= divisor
+
+    reduzidos = [(i, projetos[i][1], projetos[i][2] // divisor if divisor > 1 else projetos[i][2])
+                 for i in restantes]
+    fixados.sort()
+
+    celulas_antes = len(projetos) * (capacidade + 1) if capacidade >= 0 else 0
+    celulas_depois = len(reduzidos) * (residual + 1)
+    relatorio.update({
+        "n_reduzido": len(reduzidos),
+        "capacidade_reduzida": residual,
+        "divisor": divisor,
+        "reducao_celulas": 1 - celulas_depois / celulas_antes if celulas_antes else 0.0,
+    })
+
+    return InstanciaReduzida(reduzidos, residual, fixados, divisor, relatorio)
+
+
+def reduzido_portfolio(projetos, capacidade, solver="auto", estatisticas=None, **opcoes):
+    """
+    Reduz a instância (ver reduzir_instancia), resolve e traduz de volta.
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        solver: Nome em SOLVERS ou a própria função do solver
+        estatisticas: Dicionário opcional; recebe o relatório da redução
+            (e as estatísticas do solver, se ele aceitar)
+        **opcoes: Argumentos extras repassados ao solver
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados), com os nomes
+        originais na ordem original
+    """
+    funcao = SOLVERS[solver] if isinstance(solver, str) else solver
+    reducao = reduzir_instancia(projetos, capacidade)
+
+    if estatisticas is not None:
+        estatisticas.update(reducao.relatorio)
+        if "estatisticas" in inspect.signature(funcao).parameters:
+            opcoes["estatisticas"] = estatisticas
+
+    # Mesmo sem projetos restantes o solver roda (em tempo constante), para
+    # que as estatísticas tenham sempre as mesmas chaves
+    _, indices = funcao(reducao.projetos, reducao.capacidade, **opcoes)
+
+    selecionados = sorted(reducao.fixados + list(indices))
+    valor_maximo = sum(projetos[i][1] for i in selecionados)
+    return (valor_maximo, [projetos[i][0] for i in selecionados])
+
+
+# ==============================================================================
+# SELEÇÃO AUTOMÁTICA DO SOLVER
+# ==============================================================================
+
+# Acima deste número de células nenhuma tabela é considerada viável
+LIMITE_CELULAS_DP = 50_000_000
+
+# Branch-and-Bound só é escolhido automaticamente até este número de projetos;
+# acima dele, sem tabela viável, o auto usa o core_portfolio
+LIMITE_PROJETOS_BB = 1_000
+
+
+def escolher_solver(projetos, capacidade):
+    """
+    Decide qual solver exato é mais barato para a instância.
+
+    REGRAS:
+    - Se o valor é proporcional ao custo (soma de subconjuntos) e o bitset
+      tem até LIMITE_CELULAS_DP palavras de 64 bits de trabalho, usa o
+      bitset_portfolio
+    - Compara o tamanho da tabela indexada por capacidade, n × (C + 1),
+      com o da tabela indexada por valor, n × (V + 1), V = soma dos valores
+      (só quando os valores são inteiros)
+    - Usa a menor das duas, desde que tenha até LIMITE_CELULAS_DP células
+    - Se mesmo a menor passa de LIMITE_CELULAS_DP, nunca aloca a tabela:
+      - n <= LIMITE_PROJETOS_BB: Branch-and-Bound, que não depende de C
+        nem de V
+      - n maior: core_portfolio, cuja memória é O(n) mais a fronteira de
+        pareto de um núcleo em torno do item de quebra (também sem
+        depender de C ou V); no pior caso o núcleo cresce até n
+
+    Returns:
+        "bitset", "dp_bottom_up", "dp_por_valor", "branch_and_bound" ou
+        "core"
+    """
+    n = len(projetos)
+    celulas_capacidade = n * (capacidade + 1)
+
+    if (n and celulas_capacidade // 64 <= LIMITE_CELULAS_DP
+            and _valor_proporcional(projetos, capacidade)):
+        return "bitset"
+
+    celulas_valor = None
+    if all(isinstance(valor, int) for _, valor, _ in projetos):
+        soma_valores = sum(valor for _, valor, custo in projetos
+                           if valor > 0 and custo <= capacidade)
+        celulas_valor = n * (soma_valores + 1)
+
+    if celulas_valor is not None and celulas_valor < celulas_capacidade:
+        escolhido, celulas = "dp_por_valor", celulas_valor
+    else:
+        escolhido, celulas = "dp_bottom_up", celulas_capacidade
+
+    if celulas <= LIMITE_CELULAS_DP:
+        return escolhido
+    if n <= LIMITE_PROJETOS_BB:
+        return "branch_and_bound"
+    return "core"
+
+
+def auto_portfolio(projetos, capacidade, backend="python", estatisticas=None, reduzir=True):
+    """
+    Resolve a instância com o solver exato mais adequado (ver escolher_solver).
+
+    Por padrão a instância passa antes por reduzir_instancia, e a escolha
+    do solver já considera o n e o C reduzidos.
+
+    A tabela indexada por capacidade usa o modo "bits", que reconstrói a
+    mesma seleção do dp_bottom_up_portfolio com uma fração da memória.
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        backend: "python" ou "numpy" (para os solvers de tabela)
+        estatisticas: Dicionário opcional; recebe "solver" com o nome do
+            solver usado, o relatório da redução e as estatísticas do
+            próprio solver
+        reduzir: Aplica o pré-processamento de reduzir_instancia
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+    """
+    if reduzir:
+        return reduzido_portfolio(projetos, capacidade, auto_portfolio, estatisticas,
+                                  backend=backend, reduzir=False)
+
+    solver = escolher_solver(projetos, capacidade)
+    if estatisticas is not None:
+        estatisticas["solver"] = solver
+
+    if solver == "dp_por_valor":
+        return dp_por_valor_portfolio(projetos, capacidade, backend=backend,
+                                      estatisticas=estatisticas)
+    if solver == "branch_and_bound":
+        return branch_and_bound_portfolio(projetos, capacidade, estatisticas=estatisticas)
+    if solver == "bitset":
+        return bitset_portfolio(projetos, capacidade, estatisticas=estatisticas)
+    if solver == "core":
+        return core_portfolio(projetos, capacidade, estatisticas=estatisticas)
+    return dp_bottom_up_portfolio(projetos, capacidade, backend=backend, modo="bits",
+                                  estatisticas=estatisticas)
+
+
+# Solvers exatos por nome; todos retornam (valor_maximo, projetos_selecionados)
+SOLVERS = {
+    "auto": auto_portfolio,
+    "dp_bottom_up": dp_bottom_up_portfolio,
+    "hirschberg": dp_hirschberg_portfolio,
+    "dp_por_valor": dp_por_valor_portfolio,
+    "branch_and_bound": branch_and_bound_portfolio,
+    "pareto": pareto_portfolio,
+    "meet_in_the_middle": meet_in_the_middle_portfolio,
+    "core": core_portfolio,
+    "memoizado_iterativo": memoized_iterativo_portfolio,
+    "bitset": bitset_portfolio,
+}
+
+
+# ==============================================================================
+# INSTRUMENTAÇÃO DOS SOLVERS
+# ==============================================================================
+
+class Instrumentacao(dict):
+    """
+    Estatísticas de execução aceitas por todos os solvers em `estatisticas`.
+
+    É um dicionário comum; cada solver preenche as chaves que conhece:
+    - "celulas": células da tabela ou estados avaliados
+    - "acertos_memo" / "falhas_memo": consultas ao cache da memoização
+    - "profundidade_maxima": maior profundidade da recursão ou da pilha
+    - "bytes_tabela": bytes das tabelas, linhas ou bits de decisão
+    - "tempos": segundos por fase ("preprocessamento", "preenchimento",
+      "reconstrucao")
+
+    Além disso, guarda um callback opcional chamado como
+    progresso(linhas_feitas, total_linhas, estatisticas) a cada `a_cada`
+    linhas das DPs por linhas (e sempre na última).
+
+    Sem `estatisticas` (o padrão), os solvers não medem nada: os contadores
+    e relógios ficam fora dos laços internos ou em caminhos separados.
+    """
+
+    def __init__(self, progresso=None, a_cada=1000):
+        super().__init__()
+        self.progresso = progresso
+        self.a_cada = max(1, a_cada)
+
+
+class _MemoContado(dict):
+    """
+    Cache da memoização que conta acertos e falhas dos testes "in".
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.acertos = 0
+        self.falhas = 0
+
+    def __contains__(self, chave):
+        if dict.__contains__(self, chave):
+            self.acertos += 1
+            return True
+        self.falhas += 1
+        return False
+
+
+class _PilhaContada(list):
+    """
+    Lista usada como pilha que registra o maior tamanho atingido.
+    """
+
+    def __init__(self, itens=()):
+        super().__init__(itens)
+        self.maior = len(self)
+
+    def append(self, item):
+        list.append(self, item)
+        if len(self) > self.maior:
+            self.maior = len(self)
+
+
+def _inicio_fase(estatisticas):
+    """
+    Instante de início de uma fase, ou None sem estatísticas.
+    """
+    return time.perf_counter() if estatisticas is not None else None
+
+
+def _fim_fase(estatisticas, fase, inicio):
+    """
+    Soma o tempo desde `inicio` em estatisticas["tempos"][fase].
+
+    Returns:
+        O instante atual (início da próxima fase), ou None sem estatísticas
+    """
+    if estatisticas is None:
+        return None
+    agora = time.perf_counter()
+    tempos = estatisticas.setdefault("tempos", {})
+    tempos[fase] = tempos.get(fase, 0.0) + agora - inicio
+    return agora
+
+
+def _progresso(estatisticas):
+    """
+    Callback de progresso e intervalo em linhas, ou (None, 0).
+    """
+    progresso = getattr(estatisticas, "progresso", None)
+    if progresso is None:
+        return None, 0
+    return progresso, estatisticas.a_cada
+
+
+def _bytes_linha(linha):
+    """
+    Bytes de uma linha de DP: array NumPy ou lista de referências.
+    """
+    if np is not None and isinstance(linha, np.ndarray):
+        return linha.nbytes
+    return sys.getsizeof(linha)
+
+
+def instrumentar(solver, projetos, capacidade, progresso=None, a_cada=1000,
+                 memoria=False, **opcoes):
+    """
+    Resolve com instrumentação e devolve também as estatísticas.
+
+    Args:
+        solver: Nome em SOLVERS ou a própria função do solver
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        progresso: Callback progresso(linhas_feitas, total, estatisticas)
+        a_cada: Intervalo, em linhas, entre chamadas do callback
+        memoria: Mede o pico de memória com tracemalloc (mais lento)
+        **opcoes: Argumentos extras repassados ao solver
+
+    Returns:
+        Tupla (resultado_do_solver, Instrumentacao), com "tempo_total" e,
+        se memoria=True, "memoria_pico_bytes"
+    """
+    funcao = SOLVERS[solver] if isinstance(solver, str) else solver
+    estatisticas = Instrumentacao(progresso, a_cada)
+    if "estatisticas" in inspect.signature(funcao).parameters:
+        opcoes["estatisticas"] = estatisticas
+
+    ja_rastreando = tracemalloc.is_tracing()
+    if memoria:
+        if not ja_rastreando:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+
+    inicio = time.perf_counter()
+    try:
+        resultado = funcao(projetos, capacidade, **opcoes)
+    finally:
+        estatisticas["tempo_total"] = time.perf_counter() - inicio
+        if memoria:
+            estatisticas["memoria_pico_bytes"] = tracemalloc.get_traced_memory()[1]
+            if not ja_rastreando:
+                tracemalloc.stop()
+
+    return resultado, estatisticas
+
+
+# ==============================================================================
+# CONSULTAS POR CAPACIDADE: RESOLVER UMA VEZ, RESPONDER TODAS
+# ==============================================================================
+
+class PortfolioResolvido:
+    """
+    Instância resolvida que responde consultas para qualquer capacidade c <= C.
+
+    A última linha da tabela T do bottom-up já tem o ótimo de TODAS as
+    capacidades até C; guardando também os bits de decisão (modo "bits"),
+    a seleção de qualquer c sai do mesmo backtracking. Assim, uma varredura
+    "80, 90, 100 ... horas" custa uma solução completa em vez de N.
+
+    COMPLEXIDADE DE TEMPO:
+    - Construção: O(n × C), uma única vez
+    - melhor_valor(c): O(1)
+    - selecao(c): O(n)
+
+    COMPLEXIDADE DE ESPAÇO: O(C) valores + n × (C+1) / 8 bytes de decisões
+
+    Exemplo:
+        resolvido = PortfolioResolvido(projetos, 100)
+        for horas in range(80, 101, 10):
+            print(horas, resolvido.melhor_valor(horas), resolvido.selecao(horas))
+    """
+
+    def __init__(self, projetos, capacidade, backend="python"):
+        """
+        Args:
+            projetos: Lista de tuplas (nome, valor, custo)
+            capacidade: Maior capacidade que será consultada
+            backend: "python" ou "numpy" (ver dp_bottom_up_portfolio)
+        """
+        self.projetos = list(projetos)
+        self.capacidade = capacidade
+
+        dtype = _dtype_numpy(self.projetos, backend)
+        linha, self._decisoes = _decisoes_bits(self.projetos, capacidade, dtype)
+        # Guarda como lista de int para as respostas não dependerem do backend
+        self._linha = linha.tolist() if dtype is not None else linha
+
+    def _validar(self, c):
+        if not 0 <= c <= self.capacidade:
+            raise ValueError(f"Capacidade {c} fora do intervalo [0, {self.capacidade}]")
+
+    def melhor_valor(self, c):
+        """
+        Valor máximo com capacidade c (equivale a T[n][c]).
+        """
+        self._validar(c)
+        return self._linha[c]
+
+    def selecao(self, c):
+        """
+        Projetos selecionados na solução ótima com capacidade c.
+        """
+        self._validar(c)
+        return _reconstruir_bits(self.projetos, self._decisoes, c)
+
+    def resolver(self, c):
+        """
+        Mesmo retorno de dp_bottom_up_portfolio(projetos, c).
+        """
+        return (self.melhor_valor(c), self.selecao(c))
+
+    def curva(self):
+        """
+        Curva valor × capacidade: lista com o ótimo de cada c em 0..C.
+        """
+        return list(self._linha[:self.capacidade + 1])
+
+
+# ==============================================================================
+# RESOLUÇÃO INCREMENTAL (PROJETOS ENTRANDO E SAINDO)
+# ==============================================================================
+
+class _PilhaMochila:
+    """
+    Pilha de projetos com as linhas da DP de cada prefixo da pilha.
+
+    linhas[k] é o ótimo dos k projetos de baixo, para toda capacidade, e
+    decisoes[k] os bits do projeto k. Empilhar custa uma linha, O(C);
+    desempilhar só descarta a linha do topo.
+    """
+
+    def __init__(self, linha_vazia):
+        self.projetos = []
+        self.linhas = [linha_vazia]
+        self.decisoes = []
+
+    def __len__(self):
+        return len(self.projetos)
+
+    @property
+    def topo(self):
+        return self.linhas[-1]
+
+    def empilhar(self, projeto):
+        nome, valor, custo = projeto
+        linha, bits = _passo_bits(self.linhas[-1], valor, custo)
+        self.projetos.append(projeto)
+        self.linhas.append(linha)
+        self.decisoes.append(bits)
+
+    def desempilhar(self):
+        self.linhas.pop()
+        self.decisoes.pop()
+        return self.projetos.pop()
+
+    def selecao(self, c):
+        """
+        Nomes escolhidos na pilha para a capacidade c, de baixo para cima.
+        """
+        return _reconstruir_bits(self.projetos, self.decisoes, c)
+
+    def expandir(self, largura, nova_largura, usar_numpy):
+        """
+        Acrescenta as colunas largura+1..nova_largura em todas as linhas.
+
+        A coluna c da linha i depende apenas das colunas c e c - Custo_i
+        da linha i - 1, então as colunas antigas não mudam.
+        """
+        inicio = largura + 1
+        extra = nova_largura - largura
+        tamanho_bits = (nova_largura + 8) // 8
+
+        if usar_numpy:
+            self.linhas[0] = np.concatenate(
+                [self.linhas[0], np.zeros(extra, dtype=np.int64)])
+        else:
+            self.linhas[0] = self.linhas[0] + [0] * extra
+
+        for i, (nome, valor, custo) in enumerate(self.projetos):
+            anterior = self.linhas[i]
+            # Nas colunas novas c < custo o projeto não cabe
+            a = min(max(inicio, custo), nova_largura + 1)
+            sem = anterior[a:]
+            # Se o projeto não cabe em nenhuma coluna nova, ambas ficam vazias
+            com = anterior[a - custo:nova_largura + 1 - custo] if a <= nova_largura else sem
+
+            if usar_numpy:
+                tomar = com + valor > sem
+                novas = np.concatenate(
+                    [anterior[inicio:a], np.where(tomar, com + valor, sem)])
+                self.linhas[i + 1] = np.concatenate([self.linhas[i + 1], novas])
+                tomar = tomar.tolist()
+            else:
+                tomar = [cm + valor > sm for sm, cm in zip(sem, com)]
+                novas = anterior[inicio:a] + [
+                    cm + valor if t else sm for sm, cm, t in zip(sem, com, tomar)]
+                self.linhas[i + 1] = self.linhas[i + 1] + novas
+
+            # Junta os bits antigos com os das colunas novas
+            bits = int.from_bytes(self.decisoes[i], "little")
+            if tomar:
+                bits |= int.from_bytes(
+                    _compactar_decisoes(tomar, a, nova_largura), "little")
+            self.decisoes[i] = bits.to_bytes(tamanho_bits, "little")
+
+
+class PortfolioIncremental(PortfolioResolvido):
+    """
+    Mantém a solução ótima atualizada enquanto a lista de projetos muda.
+
+    ABORDAGEM (fila de mochila com duas pilhas):
+    - Os projetos ficam em duas pilhas de linhas da DP: a "antiga" guarda
+      a metade mais velha, com o projeto mais antigo no topo, e a "nova"
+      guarda o resto, com o mais recente no topo. Cada pilha guarda a
+      linha de cada prefixo seu (como as linhas prefixadas do bottom-up)
+    - O ótimo com capacidade c combina os dois topos:
+      max_a Antiga[a] + Nova[c - a], em O(c) (o mesmo das linhas
+      prefixo/sufixo de sensibilidade_portfolio)
+    - adicionar(): empilha na pilha nova, O(C)
+    - remover(): desempilha só os projetos ACIMA do removido, na sua
+      pilha, e os empilha de volta. O mais antigo e o mais recente estão
+      nos topos e saem em O(C)
+    - Quando o removido está mais fundo que a metade dos projetos (ex.: a
+      pilha antiga esvaziou e o mais antigo está no fundo da nova), as
+      duas pilhas são refeitas com metade dos projetos cada, em
+      O(n × C). Depois disso são precisas ~n/2 remoções pelas pontas
+      para esvaziar uma pilha de novo, então o custo amortizado de remover
+      pela frente (janela deslizante) ou por trás é O(C)
+    - selecao(c): acha a divisão a da capacidade e faz o backtracking de
+      cada pilha com a sua parte
+    - alterar_capacidade(): reduzir é só consulta; aumentar calcula apenas
+      as colunas novas de cada linha, pois as colunas <= C antigo não mudam
+
+    COMPLEXIDADE DE TEMPO:
+    - adicionar: O(C)
+    - remover o k-ésimo (na ordem de chegada) de n projetos:
+      O(min(k, n - 1 - k) × C), amortizado O(C) para o mais antigo ou o
+      mais recente; no pior caso (o do meio) O(n/2 × C), contra
+      O((n - k) × C) de recalcular as linhas depois dele
+    - melhor_valor(c): O(c); selecao(c): O(c + n)
+    - curva(): O(C²) na primeira chamada após cada mudança (combina as
+      duas linhas inteiras), depois O(C)
+    - aumentar a capacidade de C para C': O(n × (C' - C))
+
+    COMPLEXIDADE DE ESPAÇO: O(n × C)
+
+    O atributo linhas_calculadas conta as linhas da DP calculadas até
+    agora e mostra o trabalho real de cada operação.
+
+    Exemplo:
+        carteira = PortfolioIncremental(100)
+        carteira.adicionar(("Website", 50, 10))
+        carteira.adicionar(("API", 20, 4))
+        carteira.remover("Website")
+        valor, selecionados = carteira.resolver(100)
+    """
+
+    def __init__(self, capacidade, projetos=(), backend="python"):
+        """
+        Args:
+            capacidade: Capacidade máxima de Horas-Especialista
+            projetos: Projetos iniciais, tuplas (nome, valor, custo)
+            backend: "python" ou "numpy"; no NumPy os valores devem ser
+                inteiros e as linhas usam int64
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend desconhecido: {backend!r} (use {BACKENDS})")
+        self.capacidade = capacidade
+        self._largura = capacidade
+        self._usar_numpy = backend == "numpy" and np is not None
+        self.linhas_calculadas = 0
+        self._curva = None
+
+        projetos = list(projetos)
+        for nome, valor, custo in projetos:
+            self._verificar(nome, valor)
+        self._refazer(projetos)
+
+    def _linha_vazia(self):
+        if self._usar_numpy:
+            return np.zeros(self._largura + 1, dtype=np.int64)
+        return [0] * (self._largura + 1)
+
+    def _verificar(self, nome, valor):
+        if self._usar_numpy and not isinstance(valor, int):
+            raise ValueError(f"Backend NumPy exige valores inteiros: {nome!r}")
+
+    def _empilhar(self, pilha, projeto):
+        pilha.empilhar(projeto)
+        self.linhas_calculadas += 1
+
+    def _refazer(self, projetos):
+        """
+        Reconstrói as duas pilhas com metade dos projetos cada, O(n × C).
+        """
+        metade = len(projetos) // 2
+        self._antiga = _PilhaMochila(self._linha_vazia())
+        self._nova = _PilhaMochila(self._linha_vazia())
+        # O mais antigo por último, para ficar no topo
+        for projeto in reversed(projetos[:metade]):
+            self._empilhar(self._antiga, projeto)
+        for projeto in projetos[metade:]:
+            self._empilhar(self._nova, projeto)
+        self._curva = None
+
+    @property
+    def projetos(self):
+        """
+        Projetos ativos, na ordem de chegada.
+        """
+        return self._antiga.projetos[::-1] + self._nova.projetos
+
+    @property
+    def _linha(self):
+        # PortfolioResolvido.curva consulta a linha combinada das pilhas
+        if self._curva is None:
+            antiga, nova = self._antiga.topo, self._nova.topo
+            if not self._antiga or not self._nova:
+                linha = nova if not self._antiga else antiga
+                self._curva = linha.tolist() if self._usar_numpy else list(linha)
+            else:
+                self._curva = [_combinar_linhas(antiga, nova, c)
+                               for c in range(self._largura + 1)]
+        return self._curva
+
+    def _dividir(self, c):
+        """
+        Melhor divisão da capacidade c entre as pilhas: (valor, parte_antiga).
+        """
+        antiga, nova = self._antiga.topo, self._nova.topo
+        if not self._antiga:
+            return (nova[c], 0)
+        if not self._nova:
+            return (antiga[c], c)
+        if self._usar_numpy:
+            somas = antiga[:c + 1] + nova[c::-1]
+            a = int(somas.argmax())
+            return (somas[a], a)
+        return max(((antiga[a] + nova[c - a], a) for a in range(c + 1)),
+                   key=lambda par: par[0])
+
+    def melhor_valor(self, c):
+        self._validar(c)
+        if self._curva is not None:
+            return self._curva[c]
+        valor, _ = self._dividir(c)
+        return int(valor) if self._usar_numpy else valor
+
+    def selecao(self, c):
+        self._validar(c)
+        _, a = self._dividir(c)
+        # Devolve na ordem de chegada; nomes repetidos contam uma vez por projeto
+        restantes = Counter(self._antiga.selecao(a) + self._nova.selecao(c - a))
+        selecionados = []
+        for nome, valor, custo in self.projetos:
+            if restantes[nome] > 0:
+                restantes[nome] -= 1
+                selecionados.append(nome)
+        return selecionados
+
+    def __len__(self):
+        return len(self._antiga) + len(self._nova)
+
+    def adicionar(self, projeto):
+        """
+        Adiciona um projeto (nome, valor, custo) calculando uma linha, O(C).
+        """
+        nome, valor, custo = projeto
+        self._verificar(nome, valor)
+        self._empilhar(self._nova, (nome, valor, custo))
+        self._curva = None
+
+    def remover(self, nome):
+        """
+        Remove o (primeiro) projeto com este nome.
+
+        Recalcula só os projetos acima dele na sua pilha: d linhas de O(C),
+        com d = min(k, n - 1 - k) para o k-ésimo projeto. Se d passar da
+        metade de n, refaz as pilhas equilibradas (n linhas) antes.
+
+        Raises:
+            ValueError: Se não houver projeto com esse nome
+        """
+        ordem = self.projetos
+        for k, projeto in enumerate(ordem):
+            if projeto[0] == nome:
+                break
+        else:
+            raise ValueError(f"Projeto {nome!r} não encontrado")
+
+        n = len(ordem)
+        if k < len(self._antiga):
+            pilha, profundidade = self._antiga, k
+        else:
+            pilha, profundidade = self._nova, n - 1 - k
+
+        if profundidade > n // 2:
+            # Pilhas desequilibradas: refaz com metade em cada uma
+            self._refazer(ordem[:k] + ordem[k + 1:])
+            return
+
+        acima = [pilha.desempilhar() for _ in range(profundidade)]
+        pilha.desempilhar()
+        for projeto in reversed(acima):
+            self._empilhar(pilha, projeto)
+        self._curva = None
+
+    def alterar_capacidade(self, nova_capacidade):
+        """
+        Muda a capacidade sem recalcular as colunas já existentes.
+
+        - Reduzir (ou voltar a um valor já calculado) é só consulta: as
+          linhas guardadas já têm todas as colunas menores
+        - Aumentar calcula somente as colunas novas, linha por linha
+        """
+        if nova_capacidade < 0:
+            raise ValueError(f"Capacidade inválida: {nova_capacidade}")
+
+        if nova_capacidade > self._largura:
+            for pilha in (self._antiga, self._nova):
+                pilha.expandir(self._largura, nova_capacidade, self._usar_numpy)
+            self._largura = nova_capacidade
+            self._curva = None
+        self.capacidade = nova_capacidade
+
+
+# ==============================================================================
+# ANÁLISE DE SENSIBILIDADE POR PROJETO
+# ==============================================================================
+
+# Uma linha do relatório de sensibilidade_portfolio. otimo_com e perda_com
+# são None quando o projeto sozinho já não cabe na capacidade
+SensibilidadeProjeto = namedtuple(
+    "SensibilidadeProjeto",
+    ["nome", "valor", "custo", "otimo_sem", "otimo_com", "perda_sem", "perda_com"])
+
+
+def _somar_projeto(linha, valor, custo):
+    """
+    Nova linha da DP depois de considerar um projeto; a recebida não muda.
+    """
+    if np is not None and isinstance(linha, np.ndarray):
+        return _atualizar_linha_numpy(linha.copy(), valor, custo)
+    if custo > len(linha) - 1:
+        return linha
+    return linha[:custo] + [
+        sem if sem >= com + valor else com + valor
+        for sem, com in zip(linha[custo:], linha)
+    ]
+
+
+def _combinar_linhas(prefixo, sufixo, capacidade):
+    """
+    Melhor divisão da capacidade: max de prefixo[c] + sufixo[capacidade - c].
+    """
+    if np is not None and isinstance(prefixo, np.ndarray):
+        return int((prefixo[:capacidade + 1] + sufixo[capacidade::-1]).max())
+    return max(f + b for f, b in zip(prefixo, reversed(sufixo[:capacidade + 1])))
+
+
+def sensibilidade_portfolio(projetos, capacidade, backend="python"):
+    """
+    Para cada projeto: o ótimo sem ele e o ótimo obrigando-o a entrar.
+
+    ABORDAGEM:
+    - F_i = linha da DP com os projetos antes de i (prefixo)
+    - B_i = linha da DP com os projetos depois de i (sufixo)
+    - Ótimo sem i:  max_c F_i[c] + B_i[C - c]
+    - Ótimo com i:  Valor_i + max_c F_i[c] + B_i[C - Custo_i - c]
+    - Os sufixos são calculados de trás para frente guardando um ponto
+      de controle a cada ~sqrt(n) projetos; na varredura para frente,
+      cada bloco de sufixos é recalculado a partir do seu ponto de
+      controle, enquanto o prefixo avança um projeto por vez
+
+    Rodar dp_bottom_up_portfolio n vezes custaria O(n² × C); aqui cada
+    projeto custa O(C) além das linhas.
+
+    COMPLEXIDADE DE TEMPO: O(n × C)
+    - Cerca de 3 passadas de linhas (sufixos, recálculo, prefixos) mais
+      2 combinações de O(C) por projeto
+
+    COMPLEXIDADE DE ESPAÇO: O(sqrt(n) × C)
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        backend: "python" ou "numpy" (ver dp_bottom_up_portfolio)
+
+    Returns:
+        Tupla (otimo, tabela, criticos):
+        - otimo: valor máximo da instância completa
+        - tabela: uma SensibilidadeProjeto por projeto, na ordem original;
+          perda_sem = otimo - otimo_sem e perda_com = otimo - otimo_com
+        - criticos: nomes dos projetos presentes em TODO ótimo
+          (perda_sem > 0), da maior para a menor perda
+    """
+    if capacidade < 0:
+        raise ValueError(f"Capacidade negativa: {capacidade}")
+
+    dtype = _dtype_numpy(projetos, backend)
+    zeros = np.zeros(capacidade + 1, dtype=dtype) if dtype is not None else [0] * (capacidade + 1)
+    n = len(projetos)
+    intervalo = max(1, math.isqrt(n))
+
+    # controles[s] = linha da DP com projetos[s:], para s múltiplo do
+    # intervalo (e s = n)
+    controles = {n: zeros}
+    linha = zeros
+    for i in range(n - 1, -1, -1):
+        nome, valor, custo = projetos[i]
+        linha = _somar_projeto(linha, valor, custo)
+        if i % intervalo == 0:
+            controles[i] = linha
+    otimo = int(linha[capacidade]) if dtype is not None else linha[capacidade]
+
+    tabela = []
+    prefixo = zeros
+    for inicio in range(0, n, intervalo):
+        fim = min(inicio + intervalo, n)
+
+        # sufixos[j - inicio] = linha da DP com projetos[j + 1:]
+        sufixos = [None] * (fim - inicio)
+        linha = controles[fim]
+        for j in range(fim - 1, inicio - 1, -1):
+            sufixos[j - inicio] = linha
+            nome, valor, custo = projetos[j]
+            linha = _somar_projeto(linha, valor, custo)
+
+        for j in range(inicio, fim):
+            nome, valor, custo = projetos[j]
+            sufixo = sufixos[j - inicio]
+            otimo_sem = _combinar_linhas(prefixo, sufixo, capacidade)
+            otimo_com = None
+            if custo <= capacidade:
+                otimo_com = valor + _combinar_linhas(prefixo, sufixo, capacidade - custo)
+            tabela.append(SensibilidadeProjeto(
+                nome, valor, custo, otimo_sem, otimo_com, otimo - otimo_sem,
+                None if otimo_com is None else otimo - otimo_com))
+            prefixo = _somar_projeto(prefixo, valor, custo)
+
+    criticos = sorted((p for p in tabela if p.perda_sem > 0), key=lambda p: -p.perda_sem)
+    return otimo, tabela, [p.nome for p in criticos]
+
+
+# ==============================================================================
+# K MELHORES PORTFÓLIOS
+# ==============================================================================
+
+def _mesclar_k(sem, com, valor, indice, k):
+    """
+    Une a lista "sem o projeto" com a lista "com o projeto" (cada uma já
+    em ordem decrescente de valor), mantendo as k primeiras.
+
+    Cada entrada é (valor, no); no é uma lista ligada persistente
+    (indice, no_anterior), então "tomar o projeto" cria um único nó que
+    compartilha o resto da seleção. Em empate, a entrada sem o projeto
+    vem primeiro.
+    """
+    # Nada do "com" entra: a lista anterior continua valendo (sem cópia)
+    if len(sem) >= k and (not com or com[0][0] + valor <= sem[k - 1][0]):
+        return sem
+
+    resultado = []
+    i = j = 0
+    while len(resultado) < k:
+        if i < len(sem):
+            if j < len(com) and com[j][0] + valor > sem[i][0]:
+                entrada = com[j]
+                resultado.append((entrada[0] + valor, (indice, entrada[1])))
+                j += 1
+            else:
+                resultado.append(sem[i])
+                i += 1
+        elif j < len(com):
+            entrada = com[j]
+            resultado.append((entrada[0] + valor, (indice, entrada[1])))
+            j += 1
+        else:
+            break
+    return resultado
+
+
+def k_melhores_portfolio(projetos, capacidade, k=10, estatisticas=None):
+    """
+    Os k melhores portfólios distintos, do maior para o menor valor.
+
+    ABORDAGEM:
+    - Mesma DP bottom-up, mas cada capacidade c guarda as k melhores
+      seleções de custo <= c (não só a melhor)
+    - Ao considerar o projeto i, a lista de c é a fusão de
+      lista[c] (sem i) com lista[c - Custo_i] + Valor_i (com i): as duas
+      não têm seleção em comum, então nunca surgem duplicatas
+    - As seleções são listas ligadas persistentes: tomar um projeto cria
+      um nó (indice, anterior) que compartilha o restante
+
+    Empates são resolvidos de forma determinística: entre seleções de
+    mesmo valor, vem antes a que NÃO contém o maior índice em que as
+    duas diferem (a ordem dos projetos na entrada decide).
+
+    COMPLEXIDADE DE TEMPO: O(n × C × k)
+
+    COMPLEXIDADE DE ESPAÇO: O(C × k) entradas vivas
+    - Mais os nós das seleções ainda referenciadas (no máximo n por
+      seleção, compartilhados entre elas)
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo)
+        capacidade: Capacidade máxima de Horas-Especialista
+        k: Quantidade de portfólios desejada
+        estatisticas: Dicionário opcional (ou Instrumentacao) que recebe
+            "celulas" (entradas de lista calculadas)
+
+    Returns:
+        Lista com até k tuplas (valor, projetos_selecionados), em ordem
+        decrescente de valor; menos de k se não houver tantas seleções
+        viáveis. A primeira é um ótimo de dp_bottom_up_portfolio.
+
+    Raises:
+        ValueError: Se k < 1 ou a capacidade for negativa
+    """
+    if k < 1:
+        raise ValueError(f"k deve ser pelo menos 1: {k}")
+    if capacidade < 0:
+        raise ValueError(f"Capacidade negativa: {capacidade}")
+
+    # Todas as capacidades começam com a seleção vazia
+    vazia = [(0, None)]
+    listas = [vazia] * (capacidade + 1)
+    celulas = 0
+    progresso, a_cada = _progresso(estatisticas)
+    for indice, (nome, valor, custo) in enumerate(projetos):
+        # De trás para frente: listas[c - custo] ainda é a da linha anterior
+        for c in range(capacidade, custo - 1, -1):
+            listas[c] = _mesclar_k(listas[c], listas[c - custo], valor, indice, k)
+            celulas += len(listas[c])
+        if progresso and ((indice + 1) % a_cada == 0 or indice + 1 == len(projetos)):
+            progresso(indice + 1, len(projetos), estatisticas)
+
+    resultado = []
+    for total, no in listas[capacidade]:
+        indices = []
+        while no is not None:
+            indices.append(no[0])
+            no = no[1]
+        resultado.append((total, [projetos[i][0] for i in reversed(indices)]))
+
+    if estatisticas is not None:
+        estatisticas["celulas"] = celulas
+    return resultado
+
+
+# ==============================================================================
+# MÚLTIPLOS RECURSOS (HORAS, ORÇAMENTO, PESSOAS)
+# ==============================================================================
+
+# Rodadas de descida coordenada na escolha dos multiplicadores
+RODADAS_MULTIPLICADORES = 30
+
+# Escala inteira dos multiplicadores (mantém o limitante exato)
+ESCALA_MULTIPLICADORES = 1 << 20
+
+# Estados mantidos na busca em feixe que antecede a passada exata
+LARGURA_FEIXE = 64
+
+# Abaixo desta fração de estados removidos, o filtro de dominância passa
+# a ser aplicado com intervalos cada vez maiores
+FRACAO_MINIMA_DOMINANCIA = 0.05
+
+
+def _passo_dual(y, direcao, itens, capacidades):
+    """
+    Minimiza h(y + t × direcao) em t, com direcao >= 0 e y + t × direcao >= 0.
+
+    h(y) = y · C + Σ max(0, Valor_i - y · Custos_i) é convexa e linear por
+    partes: a derivada em t é direcao · C menos a soma de direcao · Custos_i
+    dos itens ainda "ativos" (Valor_i > y · Custos_i), e cada item deixa
+    de ser ativo no ponto t_i = (Valor_i - y · Custos_i) / (direcao · Custos_i).
+    """
+    t_min = max((-a / b for a, b in zip(y, direcao) if b > 0), default=0.0)
+    inclinacao = sum(b * c for b, c in zip(direcao, capacidades))
+    pontos = []
+    for valor, custos in itens:
+        b = sum(x * c for x, c in zip(direcao, custos))
+        if b > 0:
+            t = (valor - sum(x * c for x, c in zip(y, custos))) / b
+            if t > t_min:
+                pontos.append((t, b))
+                inclinacao -= b
+
+    # Avança enquanto a derivada é negativa
+    t = t_min
+    pontos.sort()
+    for ponto, b in pontos:
+        if inclinacao >= 0:
+            break
+        t = ponto
+        inclinacao += b
+    return [a + t * b for a, b in zip(y, direcao)]
+
+
+def _multiplicadores_lp(itens, capacidades):
+    """
+    Multiplicadores y >= 0 da relaxação linear com vários recursos.
+
+    Pela dualidade da programação linear, o ótimo da relaxação linear é
+    o mínimo de h(y) = y · C + Σ max(0, Valor_i - y · Custos_i) sobre
+    y >= 0, e agregar as restrições com esse y faz a relaxação linear da
+    restrição agregada (Dantzig) valer o mesmo. h é minimizada por
+    descida coordenada com busca exata em cada direção (_passo_dual),
+    partindo da direção que normaliza cada recurso pela sua capacidade.
+    Qualquer y >= 0 dá um limitante válido; o mínimo só o deixa mais justo.
+    """
+    d = len(capacidades)
+    y = _passo_dual([0.0] * d, [1 / c if c > 0 else 0.0 for c in capacidades],
+                    itens, capacidades)
+
+    def h(y):
+        return sum(a * c for a, c in zip(y, capacidades)) + sum(
+            max(0, valor - sum(a * c for a, c in zip(y, custos))) for valor, custos in itens)
+
+    atual = h(y)
+    for _ in range(RODADAS_MULTIPLICADORES):
+        for r in range(d):
+            if capacidades[r] > 0:
+                y = _passo_dual(y, [1.0 if s == r else 0.0 for s in range(d)],
+                                itens, capacidades)
+        novo = h(y)
+        if novo >= atual - 1e-12 * max(1.0, abs(atual)):
+            break
+        atual = novo
+    return y
+
+
+def _preparar_multidimensional(projetos, capacidades):
+    """
+    Valida a instância com vetor de custos e agrega as restrições.
+
+    A restrição substituta (surrogate) soma as d restrições com pesos
+    inteiros M_d >= 1 proporcionais aos multiplicadores da relaxação
+    linear (_multiplicadores_lp): o peso de um projeto é Σ M_d × Custo_d
+    e a capacidade agregada é Σ M_d × C_d. Toda seleção viável respeita
+    a restrição agregada.
+
+    Returns:
+        Tupla (pesos, capacidade_agregada, gratuitos, ordem): pesos
+        agregados por projeto, índices dos projetos que sempre entram
+        (todos os custos zero e valor > 0) e dos demais candidatos em
+        ordem decrescente de Valor / peso
+
+    Raises:
+        ValueError: Se as dimensões não baterem ou houver capacidade ou
+            custo negativo
+    """
+    capacidades = tuple(capacidades)
+    d = len(capacidades)
+    if d == 0:
+        raise ValueError("Informe pelo menos uma capacidade")
+    if any(c < 0 for c in capacidades):
+        raise ValueError(f"Capacidade negativa: {capacidades}")
+    for nome, valor, custos in projetos:
+        if len(custos) != d:
+            raise ValueError(
+                f"Projeto {nome!r}: {len(custos)} custos para {d} capacidades")
+        if any(c < 0 for c in custos):
+            raise ValueError(f"Projeto {nome!r}: custo negativo: {tuple(custos)}")
+
+    gratuitos = []
+    candidatos = []
+    for i, (nome, valor, custos) in enumerate(projetos):
+        if valor <= 0 or any(c > cap for c, cap in zip(custos, capacidades)):
+            continue
+        if any(custos):
+            candidatos.append(i)
+        else:
+            gratuitos.append(i)
+
+    # Recursos de capacidade zero ficam com multiplicador zero: nenhum
+    # candidato usa algo deles. Os demais ficam >= 1, então só os
+    # gratuitos têm peso agregado zero
+    y = _multiplicadores_lp([(projetos[i][1], projetos[i][2]) for i in candidatos],
+                            capacidades)
+    maior = max(y, default=0.0)
+    multiplicadores = [
+        (round(a / maior * ESCALA_MULTIPLICADORES) if maior > 0 else 0) + 1 if cap > 0 else 0
+        for a, cap in zip(y, capacidades)
+    ]
+    capacidade_agregada = sum(m * c for m, c in zip(multiplicadores, capacidades))
+
+    pesos = [0] * len(projetos)
+    for i in candidatos:
+        pesos[i] = sum(m * c for m, c in zip(multiplicadores, projetos[i][2]))
+    ordem = candidatos
+
+    ordem.sort(key=lambda i: projetos[i][1] / pesos[i], reverse=True)
+    return pesos, capacidade_agregada, gratuitos, ordem
+
+
+def greedy_multidimensional_portfolio(projetos, capacidades):
+    """
+    Estratégia gulosa para vários recursos (a contraparte do greedy_portfolio).
+
+    ABORDAGEM:
+    - Ordena pelo valor dividido pelo custo agregado (cada recurso
+      normalizado pela sua capacidade)
+    - Aceita cada projeto que ainda cabe em TODOS os recursos
+    - Projetos de valor <= 0 são ignorados
+
+    Assim como o greedy_portfolio, NÃO garante o ótimo; serve de ponto
+    de partida (limitante inferior) para multidimensional_portfolio.
+
+    COMPLEXIDADE DE TEMPO: O(n × d + n log n)
+    COMPLEXIDADE DE ESPAÇO: O(n)
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custos), com custos uma
+            sequência de d números (ex.: (horas, orçamento, pessoas))
+        capacidades: Sequência com as d capacidades
+
+    Returns:
+        Tupla contendo (valor_total, projetos_selecionados, recursos_utilizados),
+        com recursos_utilizados uma tupla de d totais
+    """
+    _, _, gratuitos, ordem = _preparar_multidimensional(projetos, capacidades)
+    capacidades = tuple(capacidades)
+
+    usados = [0] * len(capacidades)
+    selecionados = list(gratuitos)
+    for i in ordem:
+        custos = projetos[i][2]
+        if all(u + c <= cap for u, c, cap in zip(usados, custos, capacidades)):
+            selecionados.append(i)
+            usados = [u + c for u, c in zip(usados, custos)]
+
+    selecionados.sort()
+    valor_total = sum(projetos[i][1] for i in selecionados)
+    return (valor_total, [projetos[i][0] for i in selecionados], tuple(usados))
+
+
+def _filtrar_dominados(estados):
+    """
+    Remove estados dominados: A domina B quando Valor_A >= Valor_B e
+    A não usa mais de nenhum recurso.
+
+    ABORDAGEM:
+    - Percorre os estados por valor decrescente (empate: menor soma de
+      custos primeiro); quem vem antes é candidato a dominador
+    - 1 recurso: basta o menor custo visto até ali
+    - 2 recursos: árvore de Fenwick indexada pelo 1º custo guardando o
+      menor 2º custo visto (prefixo mínimo), O(log S) por estado
+    - 3 recursos: Fenwick de Fenwicks (1º e 2º custos) guardando o menor
+      3º custo, com as árvores internas em dicionários, O(log² S)
+    - 4 ou mais: compara com os estados já mantidos
+
+    Estados com o mesmo vetor de custos já chegam deduplicados.
+    """
+    estados.sort(key=lambda e: (-e[0], sum(e[1])))
+    d = len(estados[0][1]) if estados else 0
+    mantidos = []
+
+    if d == 1:
+        menor = None
+        for estado in estados:
+            custo = estado[1][0]
+            if menor is None or custo < menor:
+                menor = custo
+                mantidos.append(estado)
+    elif d == 2:
+        distintos = sorted({e[1][0] for e in estados})
+        posicao = {c: k + 1 for k, c in enumerate(distintos)}
+        arvore = [None] * (len(distintos) + 1)
+        for estado in estados:
+            primeiro, segundo = estado[1]
+            k = posicao[primeiro]
+            dominado = False
+            while k > 0:
+                if arvore[k] is not None and arvore[k] <= segundo:
+                    dominado = True
+                    break
+                k -= k & -k
+            if dominado:
+                continue
+            mantidos.append(estado)
+            k = posicao[primeiro]
+            while k < len(arvore):
+                if arvore[k] is None or segundo < arvore[k]:
+                    arvore[k] = segundo
+                k += k & -k
+    elif d == 3:
+        pos_x = {c: k + 1 for k, c in enumerate(sorted({e[1][0] for e in estados}))}
+        pos_y = {c: k + 1 for k, c in enumerate(sorted({e[1][1] for e in estados}))}
+        externa = [None] * (len(pos_x) + 1)
+        tamanho_x, tamanho_y = len(pos_x), len(pos_y)
+        for estado in estados:
+            x, y, z = estado[1]
+            dominado = False
+            i = pos_x[x]
+            while i > 0 and not dominado:
+                interna = externa[i]
+                if interna is not None:
+                    j = pos_y[y]
+                    while j > 0:
+                        menor = interna.get(j)
+                        if menor is not None and menor <= z:
+                            dominado = True
+                            break
+                        j -= j & -j
+                i -= i & -i
+            if dominado:
+                continue
+            mantidos.append(estado)
+            i = pos_x[x]
+            while i <= tamanho_x:
+                if externa[i] is None:
+                    externa[i] = {}
+                interna = externa[i]
+                j = pos_y[y]
+                while j <= tamanho_y:
+                    menor = interna.get(j)
+                    if menor is None or z < menor:
+                        interna[j] = z
+                    j += j & -j
+                i += i & -i
+    else:
+        for estado in estados:
+            custos = estado[1]
+            if not any(all(a <= b for a, b in zip(outro[1], custos)) for outro in mantidos):
+                mantidos.append(estado)
+
+    return mantidos
+
+
+def multidimensional_portfolio(projetos, capacidades, estatisticas=None):
+    """
+    Solução exata com vários recursos (ex.: horas, orçamento e pessoas).
+
+    ABORDAGEM:
+    - Conjunto ESPARSO de estados (valor, vetor de custos, seleção), no
+      lugar de uma tabela densa C_1 × C_2 × ... × C_d
+    - A cada projeto, cada estado gera a versão "com o projeto" (se
+      couber em todos os recursos); estados com o mesmo vetor de custos
+      ficam só com o maior valor
+    - Poda por dominância: sai quem tem valor <= e usa >= de todos os
+      recursos que outro estado (ver _filtrar_dominados). Não é
+      necessária para a exatidão; quando remove menos que
+      FRACAO_MINIMA_DOMINANCIA dos estados, é aplicada com intervalos
+      que dobram a cada vez
+    - Poda por limitante: relaxação linear (Dantzig) da restrição
+      agregada (ver _preparar_multidimensional), calculada em O(log n)
+      com somas prefixadas, como no branch_and_bound_portfolio. Estados
+      cujo limitante não supera a melhor solução conhecida são podados
+    - Solução inicial: a do greedy_multidimensional_portfolio, melhorada
+      por uma busca em feixe (a mesma passada mantendo só os
+      LARGURA_FEIXE estados de maior limitante). Em cada projeto, o
+      estado de maior limitante também é completado de forma gulosa.
+      Quanto melhor a solução inicial, mais a poda por limitante corta
+    - Os projetos são processados na ordem gulosa, então o restante a
+      considerar já está ordenado para o limitante
+
+    COMPLEXIDADE DE TEMPO: O(n × S × (d + log n)) com S = maior número
+    de estados vivos (S × log S para d = 2 e S² no pior caso para d >= 3)
+    - Pior caso exponencial, mas as duas podas mantêm S pequeno em
+      instâncias realistas
+
+    COMPLEXIDADE DE ESPAÇO: O(S × d) mais os nós das seleções
+    (listas ligadas compartilhadas)
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custos), com custos uma
+            sequência de d números
+        capacidades: Sequência com as d capacidades
+        estatisticas: Dicionário opcional (ou Instrumentacao) que recebe
+            "celulas" (estados gerados), "estados_maximo",
+            "podados_dominancia", "podados_limite" e "limite_superior"
+
+    Returns:
+        Tupla contendo (valor_maximo, projetos_selecionados)
+
+    Raises:
+        ValueError: Se as dimensões não baterem ou houver capacidade ou
+            custo negativo
+    """
+    pesos, capacidade_agregada, gratuitos, ordem = _preparar_multidimensional(
+        projetos, capacidades)
+    capacidades = tuple(capacidades)
+    d = len(capacidades)
+    m = len(ordem)
+    valores = [projetos[i][1] for i in ordem]
+    inteiros = all(isinstance(v, int) for v in valores) and \
+        all(isinstance(pesos[i], int) for i in ordem)
+
+    # Somas prefixadas na ordem gulosa (valor e peso agregado)
+    P = [0] * (m + 1)
+    W = [0] * (m + 1)
+    for k, i in enumerate(ordem):
+        P[k + 1] = P[k] + valores[k]
+        W[k + 1] = W[k] + pesos[i]
+
+    def limitante(k, folga, valor):
+        """
+        Relaxação linear dos projetos ordem[k:] com folga agregada `folga`.
+        """
+        j = bisect_right(W, W[k] + folga, k) - 1
+        limite = valor + P[j] - P[k]
+        if j < m:
+            resto = folga - (W[j] - W[k])
+            if inteiros:
+                limite += resto * valores[j] // pesos[ordem[j]]
+            else:
+                limite += resto * valores[j] / pesos[ordem[j]]
+        return limite
+
+    def completar(k, estado):
+        """
+        Completa um estado com os projetos ordem[k:] que couberem (gulosa).
+        """
+        total, usados, _, no = estado
+        for j in range(k, m):
+            i = ordem[j]
+            novos = tuple(u + c for u, c in zip(usados, projetos[i][2]))
+            if all(u <= cap for u, cap in zip(novos, capacidades)):
+                usados = novos
+                total += valores[j]
+                no = (i, no)
+        return total, no
+
+    limite_raiz = limitante(0, capacidade_agregada, 0)
+    contagem = {"celulas": 0, "estados_maximo": 1, "podados_dominancia": 0,
+                "podados_limite": 0}
+
+    def varrer(alvo, melhor_no, largura=None, progresso=None, a_cada=0):
+        """
+        Uma passada pelos projetos. Com `largura`, só os estados de maior
+        limitante seguem (busca em feixe, heurística); sem ela, é exata.
+        """
+        # Estado: (valor, custos, peso agregado usado, seleção encadeada)
+        estados = [(0, (0,) * d, 0, None)]
+        intervalo_filtragem = 1
+        proxima_filtragem = 0
+        for k, i in enumerate(ordem):
+            valor = valores[k]
+            custos = projetos[i][2]
+            peso = pesos[i]
+
+            # Sem o projeto primeiro: em empate de custos, ele é mantido
+            por_custos = {}
+            for estado in estados:
+                por_custos[estado[1]] = estado
+            for total, usados, agregado, no in estados:
+                novos = tuple(u + c for u, c in zip(usados, custos))
+                if any(u > cap for u, cap in zip(novos, capacidades)):
+                    continue
+                contagem["celulas"] += 1
+                novo = (total + valor, novos, agregado + peso, (i, no))
+                atual = por_custos.get(novos)
+                if atual is None or novo[0] > atual[0]:
+                    por_custos[novos] = novo
+                if novo[0] > alvo:
+                    alvo = novo[0]
+                    melhor_no = novo[3]
+
+            # Poda por limitante sobre os projetos que ainda faltam
+            candidatos = []
+            for estado in por_custos.values():
+                limite = limitante(k + 1, capacidade_agregada - estado[2], estado[0])
+                if limite <= alvo:
+                    contagem["podados_limite"] += 1
+                else:
+                    candidatos.append((limite, estado))
+            if not candidatos:
+                break
+
+            # Melhora a solução conhecida completando o estado mais promissor
+            candidatos.sort(key=lambda par: par[0], reverse=True)
+            total, no = completar(k + 1, candidatos[0][1])
+            if total > alvo:
+                alvo = total
+                melhor_no = no
+            if largura is not None:
+                del candidatos[largura:]
+
+            candidatos = [estado for limite, estado in candidatos if limite > alvo]
+            if k + 1 >= proxima_filtragem:
+                estados = _filtrar_dominados(candidatos)
+                removidos = len(candidatos) - len(estados)
+                contagem["podados_dominancia"] += removidos
+                # Filtro que quase não remove nada é pulado por cada vez
+                # mais projetos; volta a cada projeto quando compensa
+                if removidos < FRACAO_MINIMA_DOMINANCIA * len(candidatos):
+                    intervalo_filtragem *= 2
+                else:
+                    intervalo_filtragem = 1
+                proxima_filtragem = k + 1 + intervalo_filtragem
+            else:
+                estados = candidatos
+            contagem["estados_maximo"] = max(contagem["estados_maximo"], len(estados))
+            if progresso and ((k + 1) % a_cada == 0 or k + 1 == m):
+                progresso(k + 1, m, estatisticas)
+            if not estados:
+                break
+        return alvo, melhor_no
+
+    # Limitante inferior: a solução gulosa (a mesma do
+    # greedy_multidimensional_portfolio, sem os gratuitos), melhorada por
+    # uma busca em feixe antes da passada exata
+    alvo, melhor_no = completar(0, (0, (0,) * d, 0, None))
+    alvo, melhor_no = varrer(alvo, melhor_no, LARGURA_FEIXE)
+    progresso, a_cada = _progresso(estatisticas)
+    alvo, melhor_no = varrer(alvo, melhor_no, None, progresso, a_cada)
+
+    indices = list(gratuitos)
+    while melhor_no is not None:
+        indices.append(melhor_no[0])
+        melhor_no = melhor_no[1]
+    indices.sort()
+    valor_maximo = sum(projetos[i][1] for i in indices)
+    selecionados = [projetos[i][0] for i in indices]
+
+    if estatisticas is not None:
+        estatisticas.update(contagem)
+        estatisticas["limite_superior"] = limite_raiz + sum(projetos[i][1] for i in gratuitos)
+
+    return (valor_maximo, selecionados)
+
+
+# ==============================================================================
+# PROJETOS COM MULTIPLICIDADE (DIVISÃO BINÁRIA)
+# ==============================================================================
+
+def _dividir_quantidade(quantidade):
+    """
+    Divide uma quantidade k em pedaços 1, 2, 4, ..., 2^(p-1) e o resto.
+
+    Qualquer número de 0 a k é a soma de um subconjunto dos pedaços, e
+    são só O(log k) pedaços.
+    """
+    pedacos = []
+    tamanho = 1
+    while quantidade > 0:
+        pedaco = min(tamanho, quantidade)
+        pedacos.append(pedaco)
+        quantidade -= pedaco
+        tamanho *= 2
+    return pedacos
+
+
+def multiplicidade_portfolio(projetos, capacidade, backend="python", modo="tabela",
+                             estatisticas=None):
+    """
+    Projetos que podem ser escolhidos mais de uma vez (pacotes repetíveis).
+
+    ABORDAGEM:
+    - Cada projeto traz uma quantidade máxima k (ou None = ilimitada,
+      limitada na prática a C // Custo)
+    - Divisão binária: k cópias viram os pedaços 1, 2, 4, ..., resto,
+      cada um um projeto 0/1 com valor e custo multiplicados. Como toda
+      quantidade de 0 a k é soma de pedaços, a mochila 0/1 sobre os
+      pedaços tem o mesmo ótimo
+    - Os pedaços são resolvidos pelo dp_bottom_up_portfolio (backend,
+      modo e estatisticas são repassados) e somados de volta por projeto
+    - Custo zero: com valor > 0, entra a quantidade máxima (ilimitada é
+      um erro); com valor <= 0, não entra
+
+    Expandir k cópias idênticas custaria O(k × C) por projeto; aqui são
+    O(C × log k).
+
+    COMPLEXIDADE DE TEMPO: O(C × Σ log k_i)
+
+    COMPLEXIDADE DE ESPAÇO: a do dp_bottom_up_portfolio com Σ log k_i
+    linhas (modo="bits" guarda só as decisões compactadas)
+
+    Args:
+        projetos: Lista de tuplas (nome, valor, custo, quantidade), com
+            quantidade um inteiro >= 0 ou None (ilimitada)
+        capacidade: Capacidade máxima de Horas-Especialista
+        backend: "python" ou "numpy" (ver dp_bottom_up_portfolio)
+        modo: "tabela" ou "bits" (ver dp_bottom_up_portfolio)
+        estatisticas: Dicionário opcional repassado ao dp_bottom_up_portfolio,
+            que recebe também "pedacos" (projetos 0/1 gerados)
+
+    Returns:
+        Tupla (valor_maximo, quantidades): quantidades é uma lista de
+        tuplas (nome, quantidade escolhida), na ordem dos projetos, só
+        com os escolhidos ao menos uma vez
+
+    Raises:
+        ValueError: Se a capacidade ou uma quantidade for negativa, ou se
+            um projeto ilimitado tiver custo zero e valor positivo
+    """
+    if capacidade < 0:
+        raise ValueError(f"Capacidade negativa: {capacidade}")
+
+    escolhidas = [0] * len(projetos)
+    pedacos = []
+    origem = []
+    for i, (nome, valor, custo, quantidade) in enumerate(projetos):
+        if quantidade is not None and quantidade < 0:
+            raise ValueError(f"Projeto {nome!r}: quantidade negativa: {quantidade}")
+        if custo == 0:
+            if valor > 0:
+                if quantidade is None:
+                    raise ValueError(f"Projeto {nome!r}: ilimitado com custo zero")
+                escolhidas[i] = quantidade
+            continue
+        if valor <= 0 or custo > capacidade:
+            continue
+
+        maximo = capacidade // custo
+        if quantidade is not None:
+            maximo = min(maximo, quantidade)
+        for pedaco in _dividir_quantidade(maximo):
+            # O nome do pedaço é a sua posição em `pedacos`
+            pedacos.append((len(pedacos), valor * pedaco, custo * pedaco))
+            origem.append((i, pedaco))
+
+    _, selecionados = dp_bottom_up_portfolio(pedacos, capacidade, backend, modo, estatisticas)
+    for k in selecionados:
+        i, pedaco = origem[k]
+        escolhidas[i] += pedaco
+
+    valor_maximo = sum(projetos[i][1] * q for i, q in enumerate(escolhidas))
+    quantidades = [(projetos[i][0], q) for i, q in enumerate(escolhidas) if q > 0]
+
+    if estatisticas is not None:
+        estatisticas["pedacos"] = len(pedacos)
+    return (valor_maximo, quantidades)
+
+
 # ==============================================================================
 # FUNÇÃO PRINCIPAL E TESTES
 # ==============================================================================
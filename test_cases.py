@@ -10,8 +10,35 @@ from portfolio_optimization import (
     greedy_portfolio,
     recursive_portfolio,
     memoized_portfolio,
-    dp_bottom_up_portfolio
+    dp_bottom_up_portfolio,
+    dp_hirschberg_portfolio,
+    branch_and_bound_portfolio,
+    dp_por_valor_portfolio,
+    auto_portfolio,
+    escolher_solver,
+    fptas_portfolio,
+    pareto_portfolio,
+    meet_in_the_middle_portfolio,
+    core_portfolio,
+    PortfolioResolvido,
+    PortfolioIncremental,
+    memoized_iterativo_portfolio,
+    Instrumentacao,
+    instrumentar,
+    reduzir_instancia,
+    reduzido_portfolio,
+    bitset_portfolio,
+    sensibilidade_portfolio,
+    k_melhores_portfolio,
+    multidimensional_portfolio,
+    greedy_multidimensional_portfolio,
+    multiplicidade_portfolio,
+    SOLVERS
 )
+import portfolio_optimization
+from cache_portfolio import CachePortfolio, chave_instancia
+from parallel_portfolio import dp_paralela_portfolio, resolver_lote
+from portfolio_cli import ler_projetos, resolver_arquivo
 
 
 def test_exemplo_basico():
@@ -205,6 +232,1338 @@ def test_todos_projetos_mesma_razao():
     print("\n✅ Teste 6 passou!")
 
 
+def test_hirschberg_igual_bottom_up():
+    """
+    Testa se o solver O(n + C) reconstrói uma seleção ótima válida.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 7: DP com Memória O(n + C) (Hirschberg)")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(42)
+    
+    # Instâncias grandes o suficiente para forçar a divisão recursiva
+    for n, capacidade in [(4, 10), (30, 200), (60, 500)]:
+        projetos = [
+            (f"P{i}", gerador.randint(1, 100), gerador.randint(1, 60))
+            for i in range(n)
+        ]
+        
+        valor_dp, _ = dp_bottom_up_portfolio(projetos, capacidade)
+        valor_h, proj_h = dp_hirschberg_portfolio(projetos, capacidade)
+        
+        escolhidos = [p for p in projetos if p[0] in proj_h]
+        horas = sum(custo for _, _, custo in escolhidos)
+        
+        print(f"n={n}, C={capacidade}: DP={valor_dp}, Hirschberg={valor_h}, "
+              f"horas={horas}")
+        
+        assert valor_h == valor_dp, "Valor diferente do bottom-up!"
+        assert sum(valor for _, valor, _ in escolhidos) == valor_h, \
+            "Seleção não corresponde ao valor!"
+        assert horas <= capacidade, "Seleção excede a capacidade!"
+    
+    assert dp_hirschberg_portfolio([], 10) == (0, [])
+    assert dp_hirschberg_portfolio([("P1", 10, 5)], 0) == (0, [])
+    # Projeto de custo zero entra mesmo sem capacidade
+    assert dp_bottom_up_portfolio([("G", 7, 0)], 0) == (7, ["G"])
+    assert dp_hirschberg_portfolio([("G", 7, 0), ("P1", 10, 5)], 0) == (7, ["G"])
+    
+    # Capacidade maior que o limite da tabela: intervalos de um projeto
+    # precisam de caso base próprio (antes: recursão infinita)
+    assert dp_hirschberg_portfolio([("A", 5, 3)], 20_000) == (5, ["A"])
+    assert dp_hirschberg_portfolio([("A", 5, 30_000)], 20_000) == (0, [])
+    projetos = [(f"H{i}", gerador.randint(1, 1000), gerador.randint(10_000, 60_000))
+                for i in range(8)]
+    valor_h, proj_h = dp_hirschberg_portfolio(projetos, 100_000)
+    assert valor_h == branch_and_bound_portfolio(projetos, 100_000)[0]
+    assert sum(c for nome, _, c in projetos if nome in proj_h) <= 100_000
+    
+    print("\n✅ Teste 7 passou!")
+
+
+def test_backend_numpy():
+    """
+    Testa se o backend NumPy dá exatamente o mesmo resultado do Python puro,
+    inclusive quando o NumPy não está instalado (fallback).
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 8: Backend NumPy")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(7)
+    
+    instancias = [
+        ([("Projeto A", 12, 4), ("Projeto B", 10, 3),
+          ("Projeto C", 7, 2), ("Projeto D", 4, 3)], 10),
+        ([(f"P{i}", gerador.randint(1, 10**6), gerador.randint(1, 80))
+          for i in range(40)], 700),
+        # Valores grandes forçam int64
+        ([(f"G{i}", gerador.randint(1, 10**12), gerador.randint(0, 30))
+          for i in range(15)], 100),
+    ]
+    
+    numpy_original = portfolio_optimization.np
+    try:
+        for usar_numpy in (True, False):
+            if not usar_numpy:
+                portfolio_optimization.np = None
+            for projetos, capacidade in instancias:
+                esperado = dp_bottom_up_portfolio(projetos, capacidade)
+                resultado = dp_bottom_up_portfolio(projetos, capacidade,
+                                                   backend="numpy")
+                resultado_h = dp_hirschberg_portfolio(projetos, capacidade,
+                                                      backend="numpy")
+                print(f"NumPy={usar_numpy}, C={capacidade}: {resultado[0]}")
+                assert resultado == esperado, "Backend NumPy divergiu!"
+                assert type(resultado[0]) is int, "Valor deveria ser int!"
+                assert resultado_h[0] == esperado[0], "Hirschberg divergiu!"
+    finally:
+        portfolio_optimization.np = numpy_original
+    
+    assert dp_bottom_up_portfolio([("G", 7, 0)], 0, backend="numpy") == (7, ["G"])
+    
+    try:
+        dp_bottom_up_portfolio([], 10, backend="gpu")
+        assert False, "Backend inválido deveria falhar!"
+    except ValueError:
+        pass
+    
+    print("\n✅ Teste 8 passou!")
+
+
+def test_modo_bits():
+    """
+    Testa se o modo "bits" reconstrói exatamente a mesma seleção da tabela.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 9: Matriz de Decisões Compactada (modo bits)")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(3)
+    
+    for n, capacidade in [(4, 10), (25, 123), (50, 400)]:
+        projetos = [
+            (f"P{i}", gerador.randint(1, 90), gerador.randint(0, capacidade // 4))
+            for i in range(n)
+        ]
+        # Um projeto que nunca cabe
+        projetos.append(("Grande", 1000, capacidade + 1))
+        
+        esperado = dp_bottom_up_portfolio(projetos, capacidade)
+        for backend in ("python", "numpy"):
+            resultado = dp_bottom_up_portfolio(projetos, capacidade,
+                                               backend=backend, modo="bits")
+            print(f"n={n}, C={capacidade}, {backend}: {resultado[0]}")
+            assert resultado == esperado, "Modo bits divergiu da tabela!"
+    
+    assert dp_bottom_up_portfolio([("G", 7, 0)], 0, modo="bits") == (7, ["G"])
+    
+    print("\n✅ Teste 9 passou!")
+
+
+def test_branch_and_bound():
+    """
+    Testa o Branch-and-Bound contra a DP e em capacidades enormes.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 10: Branch-and-Bound (Limitante de Dantzig)")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(11)
+    
+    for n, capacidade in [(3, 50), (20, 150), (40, 600)]:
+        projetos = [
+            (f"P{i}", gerador.randint(0, 100), gerador.randint(0, 80))
+            for i in range(n)
+        ]
+        valor_dp, _ = dp_bottom_up_portfolio(projetos, capacidade)
+        valor_bb, proj_bb = branch_and_bound_portfolio(projetos, capacidade)
+        escolhidos = [p for p in projetos if p[0] in proj_bb]
+        
+        print(f"n={n}, C={capacidade}: DP={valor_dp}, B&B={valor_bb}")
+        assert valor_bb == valor_dp, "B&B deveria encontrar o ótimo!"
+        assert sum(custo for _, _, custo in escolhidos) <= capacidade
+    
+    # Capacidade em minutos: inviável para a tabela, trivial para o B&B
+    projetos = [(f"M{i}", gerador.randint(1, 10**6), gerador.randint(1, 10**6))
+                for i in range(60)]
+    estatisticas = {}
+    valor, selecionados = branch_and_bound_portfolio(
+        projetos, 10**7, estatisticas=estatisticas)
+    print(f"C=10^7: valor={valor}, estatísticas={estatisticas}")
+    assert estatisticas["otimo_provado"]
+    assert valor <= estatisticas["limite_superior"]
+    
+    # Com limite de nós a busca para cedo, mas a solução é válida
+    estatisticas = {}
+    valor_limitado, _ = branch_and_bound_portfolio(
+        projetos, 10**7, limite_nos=1, estatisticas=estatisticas)
+    assert estatisticas["nos_explorados"] == 1
+    assert valor_limitado <= valor
+    
+    print("\n✅ Teste 10 passou!")
+
+
+def test_dp_por_valor_e_auto():
+    """
+    Testa a DP indexada por valor e a escolha automática do solver.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 11: DP Indexada por Valor e Seleção Automática")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(21)
+    
+    for n, capacidade in [(4, 10), (30, 250)]:
+        projetos = [
+            (f"P{i}", gerador.randint(0, 40), gerador.randint(0, 60))
+            for i in range(n)
+        ]
+        esperado, _ = dp_bottom_up_portfolio(projetos, capacidade)
+        for backend in ("python", "numpy"):
+            valor, selecionados = dp_por_valor_portfolio(projetos, capacidade,
+                                                         backend=backend)
+            escolhidos = [p for p in projetos if p[0] in selecionados]
+            print(f"n={n}, C={capacidade}, {backend}: {valor}")
+            assert valor == esperado, "DP por valor divergiu!"
+            assert sum(v for _, v, _ in escolhidos) == valor
+            assert sum(c for _, _, c in escolhidos) <= capacidade
+    
+    # Planejamento semanal: C em milhões, valores de 1 a 100
+    projetos = [(f"S{i}", gerador.randint(1, 100), gerador.randint(1, 200_000))
+                for i in range(150)]
+    estatisticas = {}
+    valor, selecionados = auto_portfolio(projetos, 3_000_000,
+                                         estatisticas=estatisticas)
+    print(f"C=3.000.000: solver={estatisticas['solver']}, valor={valor}")
+    assert estatisticas["solver"] == "dp_por_valor"
+    assert valor == branch_and_bound_portfolio(projetos, 3_000_000)[0]
+    
+    # Capacidade pequena continua na tabela por capacidade
+    estatisticas = {}
+    auto_portfolio([("X", 60, 10), ("Y", 100, 20), ("Z", 120, 30)], 50,
+                   estatisticas=estatisticas)
+    assert estatisticas["solver"] == "dp_bottom_up"
+    
+    # Nenhuma tabela viável: B&B com n moderado, core acima disso
+    grande = [(f"G{i}", gerador.randint(10**5, 10**6), gerador.randint(10**4, 10**6))
+              for i in range(portfolio_optimization.LIMITE_PROJETOS_BB + 1)]
+    capacidade = sum(c for _, _, c in grande) // 2
+    assert escolher_solver(grande[:100], capacidade) == "branch_and_bound"
+    assert escolher_solver(grande, capacidade) == "core"
+    estatisticas = {}
+    valor, selecionados = auto_portfolio(grande, capacidade, estatisticas=estatisticas,
+                                         reduzir=False)
+    escolhidos = [p for p in grande if p[0] in selecionados]
+    print(f"n={len(grande)}, C={capacidade}: solver={estatisticas['solver']}, valor={valor}")
+    assert estatisticas["solver"] == "core"
+    assert sum(c for _, _, c in escolhidos) <= capacidade
+    assert valor == sum(v for _, v, _ in escolhidos) >= greedy_portfolio(grande, capacidade)[0]
+    
+    print("\n✅ Teste 11 passou!")
+
+
+def test_fptas():
+    """
+    Testa a garantia (1 - ε) do FPTAS e o limitante reportado.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 12: Aproximação FPTAS")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(8)
+    
+    projetos = [(f"P{i}", gerador.randint(1, 10**6), gerador.randint(1, 90))
+                for i in range(35)]
+    capacidade = 400
+    otimo, _ = dp_bottom_up_portfolio(projetos, capacidade)
+    
+    for epsilon in (0.5, 0.2, 0.05):
+        valor, selecionados, limite = fptas_portfolio(projetos, capacidade, epsilon)
+        horas = sum(c for nome, _, c in projetos if nome in selecionados)
+        print(f"ε={epsilon}: valor={valor}, ótimo={otimo}, teto={limite:.0f}")
+        assert valor >= (1 - epsilon) * otimo, "Garantia (1 - ε) violada!"
+        assert valor <= otimo <= limite, "Limitante reportado inválido!"
+        assert horas <= capacidade
+    
+    # Caso 2 do README: Greedy perde 22%, FPTAS com ε = 0.1 não pode
+    projetos = [("X", 60, 10), ("Y", 100, 20), ("Z", 120, 30)]
+    valor, _, _ = fptas_portfolio(projetos, 50, epsilon=0.1)
+    assert valor >= 0.9 * 220
+    
+    # K == 1 com valores fracionários ainda arredonda: não pode se dizer exato
+    valor, selecionados, limite = fptas_portfolio([("Y", 2.4, 2), ("X", 2.5, 2)], 2, 0.8)
+    assert valor >= (1 - 0.8) * 2.5 and limite >= 2.5, (valor, selecionados, limite)
+    
+    print("\n✅ Teste 12 passou!")
+
+
+def test_pareto():
+    """
+    Testa a fronteira de pareto esparsa contra a DP e com custos grandes.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 13: Fronteira de Pareto (Nemhauser–Ullmann)")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(13)
+    
+    projetos = [(f"P{i}", gerador.randint(0, 60), gerador.randint(0, 50))
+                for i in range(30)]
+    esperado, _ = dp_bottom_up_portfolio(projetos, 300)
+    valor, selecionados = pareto_portfolio(projetos, 300)
+    print(f"C=300: DP={esperado}, Pareto={valor}")
+    assert valor == esperado
+    assert sum(c for nome, _, c in projetos if nome in selecionados) <= 300
+    
+    # Custos grandes e irregulares: a tabela teria 20 × 10^6 células
+    projetos = [(f"G{i}", gerador.randint(1, 1000), gerador.randint(100, 50_000))
+                for i in range(20)]
+    estatisticas = {}
+    valor, selecionados = pareto_portfolio(projetos, 10**6, estatisticas=estatisticas)
+    print(f"C=10^6: valor={valor}, fronteira máxima="
+          f"{estatisticas['fronteira_maxima']}")
+    assert valor == branch_and_bound_portfolio(projetos, 10**6)[0]
+    assert len(estatisticas["tamanhos_fronteira"]) == 20
+    
+    print("\n✅ Teste 13 passou!")
+
+
+def test_meet_in_the_middle():
+    """
+    Testa o meet-in-the-middle com capacidades não inteiras e gigantes.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 14: Meet-in-the-Middle")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(17)
+    
+    # Custos fracionários: nenhuma tabela por capacidade se aplica
+    projetos = [(f"P{i}", gerador.randint(1, 100), gerador.uniform(1, 50))
+                for i in range(16)]
+    capacidade = 180.5
+    esperado = recursive_portfolio(projetos, capacidade)
+    valor, selecionados = meet_in_the_middle_portfolio(projetos, capacidade)
+    horas = sum(c for nome, _, c in projetos if nome in selecionados)
+    print(f"C={capacidade}: recursiva={esperado}, MITM={valor}, horas={horas:.1f}")
+    assert valor == esperado
+    assert horas <= capacidade
+    
+    # Capacidade gigante
+    projetos = [(f"G{i}", gerador.randint(1, 10**6), gerador.randint(1, 10**9))
+                for i in range(30)]
+    valor, _ = meet_in_the_middle_portfolio(projetos, 5 * 10**9)
+    assert valor == branch_and_bound_portfolio(projetos, 5 * 10**9)[0]
+    
+    try:
+        meet_in_the_middle_portfolio([(f"X{i}", 1, 1) for i in range(60)], 100)
+        assert False, "Deveria recusar instâncias grandes demais!"
+    except ValueError:
+        pass
+    
+    print("\n✅ Teste 14 passou!")
+
+
+def test_core():
+    """
+    Testa o núcleo expansível: ótimo provado com núcleo pequeno.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 15: Núcleo Expansível (Core)")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(19)
+    
+    for n, capacidade in [(5, 20), (40, 300), (200, 3000)]:
+        projetos = [(f"P{i}", gerador.randint(1, 100), gerador.randint(1, 60))
+                    for i in range(n)]
+        esperado, _ = dp_bottom_up_portfolio(projetos, capacidade)
+        # Janela mínima força a expansão do núcleo
+        valor, selecionados = core_portfolio(projetos, capacidade, tamanho_inicial=1)
+        print(f"n={n}, C={capacidade}: DP={esperado}, Core={valor}")
+        assert valor == esperado
+        assert sum(c for nome, _, c in projetos if nome in selecionados) <= capacidade
+    
+    # Catálogo grande: o núcleo é uma fração minúscula dos projetos
+    projetos = [(f"G{i}", gerador.randint(1, 1000), gerador.randint(1, 1000))
+                for i in range(20_000)]
+    estatisticas = {}
+    valor, _ = core_portfolio(projetos, 2_000_000, estatisticas=estatisticas)
+    print(f"n=20000: valor={valor}, estatísticas={estatisticas}")
+    assert estatisticas["tamanho_core"] < 1000
+    
+    # Limitantes exatos: em float, 49 × (1/49) vira 0.999... e o piso erra
+    assert portfolio_optimization._limites_dembo_hammer(
+        [10, 1], [1, 49], 49, True) == (1, [1, 10])
+    
+    print("\n✅ Teste 15 passou!")
+
+
+def test_portfolio_resolvido():
+    """
+    Testa as consultas por capacidade contra uma solução por capacidade.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 16: Resolver Uma Vez, Consultar Todas as Capacidades")
+    print("=" * 70)
+    
+    projetos = [
+        ("Proj A", 15, 5),
+        ("Proj B", 20, 8),
+        ("Proj C", 30, 12),
+        ("Proj D", 10, 3),
+        ("Proj E", 25, 10),
+        ("Proj F", 8, 2)
+    ]
+    
+    for backend in ("python", "numpy"):
+        resolvido = PortfolioResolvido(projetos, 30, backend=backend)
+        curva = resolvido.curva()
+        assert len(curva) == 31
+        for horas in range(31):
+            esperado = dp_bottom_up_portfolio(projetos, horas)
+            assert resolvido.resolver(horas) == esperado, f"Divergiu em c={horas}"
+            assert curva[horas] == esperado[0]
+        print(f"{backend}: curva = {curva[::5]}")
+    
+    try:
+        resolvido.melhor_valor(31)
+        assert False, "Capacidade acima de C deveria falhar!"
+    except ValueError:
+        pass
+    
+    print("\n✅ Teste 16 passou!")
+
+
+def test_portfolio_incremental():
+    """
+    Testa adições e remoções contra resolver do zero a cada evento.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 17: Resolução Incremental")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(23)
+    capacidade = 60
+    
+    for backend in ("python", "numpy"):
+        carteira = PortfolioIncremental(capacidade, backend=backend)
+        ativos = []
+        for evento in range(120):
+            if ativos and gerador.random() < 0.4:
+                nome = gerador.choice(ativos)[0]
+                ativos = [p for p in ativos if p[0] != nome]
+                carteira.remover(nome)
+            else:
+                projeto = (f"E{evento}", gerador.randint(1, 50), gerador.randint(1, 25))
+                ativos.append(projeto)
+                carteira.adicionar(projeto)
+            
+            # Com empates, a seleção pode ser outra solução ótima
+            valor, selecionados = carteira.resolver(capacidade)
+            escolhidos = [p for p in ativos if p[0] in selecionados]
+            assert valor == dp_bottom_up_portfolio(ativos, capacidade)[0], f"Evento {evento}"
+            assert sum(v for _, v, _ in escolhidos) == valor
+            assert sum(c for _, _, c in escolhidos) <= capacidade
+        
+        assert len(carteira) == len(ativos)
+        assert carteira.curva() == PortfolioResolvido(ativos, capacidade).curva()
+        print(f"{backend}: {len(ativos)} projetos ativos, "
+              f"ótimo={carteira.melhor_valor(capacidade)}")
+    
+    try:
+        carteira.remover("Inexistente")
+        assert False, "Remover projeto inexistente deveria falhar!"
+    except ValueError:
+        pass
+    
+    # Trabalho real da remoção: só os projetos acima do removido na sua pilha
+    projetos = [(f"R{i}", gerador.randint(1, 50), gerador.randint(1, 25)) for i in range(30)]
+    carteira = PortfolioIncremental(capacidade, projetos)
+    assert carteira.linhas_calculadas == 30
+    for nome, linhas in (("R29", 0), ("R0", 0), ("R20", 8), ("R3", 2)):
+        antes = carteira.linhas_calculadas
+        carteira.remover(nome)
+        assert carteira.linhas_calculadas - antes == linhas, nome
+    
+    # Janela deslizante: sai o mais antigo, entra um novo. Amortizado O(C)
+    # por evento, contra ~n linhas de recalcular tudo depois do primeiro
+    antes = carteira.linhas_calculadas
+    for k in range(200):
+        carteira.remover(carteira.projetos[0][0])
+        carteira.adicionar((f"J{k}", gerador.randint(1, 50), gerador.randint(1, 25)))
+    assert carteira.linhas_calculadas - antes <= 4 * 200
+    assert carteira.melhor_valor(capacidade) == \
+        dp_bottom_up_portfolio(carteira.projetos, capacidade)[0]
+    print(f"Janela deslizante: {carteira.linhas_calculadas - antes} linhas "
+          f"em 200 eventos com {len(carteira)} projetos")
+    
+    print("\n✅ Teste 17 passou!")
+
+
+def test_alterar_capacidade():
+    """
+    Testa aumentar e reduzir a capacidade sem resolver de novo.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 18: Alterar Capacidade de uma Solução Existente")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(29)
+    projetos = [(f"P{i}", gerador.randint(1, 60), gerador.randint(1, 30))
+                for i in range(25)]
+    
+    for backend in ("python", "numpy"):
+        carteira = PortfolioIncremental(100, projetos, backend=backend)
+        # +10% de horas, depois redução, depois um salto maior
+        for capacidade in (110, 80, 250):
+            carteira.alterar_capacidade(capacidade)
+            esperado = dp_bottom_up_portfolio(projetos, capacidade)
+            print(f"{backend}, C={capacidade}: {carteira.melhor_valor(capacidade)}")
+            assert carteira.resolver(capacidade) == esperado
+            assert carteira.curva() == PortfolioResolvido(projetos, capacidade).curva()
+        
+        # Depois de expandir, novos projetos usam a largura nova
+        carteira.adicionar(("Novo", 500, 240))
+        assert carteira.melhor_valor(250) == \
+            dp_bottom_up_portfolio(projetos + [("Novo", 500, 240)], 250)[0]
+    
+    print("\n✅ Teste 18 passou!")
+
+
+def test_cache():
+    """
+    Testa o cache: chave independente da ordem, LRU e nível em disco.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 19: Cache de Soluções")
+    print("=" * 70)
+    
+    import os
+    import tempfile
+    
+    projetos = [("X", 60, 10), ("Y", 100, 20), ("Z", 120, 30)]
+    embaralhados = [projetos[2], projetos[0], projetos[1]]
+    
+    assert chave_instancia(projetos, 50) == chave_instancia(embaralhados, 50)
+    assert chave_instancia(projetos, 50) != chave_instancia(projetos, 51)
+    assert chave_instancia(projetos, 50, "auto") != \
+        chave_instancia(projetos, 50, "pareto")
+    # 4 (JSONL) e 4.0 (CSV) são o mesmo número; 4.5 não
+    como_float = [(nome, float(v), float(c)) for nome, v, c in projetos]
+    assert chave_instancia(projetos, 50) == chave_instancia(como_float, 50.0)
+    assert chave_instancia(projetos, 50) != chave_instancia(projetos[:2] + [("Z", 120.5, 30)], 50)
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "cache.sqlite")
+        
+        cache = CachePortfolio(max_itens=1, caminho=caminho, max_itens_disco=2)
+        assert cache.resolver(projetos, 50) == (220, ["Y", "Z"])
+        assert cache.resolver(embaralhados, 50)[0] == 220
+        # Expulsa a primeira instância da memória (LRU com 1 item)
+        cache.resolver(projetos, 30)
+        assert cache.resolver(projetos, 50) == (220, ["Y", "Z"])
+        
+        estatisticas = cache.estatisticas()
+        print(f"Estatísticas: {estatisticas}")
+        assert estatisticas["falhas"] == 2
+        assert estatisticas["acertos_memoria"] == 1
+        assert estatisticas["acertos_disco"] == 1
+        assert estatisticas["remocoes_memoria"] >= 1
+        
+        # O limite do disco remove as soluções acessadas há mais tempo
+        cache.resolver(projetos, 10)
+        assert cache.estatisticas()["itens_disco"] == 2
+        cache.fechar()
+        
+        # Outro processo reaproveita o nível em disco
+        cache = CachePortfolio(caminho=caminho)
+        assert cache.resolver(projetos, 10) == (60, ["X"])
+        assert cache.estatisticas()["acertos_disco"] == 1
+        cache.fechar()
+    
+    # max_bytes_disco: o banco guarda só as soluções mais recentes que cabem
+    with tempfile.TemporaryDirectory() as pasta:
+        grandes = [(f"Projeto{i:04d}", 1, 1) for i in range(300)]
+        cache = CachePortfolio(caminho=os.path.join(pasta, "cache.sqlite"),
+                               max_bytes_disco=10_000)
+        for capacidade in range(200, 300, 20):
+            cache.resolver(grandes, capacidade)
+        estatisticas = cache.estatisticas()
+        print(f"Com max_bytes_disco: {estatisticas['itens_disco']} soluções, "
+              f"{estatisticas['bytes_disco']} bytes")
+        assert 0 < estatisticas["bytes_disco"] <= 10_000
+        assert estatisticas["remocoes_disco"] == 5 - estatisticas["itens_disco"]
+        cache.fechar()
+        # A mais recente continua no disco
+        cache = CachePortfolio(caminho=os.path.join(pasta, "cache.sqlite"))
+        assert cache.resolver(grandes, 280)[0] == 280
+        assert cache.estatisticas()["acertos_disco"] == 1
+        cache.fechar()
+    
+    # estatisticas é saída do solver: não pode entrar na chave
+    try:
+        CachePortfolio().resolver(projetos, 50, estatisticas={})
+        assert False, "estatisticas no cache deveria falhar!"
+    except ValueError:
+        pass
+    
+    # Alterar o retorno (de uma falha ou de um acerto) não altera o cache
+    cache = CachePortfolio()
+    cache.resolver(projetos, 50)[1].append("Intruso")
+    cache.resolver(projetos, 50)[1].clear()
+    assert cache.resolver(projetos, 50) == (220, ["Y", "Z"])
+    
+    # max_itens conta soluções; max_bytes limita pelo tamanho aproximado
+    grandes = [(f"Projeto{i:04d}", 1, 1) for i in range(500)]
+    cache = CachePortfolio(max_itens=100, max_bytes=60_000)
+    for capacidade in range(400, 500, 20):
+        cache.resolver(grandes, capacidade)
+    estatisticas = cache.estatisticas()
+    print(f"Com max_bytes: {estatisticas['itens_memoria']} soluções, "
+          f"{estatisticas['bytes_memoria']} bytes")
+    assert estatisticas["bytes_memoria"] <= 60_000
+    assert 0 < estatisticas["itens_memoria"] < 5
+    assert estatisticas["remocoes_memoria"] == 5 - estatisticas["itens_memoria"]
+    
+    print("\n✅ Teste 19 passou!")
+
+
+def test_memoizado_iterativo():
+    """
+    Testa a memoização sem recursão, inclusive além do limite de recursão.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 20: Memoização Top-Down sem Recursão")
+    print("=" * 70)
+    
+    import random
+    import sys
+    gerador = random.Random(31)
+    
+    projetos = [("Projeto A", 12, 4), ("Projeto B", 10, 3),
+                ("Projeto C", 7, 2), ("Projeto D", 4, 3)]
+    assert memoized_iterativo_portfolio(projetos, 10) == \
+        dp_bottom_up_portfolio(projetos, 10)
+    assert memoized_iterativo_portfolio([], 10) == (0, [])
+    
+    # Bem acima do limite de recursão padrão (~1000)
+    n = 5 * sys.getrecursionlimit()
+    projetos = [(f"P{i}", gerador.randint(1, 50), gerador.randint(1, 15))
+                for i in range(n)]
+    valor, selecionados = memoized_iterativo_portfolio(projetos, 40)
+    esperado, _ = dp_bottom_up_portfolio(projetos, 40)
+    print(f"n={n}, C=40: valor={valor}, {len(selecionados)} projetos")
+    assert valor == esperado
+    assert sum(v for nome, v, c in projetos if nome in set(selecionados)) == valor
+    
+    print("\n✅ Teste 20 passou!")
+
+
+def test_dp_paralela():
+    """
+    Testa a DP paralela com vários números de workers, com e sem NumPy.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 21: DP Paralela com Memória Compartilhada")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(37)
+    projetos = [(f"P{i}", gerador.randint(1, 80), gerador.randint(0, 40))
+                for i in range(30)]
+    capacidade = 301
+    esperado = dp_bottom_up_portfolio(projetos, capacidade)
+    
+    numpy_original = portfolio_optimization.np
+    try:
+        for usar_numpy in (True, False):
+            if not usar_numpy:
+                portfolio_optimization.np = None
+            for workers in (1, 2, 3):
+                resultado = dp_paralela_portfolio(projetos, capacidade, workers=workers)
+                print(f"NumPy={usar_numpy}, workers={workers}: {resultado[0]}")
+                assert resultado == esperado, "DP paralela divergiu!"
+    finally:
+        portfolio_optimization.np = numpy_original
+    
+    valor, selecionados = dp_paralela_portfolio(projetos, capacidade, workers=2,
+                                                reconstruir=False)
+    assert valor == esperado[0] and selecionados == []
+    assert dp_paralela_portfolio([], 10, workers=2) == (0, [])
+    
+    print("\n✅ Teste 21 passou!")
+
+
+def _solver_que_derruba_o_worker(projetos, capacidade):
+    """
+    Solver de teste (de nível de módulo, para ser picklável): mata o
+    processo na capacidade 13, chama sys.exit na 17 e simula um Ctrl-C
+    na 19.
+    """
+    import os
+    import sys
+    if capacidade == 13:
+        os._exit(1)
+    if capacidade == 17:
+        sys.exit(3)
+    if capacidade == 19:
+        raise KeyboardInterrupt
+    return dp_bottom_up_portfolio(projetos, capacidade)
+
+
+def test_resolver_lote():
+    """
+    Testa o lote: ordem preservada, tempos e isolamento de erros.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 22: Lote de Portfólios Independentes")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(41)
+    instancias = []
+    for k in range(40):
+        projetos = [(f"C{k}P{i}", gerador.randint(1, 50), gerador.randint(1, 20))
+                    for i in range(gerador.randint(0, 12))]
+        instancias.append((projetos, gerador.randint(0, 60)))
+    # Uma instância inválida não pode derrubar o lote
+    instancias.insert(7, ([("Quebrado", 10, "dez")], 30))
+    
+    resultados = list(resolver_lote(instancias, solver="dp_bottom_up",
+                                    max_workers=2, preservar_ordem=True))
+    assert [r.indice for r in resultados] == list(range(len(instancias)))
+    
+    for item, (projetos, capacidade) in zip(resultados, instancias):
+        if item.indice == 7:
+            assert item.resultado is None and "TypeError" in item.erro
+            continue
+        assert item.erro is None
+        assert item.resultado == dp_bottom_up_portfolio(projetos, capacidade)
+        assert item.tempo >= 0
+    
+    # Sem preservar a ordem, todos os resultados chegam do mesmo jeito
+    desordenados = list(resolver_lote(instancias, max_workers=2))
+    assert sorted(r.indice for r in desordenados) == list(range(len(instancias)))
+    print(f"{len(resultados)} instâncias, 1 erro isolado: {resultados[7].erro}")
+    
+    # Um worker que morre quebra o pool; só a instância culpada recebe o erro
+    instancias = [([(f"P{i}", i + 1, i % 5 + 1) for i in range(8)], capacidade)
+                  for capacidade in [5, 9, 13, 20, 17, 13, 3, 11, 6, 25, 4, 8]]
+    resultados = list(resolver_lote(instancias, solver=_solver_que_derruba_o_worker,
+                                    max_workers=2, preservar_ordem=True))
+    assert [r.indice for r in resultados] == list(range(len(instancias)))
+    for item, (projetos, capacidade) in zip(resultados, instancias):
+        if capacidade == 13:
+            assert item.resultado is None and "BrokenProcessPool" in item.erro
+        elif capacidade == 17:
+            assert item.resultado is None and item.erro.startswith("SystemExit")
+        else:
+            assert item.erro is None
+            assert item.resultado == dp_bottom_up_portfolio(projetos, capacidade)
+    print("Worker morto: 2 instâncias culpadas isoladas, "
+          f"{sum(r.erro is None for r in resultados)} resolvidas")
+    
+    # Ctrl-C num worker interrompe o lote, não vira erro de uma instância
+    try:
+        list(resolver_lote([([("A", 1, 1)], 19)], solver=_solver_que_derruba_o_worker,
+                           max_workers=1))
+        assert False, "KeyboardInterrupt deveria interromper o lote!"
+    except KeyboardInterrupt:
+        pass
+    
+    # Argumentos inválidos falham na chamada, antes de iterar
+    for argumentos, erro in [({"solver": "inexistente"}, ValueError),
+                             ({"solver": 42}, TypeError),
+                             ({"max_workers": 0}, ValueError)]:
+        try:
+            resolver_lote(instancias, **argumentos)
+            assert False, f"Deveria falhar na chamada: {argumentos}"
+        except erro:
+            pass
+    
+    print("\n✅ Teste 22 passou!")
+
+
+def test_cli():
+    """
+    Testa a leitura em fluxo de CSV/JSONL, a validação e o JSON da CLI.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 23: Linha de Comando (CSV/JSONL)")
+    print("=" * 70)
+    
+    import io
+    import json
+    import os
+    import tempfile
+    from portfolio_cli import main
+    
+    csv_texto = "nome,valor,custo\nProjeto A,12,4\nProjeto B,10,3\nProjeto C,7,2\nProjeto D,4,3\n"
+    jsonl_texto = "".join(
+        json.dumps({"nome": n, "valor": v, "custo": c}) + "\n"
+        for n, v, c in [("Projeto A", 12, 4), ("Projeto B", 10, 3),
+                        ("Projeto C", 7, 2), ("Projeto D", 4, 3)]
+    )
+    
+    # Leitura preguiçosa: o gerador só lê o que for pedido
+    leitor = ler_projetos(io.StringIO(csv_texto), "csv")
+    assert next(leitor) == ("Projeto A", 12, 4)
+    assert list(ler_projetos(io.StringIO(jsonl_texto), "jsonl")) == \
+        list(ler_projetos(io.StringIO(csv_texto), "csv"))
+    
+    resultado = resolver_arquivo(io.StringIO(csv_texto), "csv", 10)
+    assert resultado["valor"] == 29
+    assert sorted(resultado["projetos_selecionados"]) == ["Projeto A", "Projeto B", "Projeto C"]
+    assert resultado["horas_utilizadas"] == 9
+    assert resultado["solver"] == "dp_bottom_up"
+    assert resultado["numero_projetos"] == 4 and resultado["tempo_segundos"] >= 0
+    assert resolver_arquivo(io.StringIO(jsonl_texto), "jsonl", 10, "greedy")["solver"] == "greedy"
+    # Custo zero no guloso: entra direto, sem dividir por zero
+    resultado = resolver_arquivo(io.StringIO(csv_texto + "Brinde,5,0\nVazio,0,0\n"), "csv", 10, "greedy")
+    assert resultado["projetos_selecionados"][0] == "Brinde"
+    assert "Vazio" not in resultado["projetos_selecionados"]
+    assert resultado["valor"] == resolver_arquivo(io.StringIO(csv_texto), "csv", 10, "greedy")["valor"] + 5
+    resultado = resolver_arquivo(io.StringIO(csv_texto), "csv", 10, alternativas=3)
+    assert [alt["valor"] for alt in resultado["alternativas"]] == [29, 26, 23]
+    resultado = resolver_arquivo(io.StringIO(csv_texto), "csv", 10, sensibilidade=True)
+    assert len(resultado["sensibilidade"]) == 4
+    assert set(resultado["criticos"]) <= set(resultado["projetos_selecionados"])
+    
+    # Erros de validação apontam a linha
+    for texto, formato, trecho in [
+        ("nome,valor,custo\nA,1,2\nB,x,2\n", "csv", "linha 3"),
+        ("nome,valor,custo\nA,1,-2\n", "csv", "custo negativo"),
+        ("nome,valor\nA,1\n", "csv", "custo"),
+        ('{"nome": "A", "valor": 1}\n', "jsonl", "campo ausente"),
+        ('{"nome": "A", "valor": 1, "custo": 1}\n{quebrado\n', "jsonl", "linha 2"),
+        ("nome,valor,custo\nA,12,4.5\n", "csv", "custo não inteiro"),
+        ("nome,valor,custo\nA,1,1\nB,nan,1\n", "csv", "linha 3: valor não finito"),
+        ("nome,valor,custo\nA,-inf,1\n", "csv", "valor não finito"),
+        ('{"nome": "A", "valor": NaN, "custo": 1}\n', "jsonl", "valor não finito"),
+        ('{"nome": "A", "valor": 1, "custo": Infinity}\n', "jsonl", "custo não finito"),
+    ]:
+        try:
+            list(ler_projetos(io.StringIO(texto), formato))
+            assert False, "Deveria ter lançado ValueError"
+        except ValueError as e:
+            assert trecho in str(e), str(e)
+    
+    # Ponta a ponta: arquivo de entrada e de saída
+    with tempfile.TemporaryDirectory() as pasta:
+        entrada = os.path.join(pasta, "projetos.jsonl")
+        saida = os.path.join(pasta, "resultado.json")
+        with open(entrada, "w", encoding="utf-8") as f:
+            f.write(jsonl_texto)
+        assert main([entrada, "--capacidade", "10", "--solver", "core", "--saida", saida]) == 0
+        with open(saida, encoding="utf-8") as f:
+            dados = json.load(f)
+        assert dados["valor"] == 29 and dados["solver"] == "core"
+        assert main([os.path.join(pasta, "faltando.csv"), "--capacidade", "10"]) == 1
+        # Custo fracionário e capacidade negativa: erro na CLI, sem traceback
+        assert main([entrada, "--capacidade", "-1"]) == 1
+        with open(entrada, "w", encoding="utf-8") as f:
+            f.write('{"nome": "A", "valor": 12, "custo": 4.5}\n')
+        assert main([entrada, "--capacidade", "10"]) == 1
+    # Custo 4.0 é o inteiro 4; valores fracionários continuam aceitos
+    assert list(ler_projetos(io.StringIO("nome,valor,custo\nA,12.5,4.0\n"), "csv")) == [("A", 12.5, 4)]
+    print(f"Resultado: {resultado}")
+    
+    print("\n✅ Teste 23 passou!")
+
+
+def test_suite_benchmarks():
+    """
+    Testa as famílias de instâncias e a comparação de resultados da suíte.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 24: Suíte de Benchmarks")
+    print("=" * 70)
+    
+    import copy
+    from benchmarks import FAMILIAS, gerar_familia, executar_suite, comparar_resultados
+    
+    for familia in FAMILIAS:
+        projetos, capacidade = gerar_familia(familia, 30, custo_max=100)
+        assert len(projetos) == 30
+        assert capacidade == sum(c for _, _, c in projetos) // 2
+        assert all(v > 0 and c > 0 for _, v, c in projetos)
+        # Reprodutível
+        assert gerar_familia(familia, 30, custo_max=100) == (projetos, capacidade)
+    
+    projetos, _ = gerar_familia("soma_de_subconjuntos", 10, custo_max=50)
+    assert all(v == c for _, v, c in projetos)
+    projetos, _ = gerar_familia("fortemente_correlacionadas", 10, custo_max=50)
+    assert all(v == c + 5 for _, v, c in projetos)
+    
+    dados = executar_suite(["nao_correlacionadas", "spanner"], [12], custo_max=50,
+                           solvers=["dp_bottom_up", "core", "meet_in_the_middle"],
+                           aquecimento=0, repeticoes=1)
+    assert len(dados["resultados"]) == 6
+    for linha in dados["resultados"]:
+        assert linha["tempo_min"] >= 0 and linha["memoria_pico_bytes"] > 0
+    
+    assert comparar_resultados(dados, dados) == []
+    pior = copy.deepcopy(dados)
+    pior["resultados"][0]["tempo_min"] = dados["resultados"][0]["tempo_min"] * 3 + 1
+    pior["resultados"][1]["valor"] += 1
+    regressoes = comparar_resultados(dados, pior, tolerancia=0.5)
+    assert len(regressoes) == 2 and any("valor" in r for r in regressoes)
+    
+    print("\n✅ Teste 24 passou!")
+
+
+def test_instrumentacao():
+    """
+    Testa contadores, tempos por fase, progresso e pico de memória.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 25: Instrumentação dos Solvers")
+    print("=" * 70)
+    
+    import random
+    gerador = random.Random(19)
+    projetos = [(f"P{i}", gerador.randint(-5, 60), gerador.randint(0, 25))
+                for i in range(40)]
+    capacidade = 150
+    
+    # Todo solver aceita a instrumentação e devolve o mesmo resultado
+    for nome, solver in SOLVERS.items():
+        if nome == "bitset":
+            continue  # Exige valor proporcional ao custo (ver TESTE 27)
+        resultado, estatisticas = instrumentar(nome, projetos, capacidade)
+        assert resultado == solver(projetos, capacidade), nome
+        assert isinstance(estatisticas, Instrumentacao)
+        # auto reduz a instância antes; aqui a redução já resolve quase tudo
+        assert "celulas" in estatisticas and estatisticas["tempo_total"] >= 0, nome
+        if nome != "auto":
+            assert estatisticas["celulas"] > 0, nome
+    
+    # Tabela: células, bytes e as três fases
+    _, estatisticas = instrumentar("dp_bottom_up", projetos, capacidade)
+    assert estatisticas["celulas"] == len(projetos) * (capacidade + 1)
+    assert estatisticas["bytes_tabela"] > 0
+    assert set(estatisticas["tempos"]) == {"preprocessamento", "preenchimento", "reconstrucao"}
+    
+    # Memoização: cada estado guardado foi uma falha; o resto são acertos
+    valor, estatisticas = instrumentar(memoized_portfolio, projetos, capacidade)
+    assert valor == memoized_portfolio(projetos, capacidade)
+    assert estatisticas["acertos_memo"] > 0
+    assert estatisticas["falhas_memo"] >= estatisticas["celulas"]
+    assert estatisticas["profundidade_maxima"] == len(projetos) + 1
+    
+    _, estatisticas = instrumentar("memoizado_iterativo", projetos, capacidade)
+    assert estatisticas["acertos_memo"] > 0 and estatisticas["profundidade_maxima"] > 1
+    
+    # Progresso a cada 15 linhas, sempre incluindo a última
+    chamadas = []
+    for modo in ("tabela", "bits"):
+        chamadas.clear()
+        instrumentar("dp_bottom_up", projetos, capacidade, modo=modo, a_cada=15,
+                     progresso=lambda feitas, total, est: chamadas.append((feitas, total)))
+        assert chamadas == [(15, 40), (30, 40), (40, 40)], chamadas
+    
+    # Pico de memória via tracemalloc
+    _, estatisticas = instrumentar("dp_bottom_up", projetos, capacidade, memoria=True)
+    assert estatisticas["memoria_pico_bytes"] >= estatisticas["bytes_tabela"]
+    
+    # Também funciona passando direto no parâmetro estatisticas
+    estatisticas = Instrumentacao()
+    dp_hirschberg_portfolio(projetos, capacidade, estatisticas=estatisticas)
+    assert estatisticas["profundidade_maxima"] >= 1
+    print(f"Hirschberg: {dict(estatisticas)}")
+    
+    print("\n✅ Teste 25 passou!")
+
+
+def test_reducao():
+    """
+    Testa o pré-processamento: cada regra isolada e o ótimo preservado.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 26: Redução da Instância")
+    print("=" * 70)
+    
+    # Filtros simples, custo zero e MDC dos custos
+    projetos = [("Caro", 50, 200), ("Inútil", 0, 10), ("Grátis", 5, 0),
+                ("A", 40, 30), ("B", 30, 20), ("C", 35, 40), ("D", 10, 60)]
+    reducao = reduzir_instancia(projetos, 100)
+    relatorio = reducao.relatorio
+    assert relatorio["removidos_custo"] >= 1 and relatorio["removidos_valor"] == 1
+    assert 2 in reducao.fixados
+    assert all(isinstance(nome, int) for nome, _, _ in reducao.projetos)
+    print(f"Relatório: {relatorio}")
+    
+    # Dominância: "Pior" custa mais e vale menos que três projetos que
+    # juntos já lotam a capacidade, então nunca é necessário
+    projetos = [("X", 10, 4), ("Y", 10, 4), ("Z", 10, 4), ("Pior", 9, 5), ("W", 1, 1)]
+    reducao = reduzir_instancia(projetos, 12)
+    assert reducao.relatorio["removidos_dominancia"] >= 1
+    assert 3 not in reducao.fixados
+    assert 3 not in [nome for nome, _, _ in reducao.projetos]
+    
+    # MDC: custos múltiplos de 10 são divididos por 10 (C = 75 vira 7)
+    projetos = [("P", 31, 30), ("Q", 41, 40), ("R", 21, 20), ("S", 51, 50)]
+    reducao = reduzir_instancia(projetos, 75)
+    assert reducao.divisor == 10 and reducao.capacidade == 7
+    assert reducao.projetos == [(0, 31, 3), (1, 41, 4), (2, 21, 2), (3, 51, 5)]
+    assert reduzido_portfolio(projetos, 75, "dp_bottom_up") == \
+        dp_bottom_up_portfolio(projetos, 75)
+    
+    # Ótimo preservado para todos os solvers, em instâncias aleatórias
+    import random
+    gerador = random.Random(20)
+    for _ in range(300):
+        n = gerador.randint(0, 12)
+        fator = gerador.choice([1, 1, 3])
+        projetos = [(f"P{i}", gerador.randint(-3, 40), gerador.randint(0, 15) * fator)
+                    for i in range(n)]
+        capacidade = gerador.randint(0, 60 * fator)
+        esperado = dp_bottom_up_portfolio(projetos, capacidade)[0]
+        for solver in ("dp_bottom_up", "branch_and_bound", "pareto"):
+            valor, selecionados = reduzido_portfolio(projetos, capacidade, solver)
+            escolhidos = [p for p in projetos if p[0] in selecionados]
+            assert valor == esperado, solver
+            assert sum(c for _, _, c in escolhidos) <= capacidade
+        assert auto_portfolio(projetos, capacidade)[0] == esperado
+    
+    # Em instâncias não correlacionadas a tabela encolhe muito
+    projetos = [(f"N{i}", gerador.randint(1, 1000), gerador.randint(1, 1000))
+                for i in range(500)]
+    estatisticas = {}
+    valor, _ = auto_portfolio(projetos, 100_000, estatisticas=estatisticas)
+    assert valor == auto_portfolio(projetos, 100_000, reduzir=False)[0]
+    print(f"n: {estatisticas['n_original']} -> {estatisticas['n_reduzido']}, "
+          f"C: {estatisticas['capacidade_original']} -> {estatisticas['capacidade_reduzida']}, "
+          f"células: -{estatisticas['reducao_celulas']:.1%}")
+    assert estatisticas["reducao_celulas"] > 0.5
+    
+    print("\n✅ Teste 26 passou!")
+
+
+def test_bitset():
+    """
+    Testa o bitset para valor proporcional ao custo e a escolha automática.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 27: Bitset (Soma de Subconjuntos)")
+    print("=" * 70)
+    
+    # Encher a bancada: valor == custo
+    projetos = [("A", 8, 8), ("B", 6, 6), ("C", 5, 5), ("D", 3, 3)]
+    valor, selecionados = bitset_portfolio(projetos, 12)
+    print(f"C=12: {valor} {selecionados}")
+    assert valor == 11 and sorted(selecionados) in (["A", "D"], ["B", "C"])
+    
+    import random
+    gerador = random.Random(21)
+    for _ in range(200):
+        n = gerador.randint(0, 25)
+        fator = gerador.choice([1, 2, 7])
+        custos = [gerador.randint(0, 40) for _ in range(n)]
+        projetos = [(f"P{i}", c * fator, c) for i, c in enumerate(custos)]
+        capacidade = gerador.randint(0, 300)
+        esperado = dp_bottom_up_portfolio(projetos, capacidade)[0]
+        valor, selecionados = bitset_portfolio(projetos, capacidade)
+        escolhidos = [p for p in projetos if p[0] in selecionados]
+        assert valor == esperado
+        assert sum(v for _, v, _ in escolhidos) == valor
+        assert sum(c for _, _, c in escolhidos) <= capacidade
+    
+    # Valor não proporcional ao custo é recusado
+    try:
+        bitset_portfolio([("X", 10, 5), ("Y", 7, 7)], 10)
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError:
+        pass
+    
+    # Escolha automática (inclusive depois da redução por MDC)
+    projetos = [(f"H{i}", c, c) for i, c in enumerate(gerador.randint(1, 5000)
+                                                      for _ in range(200))]
+    capacidade = sum(c for _, _, c in projetos) // 3
+    estatisticas = {}
+    valor, _ = auto_portfolio(projetos, capacidade, estatisticas=estatisticas)
+    assert estatisticas["solver"] == "bitset"
+    assert valor == bitset_portfolio(projetos, capacidade)[0]
+    dobrados = [(nome, v, 2 * c) for nome, v, c in projetos]
+    estatisticas = {}
+    auto_portfolio(dobrados, 2 * capacidade, estatisticas=estatisticas)
+    assert estatisticas["solver"] == "bitset"
+    print(f"n=200, C={capacidade}: {valor} horas")
+    
+    _, estatisticas = instrumentar("bitset", projetos, capacidade)
+    assert estatisticas["celulas"] == 200 * (capacidade + 1)
+    
+    print("\n✅ Teste 27 passou!")
+
+
+def _portfolios_viaveis(projetos, capacidade):
+    """
+    Força bruta: todas as seleções que cabem, para conferir os solvers.
+    
+    O custo de cada projeto e a capacidade podem ser números (um recurso)
+    ou tuplas (um custo por recurso). Devolve (valor, mascara, indices)
+    de cada seleção viável, com o bit i da máscara ligado se o projeto i
+    foi escolhido.
+    """
+    def recursos(custo):
+        return custo if isinstance(custo, tuple) else (custo,)
+    
+    capacidades = recursos(capacidade)
+    viaveis = []
+    for mascara in range(1 << len(projetos)):
+        indices = [i for i in range(len(projetos)) if mascara >> i & 1]
+        usados = [sum(recursos(projetos[i][2])[r] for i in indices)
+                  for r in range(len(capacidades))]
+        if all(u <= c for u, c in zip(usados, capacidades)):
+            viaveis.append((sum(projetos[i][1] for i in indices), mascara, indices))
+    return viaveis
+
+
+def test_sensibilidade():
+    """
+    Testa o relatório de sensibilidade contra a força bruta.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 28: Análise de Sensibilidade")
+    print("=" * 70)
+    
+    # Exemplo do enunciado: ótimo 29 com os projetos A, B e C
+    projetos = [
+        ("Projeto A", 12, 4),
+        ("Projeto B", 10, 3),
+        ("Projeto C", 7, 2),
+        ("Projeto D", 4, 3),
+    ]
+    otimo, tabela, criticos = sensibilidade_portfolio(projetos, 10)
+    for linha in tabela:
+        print(f"{linha.nome}: sem={linha.otimo_sem} (-{linha.perda_sem}), "
+              f"com={linha.otimo_com} (-{linha.perda_com})")
+    assert otimo == dp_bottom_up_portfolio(projetos, 10)[0]
+    assert [linha.nome for linha in tabela] == [nome for nome, _, _ in projetos]
+    assert criticos == [linha.nome for linha in sorted(tabela, key=lambda l: -l.perda_sem)
+                        if linha.perda_sem > 0]
+    
+    import random
+    gerador = random.Random(22)
+    for _ in range(150):
+        n = gerador.randint(0, 10)
+        projetos = [(f"P{i}", gerador.randint(0, 30), gerador.randint(0, 15))
+                    for i in range(n)]
+        capacidade = gerador.randint(0, 50)
+        viaveis = _portfolios_viaveis(projetos, capacidade)
+        for backend in ("python", "numpy"):
+            otimo, tabela, criticos = sensibilidade_portfolio(projetos, capacidade, backend)
+            assert otimo == max(valor for valor, _, _ in viaveis)
+            for i, linha in enumerate(tabela):
+                sem = max(valor for valor, mascara, _ in viaveis if not mascara >> i & 1)
+                com = [valor for valor, mascara, _ in viaveis if mascara >> i & 1]
+                assert linha.otimo_sem == sem and linha.perda_sem == otimo - sem
+                if not com:
+                    assert linha.otimo_com is None and linha.perda_com is None
+                else:
+                    assert linha.otimo_com == max(com)
+                    assert linha.perda_com == otimo - max(com) >= 0
+            # Crítico = está em todo ótimo
+            for nome in criticos:
+                i = int(nome[1:])
+                assert all(mascara >> i & 1 for valor, mascara, _ in viaveis if valor == otimo)
+    
+    try:
+        sensibilidade_portfolio([("A", 1, 1)], -1)
+        assert False, "Capacidade negativa deveria falhar!"
+    except ValueError:
+        pass
+    
+    print("\n✅ Teste 28 passou!")
+
+
+def test_k_melhores():
+    """
+    Testa os k melhores portfólios contra a enumeração completa.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 29: K Melhores Portfólios")
+    print("=" * 70)
+    
+    projetos = [
+        ("Projeto A", 12, 4),
+        ("Projeto B", 10, 3),
+        ("Projeto C", 7, 2),
+        ("Projeto D", 4, 3),
+    ]
+    alternativas = k_melhores_portfolio(projetos, 10, k=5)
+    for valor, selecionados in alternativas:
+        print(f"{valor}: {selecionados}")
+    assert alternativas[0][0] == dp_bottom_up_portfolio(projetos, 10)[0]
+    assert [valor for valor, _ in alternativas] == [29, 26, 23, 22, 21]
+    
+    # Inclusive a ordem dos empates: entre valores iguais, vem antes quem
+    # não tem o maior índice em que diferem (menor máscara)
+    import random
+    gerador = random.Random(23)
+    for _ in range(200):
+        n = gerador.randint(0, 8)
+        projetos = [(f"P{i}", gerador.randint(0, 4), gerador.randint(0, 4)) for i in range(n)]
+        capacidade = gerador.randint(0, 12)
+        k = gerador.randint(1, 40)
+        viaveis = sorted(_portfolios_viaveis(projetos, capacidade),
+                         key=lambda v: (-v[0], v[1]))
+        esperado = [(valor, [projetos[i][0] for i in indices])
+                    for valor, _, indices in viaveis[:k]]
+        assert k_melhores_portfolio(projetos, capacidade, k) == esperado
+    
+    # Menos seleções viáveis do que k
+    assert k_melhores_portfolio([("A", 5, 3)], 2, k=10) == [(0, [])]
+    
+    estatisticas = {}
+    k_melhores_portfolio(projetos, 10, k=3, estatisticas=estatisticas)
+    assert estatisticas["celulas"] >= 0
+    
+    for argumentos in [(projetos, 10, 0), (projetos, -1, 3)]:
+        try:
+            k_melhores_portfolio(*argumentos)
+            assert False, f"Argumentos inválidos deveriam falhar: {argumentos[1:]}"
+        except ValueError:
+            pass
+    
+    print("\n✅ Teste 29 passou!")
+
+
+def test_multidimensional():
+    """
+    Testa vários recursos (horas, orçamento, pessoas) contra a força bruta.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 30: Múltiplos Recursos")
+    print("=" * 70)
+    
+    # (horas, orçamento em mil, pessoas sênior)
+    projetos = [
+        ("Projeto A", 12, (4, 50, 2)),
+        ("Projeto B", 10, (3, 20, 1)),
+        ("Projeto C", 7, (2, 40, 1)),
+        ("Projeto D", 4, (3, 10, 0)),
+    ]
+    capacidades = (10, 80, 3)
+    valor, selecionados = multidimensional_portfolio(projetos, capacidades)
+    guloso, _, recursos = greedy_multidimensional_portfolio(projetos, capacidades)
+    print(f"Ótimo: {valor} {selecionados} | Guloso: {guloso} usando {recursos}")
+    assert valor == 26 and selecionados == ["Projeto A", "Projeto B", "Projeto D"]
+    assert guloso <= valor
+    assert all(u <= c for u, c in zip(recursos, capacidades))
+    
+    # Com um único recurso, coincide com a mochila 0/1
+    simples = [(nome, v, custos[0]) for nome, v, custos in projetos]
+    assert multidimensional_portfolio(
+        [(nome, v, (c,)) for nome, v, c in simples], (10,))[0] == \
+        dp_bottom_up_portfolio(simples, 10)[0]
+    
+    # De 1 a 4 recursos
+    import random
+    gerador = random.Random(24)
+    for _ in range(300):
+        d = gerador.randint(1, 4)
+        n = gerador.randint(0, 9)
+        projetos = [(f"P{i}", gerador.randint(-3, 30),
+                     tuple(gerador.randint(0, 10) for _ in range(d))) for i in range(n)]
+        capacidades = tuple(gerador.choice([0, gerador.randint(0, 40)]) for _ in range(d))
+        melhor = max(valor for valor, _, _ in _portfolios_viaveis(projetos, capacidades))
+        valor, selecionados = multidimensional_portfolio(projetos, capacidades)
+        escolhidos = [p for p in projetos if p[0] in selecionados]
+        assert valor == melhor == sum(p[1] for p in escolhidos)
+        assert all(sum(p[2][r] for p in escolhidos) <= capacidades[r] for r in range(d))
+        assert greedy_multidimensional_portfolio(projetos, capacidades)[0] <= valor
+    
+    estatisticas = {}
+    multidimensional_portfolio(projetos, capacidades, estatisticas)
+    assert estatisticas["limite_superior"] >= valor
+    assert {"celulas", "estados_maximo", "podados_dominancia", "podados_limite"} <= set(estatisticas)
+    
+    for projetos, capacidades in [
+        ([("A", 1, (1, 2))], (5,)),
+        ([("A", 1, (1,))], (-1,)),
+        ([("A", 1, (-1,))], (5,)),
+    ]:
+        try:
+            multidimensional_portfolio(projetos, capacidades)
+            assert False, f"Entrada inválida deveria falhar: {projetos} {capacidades}"
+        except ValueError:
+            pass
+    
+    print("\n✅ Teste 30 passou!")
+
+
+def test_multiplicidade():
+    """
+    Testa projetos repetíveis contra a expansão em cópias idênticas.
+    """
+    print("\n" + "=" * 70)
+    print("TESTE 31: Projetos com Multiplicidade")
+    print("=" * 70)
+    
+    # (nome, valor, custo, quantidade máxima)
+    projetos = [
+        ("Pacote A", 12, 4, 1),
+        ("Pacote B", 10, 3, 2),
+        ("Pacote C", 7, 2, None),
+        ("Pacote D", 4, 3, 5),
+    ]
+    valor, quantidades = multiplicidade_portfolio(projetos, 10)
+    print(f"C=10: {valor} {quantidades}")
+    assert valor == 35 and quantidades == [("Pacote C", 5)]
+    
+    # Poucas cópias: a força bruta confere também a expansão usada abaixo
+    copias = [(nome, v, c) for nome, v, c, q in projetos for _ in range(q or 10 // c)]
+    assert max(v for v, _, _ in _portfolios_viaveis(copias[:12], 10)) == \
+        dp_bottom_up_portfolio(copias[:12], 10)[0]
+    
+    import random
+    gerador = random.Random(25)
+    for _ in range(150):
+        n = gerador.randint(0, 6)
+        capacidade = gerador.randint(0, 40)
+        projetos = [(f"P{i}", gerador.randint(-2, 20), gerador.randint(0, 9),
+                     gerador.choice([None, 0, 1, 3, 7])) for i in range(n)]
+        projetos = [(nome, v, c, 2 if c == 0 and q is None else q) for nome, v, c, q in projetos]
+        copias = [(nome, v, c) for nome, v, c, q in projetos
+                  for _ in range(q if q is not None else capacidade // max(c, 1))]
+        esperado = dp_bottom_up_portfolio(copias, capacidade)[0]
+        for backend in ("python", "numpy"):
+            valor, quantidades = multiplicidade_portfolio(projetos, capacidade, backend, "bits")
+            assert valor == esperado
+            escolhidas = dict(quantidades)
+            assert sum(c * escolhidas.get(nome, 0) for nome, _, c, _ in projetos) <= capacidade
+            assert all(q is None or escolhidas.get(nome, 0) <= q for nome, _, _, q in projetos)
+    
+    # Divisão binária: poucos pedaços no lugar de muitas cópias
+    estatisticas = {}
+    multiplicidade_portfolio([("X", 3, 1, None)], 1000, estatisticas=estatisticas)
+    assert estatisticas["pedacos"] == 10
+    
+    for projetos in [[("A", 1, 1, -1)], [("A", 5, 0, None)]]:
+        try:
+            multiplicidade_portfolio(projetos, 10)
+            assert False, f"Entrada inválida deveria falhar: {projetos}"
+        except ValueError:
+            pass
+    
+    print("\n✅ Teste 31 passou!")
+
+
 def demonstrar_performance():
     """
     Demonstra a diferença de performance entre as abordagens.
@@ -216,6 +1575,7 @@ def demonstrar_performance():
     
     import time
     
+    # Para medir escalabilidade use: python benchmarks.py suite
     # Cria um caso de teste moderado
     projetos = [
         (f"P{i}", i*10 + 5, i*2 + 1) 
@@ -227,22 +1587,22 @@ def demonstrar_performance():
     print("⚠️  Recursiva pura será lenta!\n")
     
     # Memoização
-    start = time.time()
+    start = time.perf_counter()
     resultado_memo = memoized_portfolio(projetos, capacidade)
-    tempo_memo = time.time() - start
+    tempo_memo = time.perf_counter() - start
     print(f"Memoização: {resultado_memo} (tempo: {tempo_memo:.6f}s)")
     
     # DP Bottom-Up
-    start = time.time()
+    start = time.perf_counter()
     resultado_dp, _ = dp_bottom_up_portfolio(projetos, capacidade)
-    tempo_dp = time.time() - start
+    tempo_dp = time.perf_counter() - start
     print(f"DP Bottom-Up: {resultado_dp} (tempo: {tempo_dp:.6f}s)")
     
     # Recursiva (CUIDADO!)
     print("\n⚠️  Executando recursiva pura (pode demorar)...")
-    start = time.time()
+    start = time.perf_counter()
     resultado_rec = recursive_portfolio(projetos, capacidade)
-    tempo_rec = time.time() - start
+    tempo_rec = time.perf_counter() - start
     print(f"Recursiva Pura: {resultado_rec} (tempo: {tempo_rec:.6f}s)")
     
     print(f"\n📊 Speedup:")
@@ -313,6 +1673,31 @@ def executar_todos_os_testes():
         test_capacidade_zero()
         test_um_projeto()
         test_todos_projetos_mesma_razao()
+        test_hirschberg_igual_bottom_up()
+        test_backend_numpy()
+        test_modo_bits()
+        test_branch_and_bound()
+        test_dp_por_valor_e_auto()
+        test_fptas()
+        test_pareto()
+        test_meet_in_the_middle()
+        test_core()
+        test_portfolio_resolvido()
+        test_portfolio_incremental()
+        test_alterar_capacidade()
+        test_cache()
+        test_memoizado_iterativo()
+        test_dp_paralela()
+        test_resolver_lote()
+        test_cli()
+        test_suite_benchmarks()
+        test_instrumentacao()
+        test_reducao()
+        test_bitset()
+        test_sensibilidade()
+        test_k_melhores()
+        test_multidimensional()
+        test_multiplicidade()
         exemplo_uso_individual()
         
         print("\n" + "=" * 70)